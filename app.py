@@ -1,14 +1,13 @@
-import json
-from time import perf_counter
-
 import dash
 import dash_bootstrap_components as dbc
-from dash import html, Input, Output, State
+from dash import dcc, html, Input, Output, State
+from flask import jsonify
 
 import bridge.callbacks  # noqa
-from bridge.arc import arc_core, arc_tree
-from bridge.arc.arc_api import ArcApiClient
-from bridge.arc.arc_lists import ArcList
+from bridge.arc.arc_api import ArcApiClientError
+from bridge.arc.arc_bootstrap import ARC_BOOTSTRAP_WAIT_SECONDS, ArcBootstrap
+from bridge.arc.arc_rate_limit import get_rate_limit_stats
+from bridge.callbacks.warmup import ARC_WARMUP_ENABLED, ArcWarmup
 from bridge.layout.app_layout import MainContent
 from bridge.layout.index import Index
 from bridge.layout.navbar import NavBar
@@ -40,77 +39,57 @@ server = app.server
 
 logger.info("Starting BRIDGE application")
 
-# Track total ARC/bootstrap load time so startup latency is explicit in logs.
-arc_bootstrap_start = perf_counter()
+# Load the initial ARC data in the background, so that the worker can start
+# serving the home page straight away rather than waiting on GitHub
+ARC_BOOTSTRAP = ArcBootstrap()
+ARC_BOOTSTRAP.start()
 
-# Get initial data from ARC
-ARC_VERSION_LIST, ARC_VERSION_LATEST = arc_core.get_arc_versions()
-ARC_LANGUAGE_LIST = ArcApiClient().get_arc_language_list_version(ARC_VERSION_LATEST)
-ARC_LANGUAGE_DEFAULT = "English"
+# Optionally warm up the caches for every other version and language in the
+# background, once the initial ARC data is ready, so the first users to select
+# them don't wait for a cold build
+ARC_WARMUP = ArcWarmup(ready=ARC_BOOTSTRAP.ready)
+if ARC_WARMUP_ENABLED:
+    ARC_WARMUP.start()
 
-DF_ARC, PRESETS, _COMMIT = arc_core.get_arc(ARC_VERSION_LATEST)
-DF_ARC = arc_core.add_required_datadicc_columns(DF_ARC)
 
-DYNAMIC_UNITS_CONVERSION = arc_core.get_dynamic_units_conversion_bool(
-    ARC_VERSION_LATEST
-)
+@server.route("/status/warmup")
+def warmup_status():
+    return jsonify({"enabled": ARC_WARMUP_ENABLED, **ARC_WARMUP.get_progress()})
 
-TREE_ITEMS_DATA = arc_tree.get_tree_items(
-    DF_ARC, ARC_VERSION_LATEST, DYNAMIC_UNITS_CONVERSION
-)
 
-# List content Transformation
-DF_LISTS, LIST_VARIABLE_LIST = ArcList(
-    ARC_VERSION_LATEST, ARC_LANGUAGE_DEFAULT
-).get_list_content(DF_ARC)
-DF_ARC = arc_core.add_transformed_rows(
-    DF_ARC, DF_LISTS, arc_core.get_variable_order(DF_ARC)
-)
+@server.route("/status/rate-limit")
+def rate_limit_status():
+    return jsonify(get_rate_limit_stats())
 
-# User List content Transformation
-DF_ULIST, ULIST_VARIABLE_LIST = ArcList(
-    ARC_VERSION_LATEST, ARC_LANGUAGE_DEFAULT
-).get_user_list_content(DF_ARC)
-DF_ARC = arc_core.add_transformed_rows(
-    DF_ARC, DF_ULIST, arc_core.get_variable_order(DF_ARC)
-)
 
-# Multi List content Transformation
-DF_MULTILIST, MULTILIST_VARIABLE_LIST = ArcList(
-    ARC_VERSION_LATEST, ARC_LANGUAGE_DEFAULT
-).get_multi_list_content(DF_ARC)
-DF_ARC = arc_core.add_transformed_rows(
-    DF_ARC, DF_MULTILIST, arc_core.get_variable_order(DF_ARC)
-)
+@server.route("/status/ready")
+def ready_status():
+    return jsonify(ARC_BOOTSTRAP.get_status()), 200 if ARC_BOOTSTRAP.is_ready() else 503
 
-ARC_JSON = DF_ARC.to_json(date_format="iso", orient="split")
-ULIST_VARIABLE_JSON = json.dumps(ULIST_VARIABLE_LIST)
-MULTILIST_VARIABLE_JSON = json.dumps(MULTILIST_VARIABLE_LIST)
 
-# Grouping presets by the first column
-GROUPED_PRESETS = {}
-for key, value in PRESETS:
-    GROUPED_PRESETS.setdefault(key, []).append(value)
-GROUPED_PRESETS_JSON = json.dumps(GROUPED_PRESETS)
+# The ARC data stores are filled when the main page is displayed, if the ARC
+# data wasn't yet ready when the layout was served
+ARC_DATA_STORES = [
+    ("current_datadicc-store", "arc_json"),
+    ("ulist_variable_choices-store", "ulist_variable_json"),
+    ("multilist_variable_choices-store", "multilist_variable_json"),
+    ("grouped_presets-store", "grouped_presets_json"),
+    ("language-list-store", "language_list"),
+    ("arc-crf-metadata", "arc_crf_metadata_json"),
+]
 
-ARC_CRF_METADATA = ArcApiClient().get_dataframe_crf_metadata(ARC_VERSION_LATEST)
-ARC_CRF_METADATA_JSON = ARC_CRF_METADATA.to_json(date_format="iso", orient="split")
 
-logger.info(
-    "ARC bootstrap complete version=%s language=%s total_elapsed_ms=%.3f",
-    ARC_VERSION_LATEST,
-    ARC_LANGUAGE_DEFAULT,
-    (perf_counter() - arc_bootstrap_start) * 1000,
-)
+def serve_layout():
+    if not ARC_BOOTSTRAP.is_ready():
+        return MainContent(None).define_app_layout(None, None, None, None, None, None)
+
+    arc_bootstrap_data = ARC_BOOTSTRAP.get()
+    return MainContent(arc_bootstrap_data["tree_items_data"]).define_app_layout(
+        *[arc_bootstrap_data[key] for _, key in ARC_DATA_STORES]
+    )
 
-app.layout = MainContent(TREE_ITEMS_DATA).define_app_layout(
-    ARC_JSON,
-    ULIST_VARIABLE_JSON,
-    MULTILIST_VARIABLE_JSON,
-    GROUPED_PRESETS_JSON,
-    ARC_LANGUAGE_LIST,
-    ARC_CRF_METADATA_JSON,
-)
+
+app.layout = serve_layout
 
 app.clientside_callback(
     """
@@ -148,12 +127,32 @@ app.clientside_callback(
 )
 
 
-@app.callback(Output("page-content", "children"), Input("url", "pathname"))
-def display_page(pathname):
+@app.callback(
+    Output("page-content", "children"),
+    *[
+        Output(store_id, "data", allow_duplicate=True)
+        for store_id, _ in ARC_DATA_STORES
+    ],
+    Input("url", "pathname"),
+    State("current_datadicc-store", "data"),
+    prevent_initial_call="initial_duplicate",
+)
+def display_page(pathname, current_datadicc):
+    no_store_updates = [dash.no_update for _ in ARC_DATA_STORES]
     if pathname == "/":
-        return Index().home_page()
-    else:
-        return main_app()
+        return Index().home_page(), *no_store_updates
+
+    # Only the main page needs the ARC data, so wait for it here, for a while
+    try:
+        arc_bootstrap_data = ARC_BOOTSTRAP.get(timeout=ARC_BOOTSTRAP_WAIT_SECONDS)
+    except ArcApiClientError as e:
+        logger.warning(f"ARC data not ready for the main page: {e}")
+        return loading_app(), *no_store_updates
+    if current_datadicc is not None:
+        return main_app(arc_bootstrap_data), *no_store_updates
+    return main_app(arc_bootstrap_data), *[
+        arc_bootstrap_data[key] for _, key in ARC_DATA_STORES
+    ]
 
 
 @app.callback(Output("url", "pathname"), Input("start-button", "n_clicks"))
@@ -164,23 +163,49 @@ def start_app(n_clicks):
         return "/main"
 
 
-def main_app():
+def main_app(arc_bootstrap_data):
     return html.Div(
         [
             NavBar().navbar,
             SideBar().sidebar,
             Settings(
-                ARC_VERSION_LIST,
-                ARC_LANGUAGE_LIST,
-                ARC_VERSION_LATEST,
-                ARC_LANGUAGE_DEFAULT,
-                DYNAMIC_UNITS_CONVERSION,
+                arc_bootstrap_data["version_list"],
+                arc_bootstrap_data["language_list"],
+                arc_bootstrap_data["version_latest"],
+                arc_bootstrap_data["language_default"],
+                arc_bootstrap_data["dynamic_units_conversion"],
             ).settings_column,
             SideBar().preset_column,
-            MainContent(TREE_ITEMS_DATA).main_content,
+            MainContent(arc_bootstrap_data["tree_items_data"]).main_content,
         ]
     )
 
 
+def loading_app():
+    # Reloads the page until the ARC data is ready
+    return html.Div(
+        [
+            html.H4("BRIDGE is still loading the ARC data, please wait..."),
+            dcc.Interval(id="arc-loading-interval", interval=5000, max_intervals=1),
+        ],
+        style={"padding": "20px"},
+    )
+
+
+app.clientside_callback(
+    """
+    function(n_intervals) {
+        if (n_intervals) {
+            window.location.reload();
+        }
+        return window.dash_clientside.no_update;
+    }
+    """,
+    Output("arc-loading-interval", "disabled"),
+    Input("arc-loading-interval", "n_intervals"),
+    prevent_initial_call=True,
+)
+
+
 if __name__ == "__main__":
     app.run_server(debug=True, use_reloader=False)
@@ -0,0 +1,159 @@
+"""Benchmarks ``arc_core.add_transformed_rows`` against its previous implementation.
+
+Usage::
+
+    python benchmarks/bench_add_transformed_rows.py
+    python benchmarks/bench_add_transformed_rows.py --variables 3000 --lists 200
+
+The data dictionary is synthetic: every section has the same number of
+variables, and some of them are lists, each expanded into transformed rows
+replacing the list variable, and adding an item, other and additional row for
+each of its five iterations, as the ARC list expansions do. The outputs of
+both implementations are checked to be equal before they are timed.
+"""
+
+import argparse
+from timeit import repeat
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from bridge.arc import arc_core
+
+
+def add_transformed_rows_previous(
+    df_selected: pd.DataFrame,
+    df_selected_units: pd.DataFrame,
+    variable_order: list,
+) -> pd.DataFrame:
+    df_output = df_selected.copy().reset_index(drop=True)
+
+    df_selected_units["Sec_vari"] = (
+        df_selected_units["Sec"] + "_" + df_selected_units["vari"]
+    )
+    df_selected_units = df_selected_units[df_output.columns]
+
+    for _, row in df_selected_units.iterrows():
+        variable = row["Variable"]
+
+        if variable in df_output["Variable"].values:
+            match_index = df_output.index[df_output["Variable"] == variable].tolist()[0]
+            for col in df_output.columns:
+                df_output.at[match_index, col] = row[col]
+
+        else:
+            base_var = "_".join(variable.split("_")[:-1])
+
+            if base_var in df_output["Variable"].values:
+                base_index = df_output.index[
+                    df_output["Variable"].str.startswith(base_var)
+                ].max()
+                df_row = pd.DataFrame([row]).reset_index(drop=True)
+                df_output = pd.concat(
+                    [
+                        df_output.iloc[: base_index + 1],
+                        df_row,
+                        df_output.iloc[base_index + 1 :],
+                    ]
+                ).reset_index(drop=True)
+
+            else:
+                variable_to_add = variable
+                order_index = (
+                    variable_order.index(variable_to_add)
+                    if variable_to_add in variable_order
+                    else None
+                )
+
+                if order_index is not None:
+                    insert_before_index = None
+                    for next_variable in variable_order[order_index + 1 :]:
+                        if next_variable in df_output["Variable"].values:
+                            insert_before_index = df_output.index[
+                                df_output["Variable"] == next_variable
+                            ][0]
+                            break
+
+                    df_row = pd.DataFrame([row]).reset_index(drop=True)
+
+                    if insert_before_index is not None:
+                        df_output = pd.concat(
+                            [
+                                df_output.iloc[:insert_before_index],
+                                df_row,
+                                df_output.iloc[insert_before_index:],
+                            ]
+                        ).reset_index(drop=True)
+
+                    else:
+                        df_output = pd.concat([df_output, df_row]).reset_index(
+                            drop=True
+                        )
+
+                else:
+                    df_row = pd.DataFrame([row]).reset_index(drop=True)
+                    df_output = pd.concat([df_output, df_row]).reset_index(drop=True)
+
+    return df_output
+
+
+def get_datadicc(
+    variable_count: int, list_count: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    sections = [f"sec{section}" for section in range(max(variable_count // 100, 1))]
+    rows = []
+    for index in range(variable_count):
+        section = sections[index % len(sections)]
+        vari = f"var{index}"
+        rows.append(
+            {
+                "Variable": f"{section}_{vari}",
+                "Sec": section,
+                "vari": vari,
+                "Question": f"Question {index}",
+                "Type": "list" if index < list_count else "text",
+            }
+        )
+    df_datadicc = pd.DataFrame(rows)
+
+    transformed_rows = []
+    for row in rows[:list_count]:
+        transformed_rows.append({**row, "Type": "radio"})
+        for iteration in range(5):
+            for suffix in ("item", "otherl2", "addi"):
+                transformed_rows.append(
+                    {**row, "Variable": f"{row['Variable']}_{iteration}{suffix}"}
+                )
+    return df_datadicc, pd.DataFrame(transformed_rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variables", type=int, default=3000, help="ARC variables")
+    parser.add_argument("--lists", type=int, default=100, help="List variables")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings")
+    args = parser.parse_args()
+
+    df_datadicc, df_transformed = get_datadicc(args.variables, args.lists)
+    variable_order = arc_core.get_variable_order(df_datadicc.copy())
+
+    def run(function):
+        return function(df_datadicc, df_transformed.copy(), variable_order)
+
+    assert_frame_equal(
+        run(arc_core.add_transformed_rows),
+        run(add_transformed_rows_previous),
+    )
+
+    print(f"ARC variables: {len(df_datadicc)}")
+    print(f"Transformed rows: {len(df_transformed)}")
+    for name, function in (
+        ("previous", add_transformed_rows_previous),
+        ("current", arc_core.add_transformed_rows),
+    ):
+        timings = repeat(lambda: run(function), number=1, repeat=args.repeat)
+        print(f"{name}: best of {args.repeat} = {min(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmarks ``arc_core.get_dependencies`` against its previous implementation.
+
+Usage::
+
+    python benchmarks/bench_get_dependencies.py --arc-csv path/to/ARC.csv
+    python benchmarks/bench_get_dependencies.py --arc-version v1.2.2
+
+If no ARC.csv is given, the ARC.csv of the given ARC version, or of the latest
+version, is downloaded from GitHub. The outputs of both implementations are
+checked to be equal before they are timed.
+"""
+
+import argparse
+from timeit import repeat
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from bridge.arc import arc_core
+from bridge.arc.arc_api import ArcApiClient
+
+
+def get_dependencies_previous(df_datadicc: pd.DataFrame) -> pd.DataFrame:
+    mandatory = ["subjid"]
+
+    df_dependencies = df_datadicc[["Variable", "Skip Logic"]]
+    field_dependencies = []
+    for skip_logic_str in df_dependencies["Skip Logic"]:
+        cont = 0
+        variable_dependencies = []
+        if not isinstance(skip_logic_str, float):
+            for i in skip_logic_str.split("["):
+                variable = i[: i.find("]")]
+                if "(" in variable:
+                    variable = variable[: variable.find("(")]
+                if cont != 0:
+                    variable_dependencies.append(variable)
+                cont += 1
+        field_dependencies.append(variable_dependencies)
+
+    df_dependencies["Dependencies"] = field_dependencies
+    for variable in df_dependencies["Variable"]:
+        if "other" in variable:
+            if (
+                len(
+                    df_dependencies["Dependencies"].loc[
+                        df_dependencies["Variable"] == variable.replace("other", "")
+                    ]
+                )
+                >= 1
+            ):
+                df_dependencies["Dependencies"].loc[
+                    df_dependencies["Variable"] == variable.replace("other", "")
+                ].iloc[0].append(variable)
+
+        if "units" in variable:
+            if (
+                len(
+                    df_dependencies["Dependencies"].loc[
+                        df_dependencies["Variable"] == variable.replace("units", "")
+                    ]
+                )
+                >= 1
+            ):
+                df_dependencies["Dependencies"].loc[
+                    df_dependencies["Variable"] == variable.replace("units", "")
+                ].iloc[0].append(variable)
+
+        for mandatory_variable in mandatory:
+            df_dependencies["Dependencies"].loc[
+                df_dependencies["Variable"] == variable
+            ].iloc[0].append(mandatory_variable)
+
+    return df_dependencies
+
+
+def get_arc_dataframe(arc_csv: str | None, arc_version: str | None) -> pd.DataFrame:
+    if arc_csv:
+        return pd.read_csv(arc_csv, encoding="utf-8")
+    client = ArcApiClient()
+    if not arc_version:
+        _, arc_version = arc_core.get_arc_versions()
+    return client.get_dataframe_arc_sha(
+        client.get_arc_version_sha(arc_version), arc_version
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--arc-csv", help="Path to an ARC.csv file")
+    parser.add_argument("--arc-version", help="ARC version to download")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings")
+    args = parser.parse_args()
+
+    df_datadicc = get_arc_dataframe(args.arc_csv, args.arc_version)
+    assert_frame_equal(
+        arc_core.get_dependencies(df_datadicc),
+        get_dependencies_previous(df_datadicc),
+    )
+
+    print(f"ARC variables: {len(df_datadicc)}")
+    for name, function in (
+        ("previous", get_dependencies_previous),
+        ("current", arc_core.get_dependencies),
+    ):
+        timings = repeat(lambda: function(df_datadicc), number=1, repeat=args.repeat)
+        print(f"{name}: best of {args.repeat} = {min(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
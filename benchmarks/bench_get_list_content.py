@@ -0,0 +1,236 @@
+"""Benchmarks ``ArcList.get_list_content`` against its previous implementation.
+
+Usage::
+
+    python benchmarks/bench_get_list_content.py
+    python benchmarks/bench_get_list_content.py --arc-version v1.2.2 --language French
+
+The ARC data dictionary and list CSVs of the given ARC version, or of the
+latest version, are downloaded from GitHub, or read from the offline mirror if
+``ARC_MIRROR_DIR`` is set, before anything is timed. The outputs of both
+implementations are checked to be equal before they are timed.
+"""
+
+import argparse
+from timeit import repeat
+from typing import List
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from bridge.arc import arc_core, arc_translations
+from bridge.arc.arc_lists import ARROWS, ArcList
+
+
+class ArcListPrevious(ArcList):
+    @staticmethod
+    def _append_updated_other_info_list_content(
+        datadicc_row: pd.Series,
+        iteration_number: int,
+        df_other_info: pd.DataFrame,
+        questions_for_this_list: list,
+    ) -> List:
+        skip_logic_variable = f"{datadicc_row['Sec']}_{datadicc_row['vari']}_{str(iteration_number)}addi".replace(
+            str(iteration_number), str(iteration_number - 1)
+        )
+
+        if len(df_other_info) > 1:
+            for index, other_info_row in df_other_info.iterrows():
+                other_info_row_updated = other_info_row.copy()
+                if iteration_number == 0:
+                    question_text = (
+                        f"{ARROWS[iteration_number]} {datadicc_row['Question']}"
+                    )
+                else:
+                    question_text = f"{ARROWS[iteration_number]} {datadicc_row['Question']} {str(iteration_number + 1)}"
+                other_info_row_updated["Question"] = question_text
+                other_info_row_updated["Variable"] = (
+                    f"{datadicc_row['Sec']} {datadicc_row['vari']}_{str(iteration_number)}{datadicc_row['mod']}"
+                )
+                other_info_row_updated["Skip Logic"] = f"[{skip_logic_variable}]='1'"
+                other_info_row_updated["List"] = None
+                other_info_row_updated["mod"] = (
+                    f"{str(iteration_number)}{datadicc_row['mod']}"
+                )
+                other_info_row_updated["vari"] = datadicc_row["vari"]
+                questions_for_this_list.append(other_info_row_updated)
+
+        elif len(df_other_info) == 1:
+            other_info_row = df_other_info.iloc[0]
+            other_info_row_updated = other_info_row.copy()
+            if iteration_number == 0:
+                other_info_row_updated["Question"] = (
+                    f"{ARROWS[iteration_number]}{other_info_row['Question']}"
+                )
+            else:
+                question_text = f"{ARROWS[iteration_number]}{other_info_row['Question']} {str(iteration_number + 1)}"
+                other_info_row_updated["Question"] = question_text
+                other_info_row_updated["Skip Logic"] = f"[{skip_logic_variable}]='1'"
+                other_info_row_updated["Variable"] = (
+                    f"{other_info_row['Sec']}_{other_info_row['vari']}_{str(iteration_number)}{other_info_row['mod']}"
+                )
+                other_info_row_updated["List"] = None
+                other_info_row_updated["mod"] = (
+                    f"{str(iteration_number)}{other_info_row['mod']}"
+                )
+                other_info_row_updated["vari"] = other_info_row["vari"]
+            questions_for_this_list.append(other_info_row_updated)
+
+        return questions_for_this_list
+
+    def _append_updated_additional_row_list_content(
+        self,
+        datadicc_row: pd.Series,
+        iteration_number: int,
+        iteration_total: int,
+        dropdown_row: pd.Series,
+        any_additional_text: str,
+        questions_for_this_list: list,
+    ) -> List:
+        if iteration_number < iteration_total - 1:
+            additional_row = datadicc_row.copy()
+            additional_row["Variable"] = (
+                f"{datadicc_row['Sec']}_{datadicc_row['vari']}_{str(iteration_number)}addi"
+            )
+            additional_row["Answer Options"] = datadicc_row["Answer Options"]
+            additional_row["Type"] = "radio"
+            additional_row["Maximum"] = None
+            additional_row["Minimum"] = None
+            additional_row["Skip Logic"] = dropdown_row["Skip Logic"]
+            question_english_lower = str(datadicc_row["Question_english"].lower())
+            question = self._get_question_upper_lower(
+                datadicc_row, question_english_lower
+            )
+            question_text = (
+                f"{ARROWS[iteration_number]} {any_additional_text} {question} ?"
+            )
+            additional_row["Question"] = question_text
+            additional_row["List"] = None
+            additional_row["mod"] = f"{str(iteration_number)}addi"
+            additional_row["vari"] = datadicc_row["vari"]
+            questions_for_this_list.append(additional_row)
+        return questions_for_this_list
+
+    def get_list_content(self, df_datadicc: pd.DataFrame) -> tuple[pd.DataFrame, list]:
+        all_rows_lists = []
+        list_variable_choices = []
+        df_datadicc_lists = df_datadicc.loc[df_datadicc["Type"] == "list"]
+
+        translations_for_language = arc_translations.get_translations(self.language)
+        select_text = translations_for_language["select"]
+        specify_text = translations_for_language["specify"]
+        specify_other_text = translations_for_language["specify_other"]
+        specify_other_infection_text = translations_for_language[
+            "specify_other_infection"
+        ]
+        select_additional_text = translations_for_language["select_additional"]
+        any_additional_text = translations_for_language["any_additional"]
+        other_text = translations_for_language["other"]
+
+        for _, datadicc_row in df_datadicc_lists.iterrows():
+            if pd.isnull(datadicc_row["List"]):
+                continue
+
+            (list_choices, list_variable_choices_aux) = self._get_list_choices(
+                datadicc_row, other_text
+            )
+
+            iteration_total = 5
+            questions_for_this_list = []
+
+            for iteration_number in range(iteration_total):
+                dropdown_row = self._format_dropdown_row_list_content(
+                    datadicc_row,
+                    iteration_number,
+                    list_choices,
+                    select_text,
+                    select_additional_text,
+                )
+
+                other_row = self._format_other_row_list_content(
+                    datadicc_row,
+                    iteration_number,
+                    dropdown_row,
+                    specify_text,
+                    specify_other_text,
+                    specify_other_infection_text,
+                )
+
+                questions_for_this_list.append(dropdown_row)
+                questions_for_this_list.append(other_row)
+
+                other_info = df_datadicc.loc[
+                    (df_datadicc["Sec"] == datadicc_row["Sec"])
+                    & (df_datadicc["vari"] == datadicc_row["vari"])
+                    & (df_datadicc["Variable"] != datadicc_row["Variable"])
+                ]
+
+                questions_for_this_list = self._append_updated_other_info_list_content(
+                    datadicc_row,
+                    iteration_number,
+                    other_info,
+                    questions_for_this_list,
+                )
+
+                questions_for_this_list = (
+                    self._append_updated_additional_row_list_content(
+                        datadicc_row,
+                        iteration_number,
+                        iteration_total,
+                        dropdown_row,
+                        any_additional_text,
+                        questions_for_this_list,
+                    )
+                )
+
+            all_rows_lists.append(datadicc_row)
+
+            for question_for_this_list in questions_for_this_list:
+                all_rows_lists.append(question_for_this_list)
+
+            list_variable_choices.append(
+                [datadicc_row["Variable"], list_variable_choices_aux]
+            )
+
+        df_arc_list = pd.DataFrame(all_rows_lists).reset_index(drop=True)
+
+        return df_arc_list, list_variable_choices
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--arc-version", help="ARC version to download")
+    parser.add_argument("--language", default="English", help="ARC language")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings")
+    args = parser.parse_args()
+
+    arc_version = args.arc_version
+    if not arc_version:
+        _, arc_version = arc_core.get_arc_versions()
+    df_datadicc, _, _ = arc_core.get_arc(arc_version)
+    df_datadicc = arc_core.add_required_datadicc_columns(df_datadicc)
+
+    arc_list = ArcList(arc_version, args.language)
+    arc_list_previous = ArcListPrevious(arc_version, args.language)
+    arc_list.prefetch_list_options(df_datadicc)
+    arc_list_previous.prefetch_list_options(df_datadicc)
+
+    df_lists, list_variable_choices = arc_list.get_list_content(df_datadicc)
+    df_lists_previous, list_variable_choices_previous = (
+        arc_list_previous.get_list_content(df_datadicc)
+    )
+    assert_frame_equal(df_lists, df_lists_previous)
+    assert list_variable_choices == list_variable_choices_previous
+
+    print(f"ARC variables: {len(df_datadicc)}")
+    print(f"List rows: {len(df_lists)}")
+    for name, function in (
+        ("previous", arc_list_previous.get_list_content),
+        ("current", arc_list.get_list_content),
+    ):
+        timings = repeat(lambda: function(df_datadicc), number=1, repeat=args.repeat)
+        print(f"{name}: best of {args.repeat} = {min(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
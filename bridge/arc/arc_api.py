@@ -1,10 +1,31 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
 from os import getenv
-from time import monotonic
+from collections.abc import Callable, MutableMapping
+from pathlib import Path
+from threading import Lock, Thread
+from time import monotonic, perf_counter
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
-
+from urllib3.util import Retry
+
+from bridge.arc.arc_cache import ArcMemoryCache, SingleFlight, get_dataframe_view
+from bridge.arc.arc_disk_cache import ArcDiskCache
+from bridge.arc.arc_rate_limit import (
+    ARC_RATE_LIMIT_BUDGET,
+    background_requests,
+    get_token_key,
+    is_background_request,
+)
+from bridge.arc.arc_shared_cache import ArcSharedCache, get_arc_shared_cache
 from bridge.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -12,16 +33,228 @@ logger = setup_logger(__name__)
 pd.options.mode.copy_on_write = True
 
 _VERSION_SHA_CACHE: dict[tuple[str, str], str] = {}
-_ARC_DF_CACHE: dict[tuple[str, str, str], pd.DataFrame] = {}
-_ARC_TRANSLATION_DF_CACHE: dict[tuple[str, str, str], pd.DataFrame] = {}
-_ARC_LIST_DF_CACHE: dict[tuple[str, str, str, str], pd.DataFrame] = {}
+_ARC_DF_CACHE: MutableMapping[tuple[str, str, str], pd.DataFrame] = ArcMemoryCache(
+    "arc_df"
+)
+_ARC_TRANSLATION_DF_CACHE: MutableMapping[tuple[str, str, str], pd.DataFrame] = (
+    ArcMemoryCache("arc_translation_df")
+)
+_ARC_LIST_DF_CACHE: MutableMapping[tuple[str, str, str, str], pd.DataFrame] = (
+    ArcMemoryCache("arc_list_df")
+)
+_ARC_PAPER_LIKE_DF_CACHE: MutableMapping[tuple[str, str, str], pd.DataFrame] = (
+    ArcMemoryCache("arc_paper_like_df")
+)
+_ARC_SUPPLEMENTAL_PHRASES_DF_CACHE: MutableMapping[
+    tuple[str, str, str], pd.DataFrame
+] = ArcMemoryCache("arc_supplemental_phrases_df")
+_ARC_CRF_METADATA_DF_CACHE: MutableMapping[tuple[str, str], pd.DataFrame] = (
+    ArcMemoryCache("arc_crf_metadata_df")
+)
 _ARC_VERSION_LIST_CACHE: dict[tuple[str], tuple[list, float]] = {}
-_ARC_LANGUAGE_LIST_CACHE: dict[tuple[str, str], list] = {}
+_ARC_LANGUAGE_LIST_CACHE: dict[tuple[str, str], tuple[list, float]] = {}
+# Index of every ARC release tag to its commit SHA, with the time it was built
+_ARC_TAG_SHA_INDEX_CACHE: dict[tuple[str], tuple[dict[str, str], float]] = {}
+# GitHub API responses keyed by URL, with the validators (ETag/Last-Modified)
+# to send on the next request so that unchanged metadata costs a 304.
+_API_RESPONSE_CACHE: dict[str, tuple[dict, list | dict]] = {}
+
+# Concurrent requests for the same GitHub URL, e.g. from several users
+# selecting the same new ARC version at once, share a single download
+_API_SINGLE_FLIGHT = SingleFlight()
+_RAW_CONTENT_SINGLE_FLIGHT = SingleFlight()
+
+# The keys of the metadata caches being refreshed in the background, so that
+# there is only ever a single refresh of each in flight
+_METADATA_REFRESHES: set[tuple] = set()
+_METADATA_REFRESHES_LOCK = Lock()
 
 # Version/language metadata can change over time, so cache with TTL.
 # Default 6 hours; override with ARC_METADATA_CACHE_TTL_SECONDS env var.
 ARC_METADATA_CACHE_TTL_SECONDS = int(getenv("ARC_METADATA_CACHE_TTL_SECONDS", "21600"))
 
+# Downloaded ARC files can also be persisted to disk so that they survive
+# worker restarts. Disabled unless ARC_DISK_CACHE_DIR is set; the size of the
+# cache directory is capped by ARC_DISK_CACHE_MAX_BYTES (default 512 MiB).
+ARC_DISK_CACHE_DIR = getenv("ARC_DISK_CACHE_DIR", "")
+ARC_DISK_CACHE_MAX_BYTES = int(getenv("ARC_DISK_CACHE_MAX_BYTES", str(512 * 1024**2)))
+
+
+GITHUB_API_URL = "https://api.github.com/repos/ISARICResearch"
+# The maximum page size allowed by the GitHub API for listings
+GITHUB_API_PAGE_SIZE = 100
+GITHUB_RAW_CONTENT_URL = "https://raw.githubusercontent.com/ISARICResearch"
+
+# ARC can be served entirely from an offline mirror of the GitHub
+# repositories, as created by `bridge-cli arc sync`, by setting ARC_MIRROR_DIR
+# to the mirror directory or to a tarball (.tar, .tar.gz, .tgz) of it. The
+# mirror holds GitHub API responses as JSON files under `api/` and raw files
+# under `raw/`, with the same paths as on GitHub.
+ARC_MIRROR_DIR = getenv("ARC_MIRROR_DIR", "")
+ARC_MIRROR_API_DIR = "api"
+ARC_MIRROR_RAW_DIR = "raw"
+
+_MIRROR_EXTRACT_LOCK = Lock()
+
+# All requests share one pooled session per process, with a timeout and a
+# bounded number of retries (with jittered exponential backoff) for
+# connection errors and transient server-side failures.
+ARC_HTTP_TIMEOUT_SECONDS = float(getenv("ARC_HTTP_TIMEOUT_SECONDS", "30"))
+ARC_HTTP_MAX_RETRIES = int(getenv("ARC_HTTP_MAX_RETRIES", "3"))
+ARC_HTTP_BACKOFF_FACTOR = 0.5
+ARC_HTTP_BACKOFF_JITTER = 0.5
+ARC_HTTP_POOL_SIZE = 16
+ARC_HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_SESSION: requests.Session | None = None
+_SESSION_PID: int | None = None
+_SESSION_LOCK = Lock()
+
+
+def get_arc_session() -> requests.Session:
+    global _SESSION, _SESSION_PID
+    with _SESSION_LOCK:
+        # Pooled connections must not be shared with forked worker processes
+        if _SESSION is None or _SESSION_PID != os.getpid():
+            retry = Retry(
+                total=ARC_HTTP_MAX_RETRIES,
+                backoff_factor=ARC_HTTP_BACKOFF_FACTOR,
+                backoff_jitter=ARC_HTTP_BACKOFF_JITTER,
+                status_forcelist=ARC_HTTP_RETRY_STATUSES,
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=ARC_HTTP_POOL_SIZE,
+                pool_maxsize=ARC_HTTP_POOL_SIZE,
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+            _SESSION_PID = os.getpid()
+        return _SESSION
+
+
+def get_arc_mirror_dir() -> Path | None:
+    if not ARC_MIRROR_DIR:
+        return None
+    mirror_path = Path(ARC_MIRROR_DIR).expanduser().resolve()
+    if mirror_path.is_file():
+        return _extract_arc_mirror_archive(mirror_path)
+    return mirror_path
+
+
+def _extract_arc_mirror_archive(archive_path: Path) -> Path:
+    # Extract once into a directory keyed by the archive path and timestamp,
+    # which is then shared by all worker processes
+    archive_stat = archive_path.stat()
+    archive_key = hashlib.sha256(
+        f"{archive_path}|{archive_stat.st_mtime_ns}|{archive_stat.st_size}".encode()
+    ).hexdigest()[:16]
+    extract_dir = Path(tempfile.gettempdir()).joinpath(
+        f"bridge-arc-mirror-{archive_key}"
+    )
+    with _MIRROR_EXTRACT_LOCK:
+        if not extract_dir.is_dir():
+            logger.info(f"Extracting ARC mirror {archive_path} to {extract_dir}")
+            tmp_dir = tempfile.mkdtemp(
+                prefix=f"{extract_dir.name}.", dir=extract_dir.parent
+            )
+            with tarfile.open(archive_path) as archive:
+                archive.extractall(tmp_dir, filter="data")
+            try:
+                os.replace(tmp_dir, extract_dir)
+            except OSError:
+                # Another worker process finished extracting first
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+    return extract_dir
+
+
+def refresh_metadata_in_background(
+    refresh_key: tuple, refresh_function: Callable[[], object]
+) -> Thread | None:
+    """:py:class:`threading.Thread` : Refreshes expired ARC metadata in the background.
+
+    This lets the expired metadata be returned straight away, while it is
+    refreshed (stale-while-revalidate). The refresh is a background request,
+    so it is deferred if the GitHub rate limit is low, and failures are
+    logged, leaving the stale metadata in place until the next attempt.
+
+    Parameters
+    ----------
+    refresh_key : tuple
+        The key of the metadata cache entry being refreshed.
+
+    refresh_function : callable
+        The function refreshing the cache entry.
+
+    Returns
+    -------
+    threading.Thread
+        The refresh thread, or ``None`` if the entry is already being
+        refreshed.
+    """
+    with _METADATA_REFRESHES_LOCK:
+        if refresh_key in _METADATA_REFRESHES:
+            return None
+        _METADATA_REFRESHES.add(refresh_key)
+
+    def refresh() -> None:
+        try:
+            with background_requests():
+                refresh_function()
+        except Exception as e:
+            logger.warning(f"Failed to refresh ARC metadata {refresh_key}: {e}")
+        finally:
+            with _METADATA_REFRESHES_LOCK:
+                _METADATA_REFRESHES.discard(refresh_key)
+
+    refresh_thread = Thread(target=refresh, name="arc-metadata-refresh", daemon=True)
+    refresh_thread.start()
+    return refresh_thread
+
+
+def get_api_responses() -> dict[str, list]:
+    """:py:class:`dict` : Returns the cached GitHub API responses, e.g. to persist them.
+
+    Returns
+    -------
+    dict
+        The responses by URL, each as a list of the validators to send on the
+        next request and the response JSON.
+    """
+    return {
+        data_url: [validators, response_json]
+        for data_url, (validators, response_json) in list(_API_RESPONSE_CACHE.items())
+    }
+
+
+def add_api_responses(api_responses: dict[str, list]) -> None:
+    """Adds persisted GitHub API responses to the cache.
+
+    This makes the next requests for them conditional, e.g. after a restart,
+    so that unchanged metadata costs a 304. Responses already cached are kept.
+
+    Parameters
+    ----------
+    api_responses : dict
+        The responses by URL, as returned by ``get_api_responses``.
+    """
+    for data_url, (validators, response_json) in api_responses.items():
+        _API_RESPONSE_CACHE.setdefault(data_url, (validators, response_json))
+
+
+def get_arc_disk_cache() -> ArcDiskCache | None:
+    if not ARC_DISK_CACHE_DIR:
+        return None
+    return ArcDiskCache(
+        ARC_DISK_CACHE_DIR,
+        ARC_DISK_CACHE_MAX_BYTES,
+        ARC_METADATA_CACHE_TTL_SECONDS,
+    )
+
 
 class ArcApiClientError(Exception):
     pass
@@ -34,13 +267,39 @@ class ArcApiClient:
         else:
             self.environment = "production"
 
-        self.base_url_api: str = "https://api.github.com/repos/ISARICResearch"
-        self.base_url_raw_content: str = (
-            "https://raw.githubusercontent.com/ISARICResearch"
-        )
+        self.base_url_api: str = GITHUB_API_URL
+        self.base_url_raw_content: str = GITHUB_RAW_CONTENT_URL
+
+        mirror_dir = get_arc_mirror_dir()
+        self.is_mirror = mirror_dir is not None
+        if self.is_mirror:
+            self.base_url_api = str(mirror_dir.joinpath(ARC_MIRROR_API_DIR))
+            self.base_url_raw_content = str(mirror_dir.joinpath(ARC_MIRROR_RAW_DIR))
+
+    @staticmethod
+    def _read_mirror_api_response(data_path: str) -> dict:
+        try:
+            with open(f"{data_path}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(e)
+            raise ArcApiClientError(
+                f"Failed to read data from ARC mirror: '{data_path}'"
+            )
 
     @staticmethod
     def _get_api_response(data_url: str) -> dict:
+        if ARC_MIRROR_DIR and not data_url.startswith(("http://", "https://")):
+            return ArcApiClient._read_mirror_api_response(data_url)
+        # Background requests may be deferred, so aren't shared with
+        # user-facing requests for the same URL
+        return _API_SINGLE_FLIGHT.do(
+            (data_url, is_background_request()),
+            lambda: ArcApiClient._fetch_api_response(data_url),
+        )
+
+    @staticmethod
+    def _fetch_api_response(data_url: str) -> dict:
         logger.debug(
             "GITHUB_TOKEN is set"
             if getenv("GITHUB_TOKEN")
@@ -52,34 +311,161 @@ class ArcApiClient:
         github_token = getenv("GITHUB_TOKEN")
         headers = {"Authorization": f"token {github_token}"} if github_token else {}
 
+        # Conditional request, so that unchanged metadata costs a 304 rather
+        # than the full payload (304s don't count against the rate limit)
+        cached_response = _API_RESPONSE_CACHE.get(data_url)
+        if cached_response is not None:
+            headers.update(cached_response[0])
+
+        # Keep the last of the rate limit budget for user-facing requests,
+        # preferring a cached response, even if stale, to spending it
+        token_key = get_token_key(github_token)
+        if ARC_RATE_LIMIT_BUDGET.is_low(token_key):
+            if cached_response is not None:
+                logger.debug(
+                    f"Using cached GitHub API response, as the rate limit is low: "
+                    f"'{data_url}'"
+                )
+                return cached_response[1]
+            if is_background_request() or ARC_RATE_LIMIT_BUDGET.is_exhausted(token_key):
+                raise ArcApiClientError(
+                    f"Deferred request, as the GitHub API rate limit is low: "
+                    f"'{data_url}'"
+                )
+
         try:
             if github_token:
                 logger.debug("Making authenticated request to GitHub API")
-            response = requests.get(data_url, headers=headers)
+            response = get_arc_session().get(
+                data_url, headers=headers, timeout=ARC_HTTP_TIMEOUT_SECONDS
+            )
+            ARC_RATE_LIMIT_BUDGET.update(token_key, response.headers)
+            if response.status_code == 304 and cached_response is not None:
+                logger.debug(f"GitHub API response not modified: '{data_url}'")
+                return cached_response[1]
             response.raise_for_status()
         except RequestException as e:
             logger.error(e)
             raise ArcApiClientError(f"Failed to fetch data: '{data_url}'")
         response_json = response.json()
+
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if validators:
+            _API_RESPONSE_CACHE[data_url] = (validators, response_json)
         return response_json
 
+    def _get_paginated_api_response(self, data_url: str) -> list:
+        # A mirror stores the full listing under the unpaginated URL
+        if self.is_mirror:
+            return self._get_api_response(data_url)
+
+        response_json = []
+        page = 1
+        while True:
+            page_json = ArcApiClient._get_api_response(
+                f"{data_url}?per_page={GITHUB_API_PAGE_SIZE}&page={page}"
+            )
+            response_json.extend(page_json)
+            if len(page_json) < GITHUB_API_PAGE_SIZE:
+                return response_json
+            page += 1
+
+    @staticmethod
+    def _get_raw_content(data_url: str) -> bytes:
+        response = get_arc_session().get(data_url, timeout=ARC_HTTP_TIMEOUT_SECONDS)
+        response.raise_for_status()
+        return response.content
+
     @staticmethod
     def _write_to_dataframe(data_path: str, json: bool = False) -> pd.DataFrame:
+        read_function = pd.read_json if json else pd.read_csv
         try:
-            if json:
-                df = pd.read_json(data_path, encoding="utf-8")
+            if data_path.startswith(("http://", "https://")):
+                # Download through the pooled session rather than letting
+                # pandas open a new connection for every file
+                content = ArcApiClient._get_raw_content(data_path)
+                try:
+                    df = read_function(io.BytesIO(content), encoding="utf-8")
+                except UnicodeDecodeError:
+                    df = read_function(io.BytesIO(content), encoding="latin1")
             else:
-                df = pd.read_csv(data_path, encoding="utf-8")
-        except UnicodeDecodeError:
-            if json:
-                df = pd.read_json(data_path, encoding="latin1")
-            else:
-                df = pd.read_csv(data_path, encoding="latin1")
+                try:
+                    df = read_function(data_path, encoding="utf-8")
+                except UnicodeDecodeError:
+                    df = read_function(data_path, encoding="latin1")
         except Exception as e:
             logger.error(e)
             raise ArcApiClientError(f"Failed to read data: {data_path}")
         return df
 
+    def _get_dataframe_raw_content(
+        self, repo: str, ref: str, path: str
+    ) -> pd.DataFrame:
+        url = "/".join([self.base_url_raw_content, repo, ref, path])
+        df = _RAW_CONTENT_SINGLE_FLIGHT.do(
+            url, lambda: self._load_dataframe_raw_content(repo, ref, path)
+        )
+        # Each caller gets its own view of a dataframe shared by several callers
+        return get_dataframe_view(df)
+
+    def _load_dataframe_raw_content(
+        self, repo: str, ref: str, path: str
+    ) -> pd.DataFrame:
+        disk_cache = None if self.is_mirror else get_arc_disk_cache()
+        if disk_cache is not None:
+            df = disk_cache.get(repo, ref, path)
+            if df is not None:
+                logger.debug(f"ARC disk cache hit: {repo}/{ref}/{path}")
+                return df
+
+        url = "/".join([self.base_url_raw_content, repo, ref, path])
+        df = self._write_to_dataframe(url)
+        if disk_cache is not None:
+            disk_cache.set(repo, ref, path, df)
+        return df
+
+    def get_shared_cache(self) -> ArcSharedCache | None:
+        # A mirror is already local, so isn't worth caching
+        return None if self.is_mirror else get_arc_shared_cache()
+
+    def _get_cached_dataframe(
+        self,
+        memory_cache: MutableMapping,
+        cache_name: str,
+        cache_key: tuple[str, ...],
+        load_function: Callable[[], pd.DataFrame],
+        ttl_seconds: int | None = None,
+    ) -> pd.DataFrame:
+        cached_df = memory_cache.get(cache_key)
+        if cached_df is not None:
+            return get_dataframe_view(cached_df)
+
+        load_start = perf_counter()
+        # Another worker process may have loaded the dataframe already
+        shared_cache = self.get_shared_cache()
+        df = None if shared_cache is None else shared_cache.get(cache_name, *cache_key)
+        cache_status = "SHARED"
+        if df is None:
+            cache_status = "MISS"
+            df = load_function()
+            if shared_cache is not None:
+                shared_cache.set(
+                    cache_name, *cache_key, value=df, ttl_seconds=ttl_seconds
+                )
+        memory_cache[cache_key] = df
+        logger.debug(
+            "ArcApiClient %s cache=%s key=%s elapsed_ms=%.3f",
+            cache_name,
+            cache_status,
+            cache_key,
+            (perf_counter() - load_start) * 1000,
+        )
+        return get_dataframe_view(df)
+
     def get_arc_version_list(self) -> list:
         cache_key = (self.environment,)
         cache_entry = _ARC_VERSION_LIST_CACHE.get(cache_key)
@@ -88,6 +474,16 @@ class ArcApiClient:
             if monotonic() - cached_at < ARC_METADATA_CACHE_TTL_SECONDS:
                 return list(cached_list)
 
+            # Return the expired list straight away, and refresh it for next time
+            refresh_metadata_in_background(
+                ("arc_version_list", *cache_key),
+                lambda: self._fetch_arc_version_list(cache_key),
+            )
+            return list(cached_list)
+
+        return self._fetch_arc_version_list(cache_key)
+
+    def _fetch_arc_version_list(self, cache_key: tuple[str]) -> list:
         if self.environment != "development":
             url = "/".join([self.base_url_api, "ARC", "releases"])
             release_json = self._get_api_response(url)
@@ -106,6 +502,33 @@ class ArcApiClient:
         _ARC_VERSION_LIST_CACHE[cache_key] = (list(version_list), monotonic())
         return version_list
 
+    def get_arc_tag_sha_index(self, refresh: bool = False) -> dict[str, str]:
+        cache_key = (self.environment,)
+        cache_entry = _ARC_TAG_SHA_INDEX_CACHE.get(cache_key)
+        if cache_entry is not None and not refresh:
+            cached_index, cached_at = cache_entry
+            if monotonic() - cached_at < ARC_METADATA_CACHE_TTL_SECONDS:
+                return cached_index
+
+            # As for the version list, an expired index is refreshed in the
+            # background, as missing versions are refreshed on demand anyway
+            refresh_metadata_in_background(
+                ("arc_tag_sha_index", *cache_key),
+                lambda: self._fetch_arc_tag_sha_index(cache_key),
+            )
+            return cached_index
+
+        return self._fetch_arc_tag_sha_index(cache_key)
+
+    def _fetch_arc_tag_sha_index(self, cache_key: tuple[str]) -> dict[str, str]:
+        url = "/".join([self.base_url_api, "ARC", "tags"])
+        tag_json = self._get_paginated_api_response(url)
+        tag_sha_index = {
+            tag_dict["name"]: tag_dict["commit"]["sha"] for tag_dict in tag_json
+        }
+        _ARC_TAG_SHA_INDEX_CACHE[cache_key] = (tag_sha_index, monotonic())
+        return tag_sha_index
+
     def get_arc_version_sha(self, version: str) -> str:
         cache_key = (self.environment, version)
         if cache_key in _VERSION_SHA_CACHE:
@@ -113,10 +536,11 @@ class ArcApiClient:
 
         try:
             if self.environment != "development":
-                url = "/".join([self.base_url_api, "ARC", "tags"])
-                tag_json = self._get_api_response(url)
-                version_dict = list(filter(lambda x: x["name"] == version, tag_json))[0]
-                version_sha = version_dict["commit"]["sha"]
+                tag_sha_index = self.get_arc_tag_sha_index()
+                if version not in tag_sha_index:
+                    # The version may have been released since the index was built
+                    tag_sha_index = self.get_arc_tag_sha_index(refresh=True)
+                version_sha = tag_sha_index[version]
             else:
                 # Get the latest commit as the code is not tagged
                 url = "/".join([self.base_url_api, "DataPlatform", "commits"])
@@ -132,103 +556,107 @@ class ArcApiClient:
             )
 
     def get_dataframe_arc_sha(self, sha: str, version: str) -> pd.DataFrame:
-        cache_key = (self.environment, sha, version)
-        if cache_key in _ARC_DF_CACHE:
-            return _ARC_DF_CACHE[cache_key].copy(deep=True)
-
-        if self.environment != "development":
-            url = "/".join([self.base_url_raw_content, "ARC", sha, "ARC.csv"])
-        else:
-            url = "/".join(
-                [
-                    self.base_url_raw_content,
-                    "DataPlatform",
-                    sha,
-                    "ARCH",
-                    self.get_arch_version_string(version),
-                    "ARCH.csv",
-                ]
+        def load_dataframe() -> pd.DataFrame:
+            if self.environment != "development":
+                return self._get_dataframe_raw_content("ARC", sha, "ARC.csv")
+            return self._get_dataframe_raw_content(
+                "DataPlatform",
+                sha,
+                "/".join(["ARCH", self.get_arch_version_string(version), "ARCH.csv"]),
             )
-        df = self._write_to_dataframe(url)
-        _ARC_DF_CACHE[cache_key] = df.copy(deep=True)
-        return df.copy(deep=True)
+
+        # Keyed by the commit SHA, so the cached dataframe never goes stale
+        return self._get_cached_dataframe(
+            _ARC_DF_CACHE, "arc_df", (self.environment, sha, version), load_dataframe
+        )
 
     def get_dataframe_arc_version_language(
         self, version: str, language: str
     ) -> pd.DataFrame:
-        cache_key = (self.environment, version, language)
-        if cache_key in _ARC_TRANSLATION_DF_CACHE:
-            return _ARC_TRANSLATION_DF_CACHE[cache_key].copy(deep=True)
-
-        if self.environment != "development":
-            url = "/".join(
-                [
-                    self.base_url_raw_content,
+        def load_dataframe() -> pd.DataFrame:
+            if self.environment != "development":
+                return self._get_dataframe_raw_content(
                     "ARC-Translations",
                     "main",
-                    self.get_arch_version_string(version),
-                    language,
-                    "ARCH.csv",
-                ]
-            )
-        else:
-            url = "/".join(
-                [
-                    self.base_url_raw_content,
-                    "DataPlatform",
-                    "main",
-                    "ARCH",
-                    self.get_arch_version_string(version),
-                    "ARCH.csv",
-                ]
+                    "/".join(
+                        [self.get_arch_version_string(version), language, "ARCH.csv"]
+                    ),
+                )
+            return self._get_dataframe_raw_content(
+                "DataPlatform",
+                "main",
+                "/".join(["ARCH", self.get_arch_version_string(version), "ARCH.csv"]),
             )
-        df = self._write_to_dataframe(url)
-        _ARC_TRANSLATION_DF_CACHE[cache_key] = df.copy(deep=True)
-        return df.copy(deep=True)
+
+        return self._get_cached_dataframe(
+            _ARC_TRANSLATION_DF_CACHE,
+            "arc_translation_df",
+            (self.environment, version, language),
+            load_dataframe,
+            ARC_METADATA_CACHE_TTL_SECONDS,
+        )
 
     def get_dataframe_arc_list_version_language(
         self, version: str, language: str, list_name: str
     ) -> pd.DataFrame:
-        cache_key = (self.environment, version, language, list_name)
-        if cache_key in _ARC_LIST_DF_CACHE:
-            return _ARC_LIST_DF_CACHE[cache_key].copy(deep=True)
-
-        if self.environment != "development":
-            url = "/".join(
-                [
-                    self.base_url_raw_content,
+        def load_dataframe() -> pd.DataFrame:
+            if self.environment != "development":
+                df = self._get_dataframe_raw_content(
                     "ARC-Translations",
                     "main",
-                    self.get_arch_version_string(version),
-                    language,
-                    "Lists",
-                    f"{list_name}.csv",
-                ]
-            )
-        else:
-            url = "/".join(
-                [
-                    self.base_url_raw_content,
+                    "/".join(
+                        [
+                            self.get_arch_version_string(version),
+                            language,
+                            "Lists",
+                            f"{list_name}.csv",
+                        ]
+                    ),
+                )
+            else:
+                df = self._get_dataframe_raw_content(
                     "DataPlatform",
                     "main",
-                    "ARCH",
-                    self.get_arch_version_string(version),
-                    "Lists",
-                    f"{list_name}.csv",
-                ]
+                    "/".join(
+                        [
+                            "ARCH",
+                            self.get_arch_version_string(version),
+                            "Lists",
+                            f"{list_name}.csv",
+                        ]
+                    ),
+                )
+            return df.sort_values(by=df.columns[0], ascending=True).reset_index(
+                drop=True
             )
-        df = self._write_to_dataframe(url)
-        df = df.sort_values(by=df.columns[0], ascending=True).reset_index(drop=True)
-        _ARC_LIST_DF_CACHE[cache_key] = df.copy(deep=True)
-        return df.copy(deep=True)
+
+        return self._get_cached_dataframe(
+            _ARC_LIST_DF_CACHE,
+            "arc_list_df",
+            (self.environment, version, language, list_name),
+            load_dataframe,
+            ARC_METADATA_CACHE_TTL_SECONDS,
+        )
 
     def get_arc_language_list_version(self, version: str | None) -> list:
         normalized_version = str(version)
         cache_key = (self.environment, normalized_version)
         cache_entry = _ARC_LANGUAGE_LIST_CACHE.get(cache_key)
         if cache_entry is not None:
-            return list(cache_entry)
+            cached_list, cached_at = cache_entry
+            if monotonic() - cached_at >= ARC_METADATA_CACHE_TTL_SECONDS:
+                # New translations are picked up by a background refresh
+                refresh_metadata_in_background(
+                    ("arc_language_list", *cache_key),
+                    lambda: self._fetch_arc_language_list_version(version, cache_key),
+                )
+            return list(cached_list)
+
+        return self._fetch_arc_language_list_version(version, cache_key)
 
+    def _fetch_arc_language_list_version(
+        self, version: str | None, cache_key: tuple[str, str]
+    ) -> list:
         if self.environment != "development":
             url = "/".join(
                 [
@@ -243,84 +671,89 @@ class ArcApiClient:
             language_list = df["name"].to_list()
         else:
             language_list = ["English"]
-        _ARC_LANGUAGE_LIST_CACHE[cache_key] = list(language_list)
+        _ARC_LANGUAGE_LIST_CACHE[cache_key] = (list(language_list), monotonic())
         return language_list
 
     def get_dataframe_paper_like_details(
         self, version: str, language: str
     ) -> pd.DataFrame:
-        try:
+        def load_dataframe() -> pd.DataFrame:
             if self.environment != "development":
-                url = "/".join(
-                    [
-                        self.base_url_raw_content,
-                        "ARC-Translations",
-                        "main",
-                        self.get_arch_version_string(version),
-                        language,
-                        "paper_like_details.csv",
-                    ]
+                return self._get_dataframe_raw_content(
+                    "ARC-Translations",
+                    "main",
+                    "/".join(
+                        [
+                            self.get_arch_version_string(version),
+                            language,
+                            "paper_like_details.csv",
+                        ]
+                    ),
                 )
-            else:
-                url = "/".join(
+            return self._get_dataframe_raw_content(
+                "DataPlatform",
+                "main",
+                "/".join(
                     [
-                        self.base_url_raw_content,
-                        "DataPlatform",
-                        "main",
                         "ARCH",
                         self.get_arch_version_string(version),
                         "paper_like_details.csv",
                     ]
-                )
-            df = self._write_to_dataframe(url)
+                ),
+            )
+
+        try:
+            return self._get_cached_dataframe(
+                _ARC_PAPER_LIKE_DF_CACHE,
+                "arc_paper_like_df",
+                (self.environment, version, language),
+                load_dataframe,
+                ARC_METADATA_CACHE_TTL_SECONDS,
+            )
         except ArcApiClientError as e:
             raise ArcApiClientError(
                 "Could not find paperlike details CSV for ARC version "
                 f'"{version}" and language "{language}"'
             ) from e
-        else:
-            return df
 
     def get_dataframe_supplemental_phrases(
         self, version: str, language: str
     ) -> pd.DataFrame:
-        try:
+        def load_dataframe() -> pd.DataFrame:
             if self.environment != "development":
-                url = "/".join(
-                    [
-                        self.base_url_raw_content,
-                        "ARC-Translations",
-                        "main",
-                        self.get_arch_version_string(version),
-                        language,
-                        "supplemental_phrases.csv",
-                    ]
-                )
+                phrases_version = version
             else:
                 # Use the latest ARC one
                 url = "/".join([self.base_url_api, "ARC", "releases"])
                 release_json = self._get_api_response(url)
-                version_list = [
+                phrases_version = max(
                     release_dict["tag_name"] for release_dict in release_json
-                ]
-                url = "/".join(
+                )
+            return self._get_dataframe_raw_content(
+                "ARC-Translations",
+                "main",
+                "/".join(
                     [
-                        self.base_url_raw_content,
-                        "ARC-Translations",
-                        "main",
-                        self.get_arch_version_string(max(version_list)),
+                        self.get_arch_version_string(phrases_version),
                         language,
                         "supplemental_phrases.csv",
                     ]
-                )
-            df = self._write_to_dataframe(url)
+                ),
+            )
+
+        try:
+            return self._get_cached_dataframe(
+                _ARC_SUPPLEMENTAL_PHRASES_DF_CACHE,
+                "arc_supplemental_phrases_df",
+                (self.environment, version, language),
+                load_dataframe,
+                ARC_METADATA_CACHE_TTL_SECONDS,
+            )
         except ArcApiClientError as e:
             raise ArcApiClientError(
-                "Could not find paperlike details CSV for ARC version "
+                "Could not find supplemental phrases CSV for ARC version "
                 f'"{version}" and language "{language}"'
             ) from e
-        else:
-            return df
 
     def get_dataframe_crf_metadata(self, version: str) -> pd.DataFrame:
         """:py:class:`pandas.DataFrame` : Returns the CRF metadata CSV as a dataframe.
@@ -345,24 +778,20 @@ class ArcApiClient:
             #
             #   https://raw.githubusercontent.com/ISARICResearch/ARC/refs/tags/<version>/crf_metadata.csv
             #
-            url = "/".join(
-                [
-                    self.base_url_raw_content,
-                    "ARC",
-                    "refs",
-                    "tags",
-                    version,
-                    "crf_metadata.csv",
-                ]
+            return self._get_cached_dataframe(
+                _ARC_CRF_METADATA_DF_CACHE,
+                "arc_crf_metadata_df",
+                (self.environment, version),
+                lambda: self._get_dataframe_raw_content(
+                    "ARC", "/".join(["refs", "tags", version]), "crf_metadata.csv"
+                ),
+                ARC_METADATA_CACHE_TTL_SECONDS,
             )
-            df = self._write_to_dataframe(url)
         except ArcApiClientError as e:
             raise ArcApiClientError(
                 "Could not find CRF metadata CSV for ARC version "
                 f'"{version}" and English language'
             ) from e
-        else:
-            return df
 
     @staticmethod
     def get_arch_version_string(version: str) -> str:
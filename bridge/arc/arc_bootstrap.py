@@ -0,0 +1,282 @@
+import json
+import os
+from collections.abc import Callable
+from os import getenv
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import perf_counter
+
+from bridge import __version__
+from bridge.arc import arc_core, arc_tree
+from bridge.arc.arc_api import (
+    ArcApiClient,
+    ArcApiClientError,
+    add_api_responses,
+    get_api_responses,
+)
+from bridge.arc.arc_lists import ArcList
+from bridge.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ARC_LANGUAGE_DEFAULT = "English"
+
+# Optional snapshot file of the initial ARC data, shared by all the worker
+# processes, so that restarts don't need to rebuild it
+ARC_BOOTSTRAP_SNAPSHOT_PATH = getenv("ARC_BOOTSTRAP_SNAPSHOT_PATH", "")
+
+# How long a page waits for the initial ARC data before showing that it's
+# still loading
+ARC_BOOTSTRAP_WAIT_SECONDS = float(getenv("ARC_BOOTSTRAP_WAIT_SECONDS", "10"))
+
+# Bump this if the snapshot format changes, so old snapshots are ignored.
+_BOOTSTRAP_SNAPSHOT_FORMAT_VERSION = "2"
+
+
+def build_arc_bootstrap() -> dict:
+    """:py:class:`dict` : Builds the initial ARC data needed by the app.
+
+    This is the latest ARC version in the default language, with its lists
+    expanded, together with the version and language lists, tree items,
+    presets and CRF metadata.
+
+    Returns
+    -------
+    dict
+        The initial ARC data, with JSON strings for the app stores.
+    """
+    arc_bootstrap_start = perf_counter()
+
+    version_list, version_latest = arc_core.get_arc_versions()
+    language_list = ArcApiClient().get_arc_language_list_version(version_latest)
+
+    df_arc, presets, commit = arc_core.get_arc(version_latest)
+    df_arc = arc_core.add_required_datadicc_columns(df_arc)
+
+    dynamic_units_conversion = arc_core.get_dynamic_units_conversion_bool(
+        version_latest
+    )
+
+    tree_items_data = arc_tree.get_tree_items(
+        df_arc, version_latest, dynamic_units_conversion
+    )
+
+    arc_list = ArcList(version_latest, ARC_LANGUAGE_DEFAULT)
+    arc_list.prefetch_list_options(df_arc)
+
+    # List, User List and Multi List content Transformation
+    df_all_lists, _, ulist_variable_list, multilist_variable_list = (
+        arc_list.get_all_list_content(df_arc)
+    )
+    df_arc = arc_core.add_transformed_rows(
+        df_arc, df_all_lists, arc_core.get_variable_order(df_arc)
+    )
+
+    # Grouping presets by the first column
+    grouped_presets = {}
+    for key, value in presets:
+        grouped_presets.setdefault(key, []).append(value)
+
+    df_crf_metadata = ArcApiClient().get_dataframe_crf_metadata(version_latest)
+
+    logger.info(
+        "ARC bootstrap complete version=%s language=%s total_elapsed_ms=%.3f",
+        version_latest,
+        ARC_LANGUAGE_DEFAULT,
+        (perf_counter() - arc_bootstrap_start) * 1000,
+    )
+
+    return {
+        "commit": commit,
+        "version_list": version_list,
+        "version_latest": version_latest,
+        "language_list": language_list,
+        "language_default": ARC_LANGUAGE_DEFAULT,
+        "dynamic_units_conversion": dynamic_units_conversion,
+        "tree_items_data": tree_items_data,
+        "arc_json": df_arc.to_json(date_format="iso", orient="split"),
+        "ulist_variable_json": json.dumps(ulist_variable_list),
+        "multilist_variable_json": json.dumps(multilist_variable_list),
+        "grouped_presets_json": json.dumps(grouped_presets),
+        "arc_crf_metadata_json": df_crf_metadata.to_json(
+            date_format="iso", orient="split"
+        ),
+    }
+
+
+def read_arc_bootstrap_snapshot(snapshot_path: str | Path) -> dict | None:
+    """:py:class:`dict` : Reads the initial ARC data from a snapshot, if still valid.
+
+    The snapshot is valid if it was written by the same BRIDGE version, and
+    the latest ARC version and its commit SHA are unchanged. These are checked
+    with the version list and tag metadata requests only, or none in offline
+    mirror mode. The GitHub API responses are kept in the snapshot with their
+    ETag and Last-Modified validators, so that after a restart these requests
+    are conditional, and cost 304s, which don't count against the rate limit,
+    unless the metadata changed. If GitHub can't be reached then the snapshot
+    is used as is.
+
+    Parameters
+    ----------
+    snapshot_path : str, pathlib.Path
+        The snapshot file path.
+
+    Returns
+    -------
+    dict
+        The initial ARC data, or ``None`` if there is no valid snapshot.
+    """
+    try:
+        snapshot = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+        if (
+            snapshot["format_version"] != _BOOTSTRAP_SNAPSHOT_FORMAT_VERSION
+            or snapshot["bridge_version"] != __version__
+        ):
+            return None
+        arc_bootstrap_data = snapshot["data"]
+        add_api_responses(snapshot["api_responses"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read ARC bootstrap snapshot {snapshot_path}: {e}")
+        return None
+
+    try:
+        _, version_latest = arc_core.get_arc_versions()
+        if version_latest != arc_bootstrap_data["version_latest"]:
+            return None
+        commit = ArcApiClient().get_arc_version_sha(version_latest)
+        if commit != arc_bootstrap_data["commit"]:
+            return None
+    except ArcApiClientError as e:
+        logger.warning(
+            f"Using ARC bootstrap snapshot without revalidating it, as ARC "
+            f"could not be reached: {e}"
+        )
+
+    logger.info(
+        "ARC bootstrap loaded from snapshot version=%s commit=%s",
+        arc_bootstrap_data["version_latest"],
+        arc_bootstrap_data["commit"],
+    )
+    return arc_bootstrap_data
+
+
+def write_arc_bootstrap_snapshot(
+    snapshot_path: str | Path, arc_bootstrap_data: dict
+) -> None:
+    snapshot_path = Path(snapshot_path)
+    snapshot = {
+        "format_version": _BOOTSTRAP_SNAPSHOT_FORMAT_VERSION,
+        "bridge_version": __version__,
+        "data": arc_bootstrap_data,
+        "api_responses": get_api_responses(),
+    }
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, as other worker processes may be
+        # reading the snapshot
+        tmp_path = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+        os.replace(tmp_path, snapshot_path)
+    except Exception as e:
+        logger.warning(f"Failed to write ARC bootstrap snapshot {snapshot_path}: {e}")
+
+
+def load_arc_bootstrap() -> dict:
+    """:py:class:`dict` : Loads the initial ARC data needed by the app.
+
+    The data is loaded from the bootstrap snapshot, if ``ARC_BOOTSTRAP_SNAPSHOT_PATH``
+    is set and the snapshot is still valid, otherwise it is built, and the
+    snapshot written for the next worker or restart.
+
+    Returns
+    -------
+    dict
+        The initial ARC data, with JSON strings for the app stores.
+    """
+    if not ARC_BOOTSTRAP_SNAPSHOT_PATH:
+        return build_arc_bootstrap()
+
+    arc_bootstrap_data = read_arc_bootstrap_snapshot(ARC_BOOTSTRAP_SNAPSHOT_PATH)
+    if arc_bootstrap_data is None:
+        arc_bootstrap_data = build_arc_bootstrap()
+        write_arc_bootstrap_snapshot(ARC_BOOTSTRAP_SNAPSHOT_PATH, arc_bootstrap_data)
+    return arc_bootstrap_data
+
+
+class ArcBootstrap:
+    """A lazily started, thread-safe provider of the initial ARC data.
+
+    The data is loaded once, in a background thread started by ``start``, so
+    the app can serve requests that don't need it, such as the home page,
+    while it loads. ``get`` blocks until the data is ready, and the ``ready``
+    event is set once it is. If loading fails then the next call to ``get`` or
+    ``start`` tries again.
+    """
+
+    def __init__(self, loader: Callable[[], dict] = load_arc_bootstrap) -> None:
+        self._loader = loader
+        self._lock = Lock()
+        self._loaded = Event()
+        self.ready = Event()
+        self._thread: Thread | None = None
+        self._data: dict | None = None
+        self._error: Exception | None = None
+        self._elapsed_ms: float | None = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._data is not None or (
+                self._thread is not None and self._thread.is_alive()
+            ):
+                return
+            self._error = None
+            self._loaded.clear()
+            self._thread = Thread(target=self._load, name="arc-bootstrap", daemon=True)
+            self._thread.start()
+
+    def _load(self) -> None:
+        load_start = perf_counter()
+        try:
+            data = self._loader()
+        except Exception as e:
+            logger.error(f"ARC bootstrap failed: {e}")
+            with self._lock:
+                self._error = e
+        else:
+            with self._lock:
+                self._data = data
+            self.ready.set()
+        finally:
+            self._elapsed_ms = (perf_counter() - load_start) * 1000
+            self._loaded.set()
+
+    def is_ready(self) -> bool:
+        return self._data is not None
+
+    def get(self, timeout: float | None = None) -> dict:
+        if self._data is None:
+            # Starts loading again if a previous attempt failed
+            self.start()
+            if not self._loaded.wait(timeout):
+                raise ArcApiClientError("ARC data is still loading")
+        if self._data is None:
+            raise ArcApiClientError(f"Failed to load ARC data: {self._error}")
+        return self._data
+
+    def get_status(self) -> dict:
+        with self._lock:
+            if self._data is not None:
+                status = "ready"
+            elif self._thread is not None and self._thread.is_alive():
+                status = "loading"
+            elif self._error is not None:
+                status = "failed"
+            else:
+                status = "pending"
+            return {
+                "status": status,
+                "elapsed_ms": self._elapsed_ms,
+                "error": None if self._error is None else str(self._error),
+            }
@@ -0,0 +1,200 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, MutableMapping
+from os import getenv
+from threading import Event, Lock, RLock
+from typing import Any, TypeVar
+
+import pandas as pd
+
+from bridge.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+pd.options.mode.copy_on_write = True
+
+# Default byte budget for each in-memory cache of ARC dataframes
+ARC_MEMORY_CACHE_MAX_BYTES = int(
+    getenv("ARC_MEMORY_CACHE_MAX_BYTES", str(64 * 1024**2))
+)
+
+_CACHE_REGISTRY: dict[str, "ArcMemoryCache"] = {}
+
+T = TypeVar("T")
+
+
+def get_dataframe_view(df: pd.DataFrame) -> pd.DataFrame:
+    """:py:class:`pandas.DataFrame` : Returns a cached dataframe without copying its data.
+
+    With copy-on-write enabled, the returned shallow copy shares its data with
+    the cached dataframe until either is modified, at which point only the
+    modified columns are copied. So callers are free to modify the returned
+    dataframe, and the cached dataframe is never modified by them.
+    """
+    return df.copy(deep=False)
+
+
+def get_entry_size(value: Any) -> int:
+    """:py:class:`int` : Returns the approximate size of a cache value in bytes.
+
+    Dataframes are measured with ``DataFrame.memory_usage(deep=True)``, and
+    tuples, lists and dicts by summing the sizes of their items.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return sys.getsizeof(value) + sum(get_entry_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            get_entry_size(key) + get_entry_size(item) for key, item in value.items()
+        )
+    return sys.getsizeof(value)
+
+
+class ArcMemoryCache(MutableMapping):
+    """A thread-safe, in-memory LRU cache with a byte budget.
+
+    The cache behaves like a ``dict``, but once the total size of the cached
+    values, as measured by ``get_entry_size``, exceeds ``max_bytes`` the least
+    recently used entries are evicted. Hits, misses and evictions are counted
+    and reported by ``get_stats``.
+    """
+
+    def __init__(self, name: str, max_bytes: int = ARC_MEMORY_CACHE_MAX_BYTES) -> None:
+        self.name = name
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = RLock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _CACHE_REGISTRY[name] = self
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        entry_size = get_entry_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if entry_size > self.max_bytes:
+                logger.warning(
+                    f"Not caching {self.name} entry {key} of {entry_size} bytes, "
+                    f"as it exceeds the cache budget of {self.max_bytes} bytes"
+                )
+                return
+            self._entries[key] = (value, entry_size)
+            self.total_bytes += entry_size
+            self.evict()
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+            self.misses += 1
+            return False
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        _, entry_size = self._entries.pop(key)
+        self.total_bytes -= entry_size
+
+    def evict(self) -> None:
+        with self._lock:
+            while self.total_bytes > self.max_bytes and self._entries:
+                key = next(iter(self._entries))
+                self._remove(key)
+                self.evictions += 1
+                logger.debug(f"Evicted {self.name} cache entry {key}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class _SingleFlightCall:
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into a single call.
+
+    The first thread to call ``do`` for a key runs the function, and any other
+    threads calling ``do`` for the same key while it runs wait for it and get
+    the same result, or the same exception, rather than repeating the work.
+    The result is shared, so callers must not modify it in place.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: dict[Hashable, _SingleFlightCall] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _SingleFlightCall()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+def get_cache_stats() -> dict[str, dict[str, int]]:
+    """:py:class:`dict` : Returns the stats of every in-memory ARC cache, by name."""
+    return {name: cache.get_stats() for name, cache in _CACHE_REGISTRY.items()}
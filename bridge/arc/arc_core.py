@@ -1,10 +1,16 @@
+import re
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator, MutableMapping
 from time import perf_counter
 
+import numpy as np
 import pandas as pd
 from packaging.version import parse
 
 from bridge.arc import arc_translations
 from bridge.arc.arc_api import ArcApiClient
+from bridge.arc.arc_cache import ArcMemoryCache, SingleFlight, get_dataframe_view
+from bridge.arc.arc_rate_limit import is_background_request
 from bridge.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -13,24 +19,51 @@ pd.options.mode.copy_on_write = True
 
 ARC_UNIT_CHANGE_VERSION = "v1.2.1"
 
-_ARC_VERSION_CACHE: dict[str, tuple[pd.DataFrame, list, str]] = {}
+_ARC_VERSION_CACHE: MutableMapping[str, tuple[pd.DataFrame, list, str]] = (
+    ArcMemoryCache("arc_version")
+)
+_ARC_VERSION_SINGLE_FLIGHT = SingleFlight()
 
 
 def get_arc(version: str) -> tuple[pd.DataFrame, list, str]:
     cache_start = perf_counter()
-    if version in _ARC_VERSION_CACHE:
-        cached_df, cached_presets, cached_commit = _ARC_VERSION_CACHE[version]
+    cache_entry = _ARC_VERSION_CACHE.get(version)
+    if cache_entry is not None:
         logger.debug(
             "arc_core.get_arc cache=HIT version=%s elapsed_ms=%.3f",
             version,
             (perf_counter() - cache_start) * 1000,
         )
-        return cached_df.copy(deep=True), list(cached_presets), cached_commit
+    else:
+        # Concurrent misses for the same version wait for a single build.
+        # Background builds may be deferred, so aren't shared with user-facing
+        # builds of the same version
+        cache_entry = _ARC_VERSION_SINGLE_FLIGHT.do(
+            (version, is_background_request()), lambda: _build_arc(version)
+        )
+    cached_df, cached_presets, cached_commit = cache_entry
+    return get_dataframe_view(cached_df), list(cached_presets), cached_commit
+
+
+def _build_arc(version: str) -> tuple[pd.DataFrame, list, str]:
+    # Another thread may have built the version since the cache was checked
+    cache_entry = _ARC_VERSION_CACHE.get(version)
+    if cache_entry is not None:
+        return cache_entry
 
     logger.info(f"version: {version}")
 
     fetch_start = perf_counter()
     commit_sha = ArcApiClient().get_arc_version_sha(version)
+
+    # Another worker process may have built the version for this commit already
+    shared_cache = ArcApiClient().get_shared_cache()
+    if shared_cache is not None:
+        cache_entry = shared_cache.get("arc_version", version, commit_sha)
+        if cache_entry is not None:
+            _ARC_VERSION_CACHE[version] = cache_entry
+            return cache_entry
+
     df_datadicc = ArcApiClient().get_dataframe_arc_sha(commit_sha, version)
 
     try:
@@ -39,9 +72,7 @@ def get_arc(version: str) -> tuple[pd.DataFrame, list, str]:
             df_datadicc, df_dependencies[["Variable", "Dependencies"]], on="Variable"
         )
 
-        df_datadicc["Branch"] = df_datadicc.apply(
-            lambda row: arc_translations.process_skip_logic(row, df_datadicc), axis=1
-        )
+        df_datadicc["Branch"] = arc_translations.get_branches(df_datadicc)
 
         # Find preset columns
         preset_column_list = [col for col in df_datadicc.columns if "preset_" in col]
@@ -55,17 +86,16 @@ def get_arc(version: str) -> tuple[pd.DataFrame, list, str]:
             preset_list.append(parts)
 
         df_datadicc["Question_english"] = df_datadicc["Question"]
-        _ARC_VERSION_CACHE[version] = (
-            df_datadicc.copy(deep=True),
-            list(preset_list),
-            commit_sha,
-        )
+        cache_entry = (df_datadicc, preset_list, commit_sha)
+        _ARC_VERSION_CACHE[version] = cache_entry
+        if shared_cache is not None:
+            shared_cache.set("arc_version", version, commit_sha, value=cache_entry)
         logger.debug(
             "arc_core.get_arc cache=MISS version=%s elapsed_ms=%.3f",
             version,
             (perf_counter() - fetch_start) * 1000,
         )
-        return df_datadicc, preset_list, commit_sha
+        return cache_entry
     except Exception as e:
         logger.error(e)
         raise RuntimeError("Failed to format ARC data")
@@ -94,65 +124,260 @@ def get_variable_order(df_datadicc: pd.DataFrame) -> list:
     return list(order["Sec_vari"])
 
 
+# A `[variable]` reference in skip logic: the text after each `[`, up to the
+# next `]`. Where there's no closing `]` before the next `[` or the end, the
+# last character is dropped, as the reference is assumed to be malformed.
+_SKIP_LOGIC_REFERENCE_PATTERN = re.compile(
+    r"\[([^\[\]]*?)(?:\]|[^\[](?=\[|\Z)|(?=\[|\Z))"
+)
+
+
 def get_dependencies(df_datadicc: pd.DataFrame) -> pd.DataFrame:
     mandatory = ["subjid"]
 
     df_dependencies = df_datadicc[["Variable", "Skip Logic"]]
-    field_dependencies = []
-    for skip_logic_str in df_dependencies["Skip Logic"]:
-        cont = 0
-        variable_dependencies = []
-        if not isinstance(skip_logic_str, float):
-            for i in skip_logic_str.split("["):
-                variable = i[: i.find("]")]
-                if "(" in variable:
-                    variable = variable[: variable.find("(")]
-                if cont != 0:
-                    variable_dependencies.append(variable)
-                cont += 1
-        field_dependencies.append(variable_dependencies)
 
-    df_dependencies["Dependencies"] = field_dependencies
+    # The variables referenced by the skip logic, without any `(...)` suffix
+    # such as the checkbox option of `[var(1)]`
+    field_dependencies = [
+        [reference.split("(", 1)[0] for reference in references]
+        if isinstance(references, list)
+        else []
+        for references in df_dependencies["Skip Logic"]
+        .astype(object)
+        .str.findall(_SKIP_LOGIC_REFERENCE_PATTERN)
+    ]
+
+    # The first row of each variable, which any dependencies are added to
+    variable_positions = {}
+    for position, variable in enumerate(df_dependencies["Variable"]):
+        variable_positions.setdefault(variable, position)
+
     for variable in df_dependencies["Variable"]:
-        if "other" in variable:
-            if (
-                len(
-                    df_dependencies["Dependencies"].loc[
-                        df_dependencies["Variable"] == variable.replace("other", "")
-                    ]
-                )
-                >= 1
-            ):
-                df_dependencies["Dependencies"].loc[
-                    df_dependencies["Variable"] == variable.replace("other", "")
-                ].iloc[0].append(variable)
-
-        if "units" in variable:
-            if (
-                len(
-                    df_dependencies["Dependencies"].loc[
-                        df_dependencies["Variable"] == variable.replace("units", "")
-                    ]
-                )
-                >= 1
-            ):
-                df_dependencies["Dependencies"].loc[
-                    df_dependencies["Variable"] == variable.replace("units", "")
-                ].iloc[0].append(variable)
-
-        for mandatory_variable in mandatory:
-            df_dependencies["Dependencies"].loc[
-                df_dependencies["Variable"] == variable
-            ].iloc[0].append(mandatory_variable)
+        # The "other" and "units" fields depend on their parent field
+        for suffix in ("other", "units"):
+            if suffix in variable:
+                parent_position = variable_positions.get(variable.replace(suffix, ""))
+                if parent_position is not None:
+                    field_dependencies[parent_position].append(variable)
+
+        field_dependencies[variable_positions[variable]].extend(mandatory)
 
+    df_dependencies["Dependencies"] = field_dependencies
     return df_dependencies
 
 
+class _RowSplicer:
+    """The order of the data dictionary rows as transformed rows are added.
+
+    The rows are kept in a linked list of nodes, each pointing to the position
+    of its row in the original rows followed by the transformed rows, so rows
+    are inserted in constant time, and the dataframe is only assembled once
+    at the end. Each node also has a sort key, so that the positions of two
+    rows can be compared without walking the list: a node inserted after
+    another gets its key extended with a decreasing counter, so that it sorts
+    after it, and before the nodes inserted after it earlier.
+    """
+
+    _HEAD = 0
+    _END = -1
+
+    def __init__(self, variables: list, variable_order: list) -> None:
+        node_count = len(variables) + 1
+        self._original_row_count = len(variables)
+        # The positions of the transformed rows replacing original rows, by
+        # the positions of the original rows
+        self.replaced_rows: dict[int, int] = {}
+        self._row_positions = [None, *range(len(variables))]
+        self._keys = [(), *((position,) for position in range(len(variables)))]
+        self._next = [*range(1, node_count), self._END]
+        self._previous = [self._END, *range(node_count - 1)]
+        self._tail = node_count - 1
+        self._insert_counts = [0] * node_count
+
+        self._first_nodes = {}
+        self._last_nodes = {}
+        for node, variable in enumerate(variables, start=1):
+            self._first_nodes.setdefault(variable, node)
+            self._last_nodes[variable] = node
+        self._sorted_variables = sorted(
+            variable for variable in self._first_nodes if isinstance(variable, str)
+        )
+
+        self._variable_order = variable_order
+        self._order_positions = {}
+        for position, variable in enumerate(variable_order):
+            self._order_positions.setdefault(variable, []).append(position)
+        # The positions in the variable order of the variables with a row
+        self._present_order_positions = [
+            position
+            for position, variable in enumerate(variable_order)
+            if variable in self._first_nodes
+        ]
+
+    def add(self, variable: str, row_position: int) -> None:
+        """Adds a transformed row, replacing the row of its variable if any."""
+        node = self._first_nodes.get(variable)
+        if node is not None:
+            if node <= self._original_row_count:
+                self.replaced_rows[self._row_positions[node]] = row_position
+            else:
+                self._row_positions[node] = row_position
+            return
+
+        # The base variable name, i.e. without the part after the last underscore
+        base_variable = "_".join(variable.split("_")[:-1])
+        if base_variable in self._first_nodes:
+            # After the last row of a variable starting with the base variable
+            previous_node = max(
+                (
+                    self._last_nodes[prefixed_variable]
+                    for prefixed_variable in self._get_variables_with_prefix(
+                        base_variable
+                    )
+                ),
+                key=self._keys.__getitem__,
+            )
+        elif variable in self._order_positions:
+            # Before the next variable in the variable order that has a row
+            next_index = bisect_right(
+                self._present_order_positions, self._order_positions[variable][0]
+            )
+            if next_index < len(self._present_order_positions):
+                next_variable = self._variable_order[
+                    self._present_order_positions[next_index]
+                ]
+                previous_node = self._previous[self._first_nodes[next_variable]]
+            else:
+                previous_node = self._tail
+        else:
+            previous_node = self._tail
+
+        self._insert_after(previous_node, variable, row_position)
+
+    def _get_variables_with_prefix(self, prefix: str) -> Iterator[str]:
+        index = bisect_left(self._sorted_variables, prefix)
+        while index < len(self._sorted_variables) and self._sorted_variables[
+            index
+        ].startswith(prefix):
+            yield self._sorted_variables[index]
+            index += 1
+
+    def _insert_after(
+        self, previous_node: int, variable: str, row_position: int
+    ) -> None:
+        node = len(self._next)
+        next_node = self._next[previous_node]
+        self._insert_counts[previous_node] += 1
+
+        self._row_positions.append(row_position)
+        self._keys.append(
+            self._keys[previous_node] + (-self._insert_counts[previous_node],)
+        )
+        self._next.append(next_node)
+        self._previous.append(previous_node)
+        self._insert_counts.append(0)
+        self._next[previous_node] = node
+        if next_node == self._END:
+            self._tail = node
+        else:
+            self._previous[next_node] = node
+
+        self._first_nodes[variable] = node
+        self._last_nodes[variable] = node
+        if isinstance(variable, str):
+            insort(self._sorted_variables, variable)
+        for position in self._order_positions.get(variable, []):
+            insort(self._present_order_positions, position)
+
+    def get_row_positions(self) -> list[int]:
+        row_positions = []
+        node = self._next[self._HEAD]
+        while node != self._END:
+            row_positions.append(self._row_positions[node])
+            node = self._next[node]
+        return row_positions
+
+
+def _cast_missing_columns(df: pd.DataFrame, df_other: pd.DataFrame) -> pd.DataFrame:
+    # Object and float columns of only missing values are ignored by
+    # `pd.concat` when picking the dtype of the result, if the columns they're
+    # concatenated with have values, but it warns that this will change. So
+    # they're replaced with missing values of the dtype they would get, where
+    # it can hold missing values. Integer and boolean columns become object
+    # columns either way.
+    missing_columns = {}
+    for column in df.columns.intersection(df_other.columns):
+        dtype = df_other[column].dtype
+        if (
+            df[column].dtype != dtype
+            and df[column].dtype.kind in "fO"
+            and (
+                isinstance(dtype, pd.api.extensions.ExtensionDtype)
+                or dtype.kind in "fcmM"
+            )
+            and df[column].isna().all()
+            and not df_other[column].isna().all()
+        ):
+            missing_columns[column] = pd.Series(index=df.index, dtype=dtype)
+    if not missing_columns:
+        return df
+    return df.assign(**missing_columns)
+
+
+def _replace_column_values(
+    df: pd.DataFrame, column_index: int, positions: list, values: pd.Series
+) -> None:
+    # Missing values are set one kind at a time, as scalars, so that e.g. None
+    # is set as NaN in a float column, and the other values with their
+    # inferred dtype, so that e.g. floats in an object column are set in a
+    # float column without making it an object column, as `df.at` would
+    positions = np.asarray(positions)
+    null_mask = values.isna().to_numpy()
+    if not null_mask.all():
+        df.iloc[positions[~null_mask], column_index] = (
+            values[~null_mask].infer_objects().to_numpy(copy=True)
+        )
+    null_values = values[null_mask].tolist()
+    for null_type in dict.fromkeys(map(type, null_values)):
+        null_positions = [
+            position
+            for position, null_value in zip(positions[null_mask], null_values)
+            if type(null_value) is null_type
+        ]
+        df.iloc[null_positions, column_index] = next(
+            null_value for null_value in null_values if type(null_value) is null_type
+        )
+
+
 def add_transformed_rows(
     df_selected: pd.DataFrame,
     df_selected_units: pd.DataFrame,
     variable_order: list,
 ) -> pd.DataFrame:
+    """:py:class:`pandas.DataFrame` : Adds transformed rows to a data dictionary.
+
+    The transformed rows, e.g. expanded lists or units, are added in order.
+    A row replaces the row of its variable, if there is one. Otherwise it is
+    inserted after the last row of a variable starting with its base variable,
+    i.e. its variable without the part after the last underscore, if the base
+    variable has a row. Otherwise it is inserted before the next variable in
+    the variable order that has a row, or appended.
+
+    Parameters
+    ----------
+    df_selected : pandas.DataFrame
+        The data dictionary.
+    df_selected_units : pandas.DataFrame
+        The transformed rows.
+    variable_order : list
+        The order of the variables, as ``Sec_vari`` values.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The data dictionary with the transformed rows.
+    """
     df_output = df_selected.copy().reset_index(drop=True)
 
     df_selected_units["Sec_vari"] = (
@@ -160,78 +385,52 @@ def add_transformed_rows(
     )
     df_selected_units = df_selected_units[df_output.columns]
 
-    for _, row in df_selected_units.iterrows():
-        variable = row["Variable"]
-
-        if variable in df_output["Variable"].values:
-            # Get the index for the matching variable in the result DataFrame
-            match_index = df_output.index[df_output["Variable"] == variable].tolist()[0]
-            # Update each column separately
-            for col in df_output.columns:
-                df_output.at[match_index, col] = row[col]
-
-        else:
-            # Identify the base variable name by splitting at the last underscore
-            base_var = "_".join(variable.split("_")[:-1])
-
-            if base_var in df_output["Variable"].values:
-                # Find the index of the base variable row
-                base_index = df_output.index[
-                    df_output["Variable"].str.startswith(base_var)
-                ].max()
-                df_row = pd.DataFrame([row]).reset_index(drop=True)
-                # Insert the new row immediately after the base variable row
-                df_output = pd.concat(
-                    [
-                        df_output.iloc[: base_index + 1],
-                        df_row,
-                        df_output.iloc[base_index + 1 :],
-                    ]
-                ).reset_index(drop=True)
-
-            else:
-                # Variable to be added is not based on the base variable, use the order list
-                variable_to_add = variable
-                order_index = (
-                    variable_order.index(variable_to_add)
-                    if variable_to_add in variable_order
-                    else None
-                )
-
-                if order_index is not None:
-                    # Find the next existing variable in 'result' from 'order'
-                    insert_before_index = None
-                    for next_variable in variable_order[order_index + 1 :]:
-                        if next_variable in df_output["Variable"].values:
-                            insert_before_index = df_output.index[
-                                df_output["Variable"] == next_variable
-                            ][0]
-                            break
-
-                    # Create a DataFrame from the current row
-                    df_row = pd.DataFrame([row]).reset_index(drop=True)
-
-                    # Insert the row at the determined position or append if no next variable is found
-                    if insert_before_index is not None:
-                        df_output = pd.concat(
-                            [
-                                df_output.iloc[:insert_before_index],
-                                df_row,
-                                df_output.iloc[insert_before_index:],
-                            ]
-                        ).reset_index(drop=True)
-
-                    else:
-                        df_output = pd.concat([df_output, df_row]).reset_index(
-                            drop=True
-                        )
-
-                else:
-                    # If the variable is not in the order list, append it at the end (or handle as needed)
-                    df_row = pd.DataFrame([row]).reset_index(drop=True)
-                    df_output = pd.concat([df_output, df_row]).reset_index(drop=True)
-
-    return df_output
+    row_splicer = _RowSplicer(df_output["Variable"].tolist(), variable_order)
+    for units_position, variable in enumerate(df_selected_units["Variable"]):
+        row_splicer.add(variable, len(df_output) + units_position)
+
+    # Replace the rows in place first, so the column dtypes are the same as if
+    # the rows were replaced and inserted one at a time
+    if row_splicer.replaced_rows:
+        output_positions = list(row_splicer.replaced_rows)
+        units_positions = [
+            units_position - len(df_output)
+            for units_position in row_splicer.replaced_rows.values()
+        ]
+        for column_index, column in enumerate(df_output.columns):
+            _replace_column_values(
+                df_output,
+                column_index,
+                output_positions,
+                df_selected_units[column].iloc[units_positions],
+            )
+
+    # Only the inserted rows are concatenated, so the replacing rows don't
+    # change the column dtypes
+    row_positions = row_splicer.get_row_positions()
+    inserted_positions = [
+        row_position for row_position in row_positions if row_position >= len(df_output)
+    ]
+    if not inserted_positions:
+        return df_output.take(row_positions).reset_index(drop=True)
+    df_inserted = df_selected_units.iloc[
+        [inserted_position - len(df_output) for inserted_position in inserted_positions]
+    ]
+    inserted_row_positions = dict(
+        zip(
+            inserted_positions, range(len(df_output), len(df_output) + len(df_inserted))
+        )
+    )
+    df_rows = pd.concat(
+        [df_output, _cast_missing_columns(df_inserted, df_output)],
+        ignore_index=True,
+    )
+    return df_rows.take(
+        [
+            inserted_row_positions.get(row_position, row_position)
+            for row_position in row_positions
+        ]
+    ).reset_index(drop=True)
 
 
 def get_dynamic_units_conversion_bool(version: str) -> bool:
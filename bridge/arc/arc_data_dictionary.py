@@ -0,0 +1,97 @@
+from collections.abc import Hashable, Iterable
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def _get_positions(keys: Iterable[Hashable]) -> dict[Hashable, list[int]]:
+    positions = {}
+    for position, key in enumerate(keys):
+        # Missing values never match a comparison with `==`, so aren't indexed
+        if isinstance(key, tuple):
+            if any(pd.isna(part) for part in key):
+                continue
+        elif pd.isna(key):
+            continue
+        positions.setdefault(key, []).append(position)
+    return positions
+
+
+class DataDictionary:
+    """An ARC data dictionary, indexed by variable and by section and variable.
+
+    Looking up the rows of a variable with ``df["Variable"] == variable``
+    scans the whole dataframe, so doing it for every variable in a callback is
+    quadratic. The indexes here map each variable, and each ``Sec`` and
+    ``vari`` pair, to the positions of their rows, and are each built once, on
+    first use, so lookups take constant time.
+
+    The indexes are only valid while the rows of the dataframe are neither
+    added, removed nor reordered. Values can be changed, in place, with
+    ``set_value``.
+    """
+
+    def __init__(self, df_datadicc: pd.DataFrame) -> None:
+        self.df = df_datadicc
+
+    @cached_property
+    def _variable_positions(self) -> dict[Hashable, list[int]]:
+        return _get_positions(self.df["Variable"])
+
+    @cached_property
+    def _sec_vari_positions(self) -> dict[Hashable, list[int]]:
+        return _get_positions(zip(self.df["Sec"], self.df["vari"]))
+
+    def __contains__(self, variable: str) -> bool:
+        return variable in self._variable_positions
+
+    def get_positions(self, variable: str) -> list[int]:
+        """:py:class:`list` : Returns the positions of the rows of a variable."""
+        return self._variable_positions.get(variable, [])
+
+    def get_sec_vari_positions(self, sec: str, vari: str) -> list[int]:
+        """:py:class:`list` : Returns the positions of the rows of a section and variable."""
+        return self._sec_vari_positions.get((sec, vari), [])
+
+    def get_rows(self, variable: str) -> pd.DataFrame:
+        """:py:class:`pandas.DataFrame` : Returns the rows of a variable."""
+        return self.df.iloc[self.get_positions(variable)]
+
+    def get_row(self, variable: str) -> pd.Series | None:
+        """:py:class:`pandas.Series` : Returns the first row of a variable, if any."""
+        positions = self._variable_positions.get(variable)
+        if positions is None:
+            return None
+        return self.df.iloc[positions[0]]
+
+    def get_value(self, variable: str, column: str, default: Any = None) -> Any:
+        """Returns a column value of the first row of a variable, if any."""
+        positions = self._variable_positions.get(variable)
+        if positions is None:
+            return default
+        return self.df[column].iat[positions[0]]
+
+    def get_sec_vari_rows(self, sec: str, vari: str) -> pd.DataFrame:
+        """:py:class:`pandas.DataFrame` : Returns the rows of a section and variable.
+
+        These are the rows of a question, e.g. ``labs_glucose``, and its other
+        and units variables, e.g. ``labs_glucose_units``, in their order in the
+        data dictionary.
+        """
+        return self.df.iloc[self.get_sec_vari_positions(sec, vari)]
+
+    def set_value(self, variable: str, column: str, value: Any) -> None:
+        """Sets a column value of all the rows of a variable, if any.
+
+        As with ``df.loc``, the column is added if it doesn't exist.
+        """
+        positions = self.get_positions(variable)
+        if column in self.df.columns:
+            if positions:
+                self.df.iloc[positions, self.df.columns.get_loc(column)] = value
+        else:
+            mask = np.zeros(len(self.df), dtype=bool)
+            mask[positions] = True
+            self.df.loc[mask, column] = value
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import re
+from pathlib import Path
+from time import time
+
+import pandas as pd
+
+from bridge.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Bump this if the on-disk entry format changes, so old entries are ignored.
+_DISK_CACHE_FORMAT_VERSION = "1"
+
+_COMMIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+
+class ArcDiskCache:
+    """A persistent, content-addressed on-disk cache for ARC downloads.
+
+    Entries are addressed by a hash of the GitHub repository, the Git ref and
+    the path of the file within the repository, so a file downloaded for a
+    given commit SHA can be reused by every worker process, and across
+    restarts, without going back to GitHub. Entries for mutable refs, such as
+    ``main``, are only considered fresh for ``mutable_ref_ttl_seconds``.
+
+    The total size of the cache directory is capped at ``max_bytes``, with
+    the least recently used entries evicted first.
+
+    Entries are pickled, and loading a pickle can run arbitrary code, so the
+    cache directory must only be writable by the user the app runs as.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_bytes: int,
+        mutable_ref_ttl_seconds: int,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.mutable_ref_ttl_seconds = mutable_ref_ttl_seconds
+
+    @staticmethod
+    def is_commit_sha(ref: str) -> bool:
+        return bool(_COMMIT_SHA_PATTERN.match(str(ref)))
+
+    @staticmethod
+    def get_entry_key(repo: str, ref: str, path: str) -> str:
+        key_string = "|".join(
+            [_DISK_CACHE_FORMAT_VERSION, pd.__version__, repo, ref, path]
+        )
+        return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+
+    def get_entry_path(self, repo: str, ref: str, path: str) -> Path:
+        entry_key = self.get_entry_key(repo, ref, path)
+        return self.cache_dir.joinpath(entry_key[:2], f"{entry_key}.pkl")
+
+    def get(self, repo: str, ref: str, path: str) -> pd.DataFrame | None:
+        entry_path = self.get_entry_path(repo, ref, path)
+        try:
+            entry_stat = entry_path.stat()
+        except FileNotFoundError:
+            return None
+
+        if (
+            not self.is_commit_sha(ref)
+            and time() - entry_stat.st_mtime >= self.mutable_ref_ttl_seconds
+        ):
+            return None
+
+        try:
+            df = pd.read_pickle(entry_path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable ARC disk cache entry: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        # Update the access time only, which is used for LRU eviction, so that
+        # the modification time still records when the entry was downloaded
+        os.utime(entry_path, (time(), entry_stat.st_mtime))
+        return df
+
+    def set(self, repo: str, ref: str, path: str, df: pd.DataFrame) -> None:
+        entry_path = self.get_entry_path(repo, ref, path)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers in other
+            # worker processes never see a partially written entry
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            logger.warning(f"Failed to write ARC disk cache entry: {e}")
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total_bytes = 0
+        for entry_path in self.cache_dir.glob("*/*.pkl"):
+            try:
+                entry_stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((entry_stat.st_atime, entry_stat.st_size, entry_path))
+            total_bytes += entry_stat.st_size
+
+        if total_bytes <= self.max_bytes:
+            return
+
+        for _, entry_size, entry_path in sorted(entries):
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= entry_size
+            if total_bytes <= self.max_bytes:
+                break
+
+    def clear(self) -> None:
+        for entry_path in self.cache_dir.glob("*/*.pkl"):
+            entry_path.unlink(missing_ok=True)
@@ -1,21 +1,35 @@
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from os import getenv
+from time import perf_counter
+from typing import Any, List, Tuple
 
 import pandas as pd
 
 from bridge.arc import arc_translations
-from bridge.arc.arc_api import ArcApiClient
+from bridge.arc.arc_api import ArcApiClient, ArcApiClientError
+from bridge.arc.arc_cache import get_dataframe_view
+from bridge.arc.arc_data_dictionary import DataDictionary
 from bridge.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 ARROWS = ["", ">", "->", ">->", "->->", ">->->"]
 
+LIST_TYPES = ["list", "user_list", "multi_list"]
+
+# 88 and 99 are reserved for the "Other" and "Unknown" answer options
+_LIST_OPTION_NUMBER_REMAPPING = {88: 89, 99: 100}
+
+# Maximum number of list CSVs downloaded concurrently when prefetching
+ARC_LIST_PREFETCH_MAX_WORKERS = int(getenv("ARC_LIST_PREFETCH_MAX_WORKERS", "8"))
+
 
 class ArcList:
     def __init__(self, version: str, language: str):
         self.version = version
         self.language = language
         self._list_df_cache: dict[str, pd.DataFrame] = {}
+        self._list_option_numbers_cache: dict[str, list[int]] = {}
 
     def _get_list_options_df(self, list_name: str) -> pd.DataFrame:
         normalized_list_name = str(list_name).replace("_", "/")
@@ -27,24 +41,101 @@ class ArcList:
                     normalized_list_name,
                 )
             )
-        return self._list_df_cache[normalized_list_name].copy(deep=True)
+        return get_dataframe_view(self._list_df_cache[normalized_list_name])
+
+    def prefetch_list_options(self, df_datadicc: pd.DataFrame) -> None:
+        """Download the options of every list in the data dictionary concurrently.
+
+        The list option dataframes are otherwise fetched lazily, one at a
+        time, during the list expansions. Any list that fails to download here
+        is left to be fetched (and to fail) lazily, as before.
+
+        Parameters
+        ----------
+        df_datadicc : pandas.DataFrame
+            The data dictionary, with ``Type`` and ``List`` columns.
+        """
+        list_names = (
+            df_datadicc.loc[df_datadicc["Type"].isin(LIST_TYPES), "List"]
+            .dropna()
+            .astype(str)
+            .str.replace("_", "/")
+            .unique()
+        )
+        list_names = [
+            list_name
+            for list_name in list_names
+            if list_name not in self._list_df_cache
+        ]
+        if not list_names:
+            return
+
+        prefetch_start = perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=min(ARC_LIST_PREFETCH_MAX_WORKERS, len(list_names))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    ArcApiClient().get_dataframe_arc_list_version_language,
+                    self.version,
+                    self.language,
+                    list_name,
+                ): list_name
+                for list_name in list_names
+            }
+            for future in as_completed(futures):
+                list_name = futures[future]
+                try:
+                    self._list_df_cache[list_name] = future.result()
+                except ArcApiClientError as e:
+                    logger.warning(f"Failed to prefetch list '{list_name}': {e}")
+
+        logger.debug(
+            "arc_lists.prefetch_list_options version=%s language=%s lists=%s elapsed_ms=%.3f",
+            self.version,
+            self.language,
+            len(list_names),
+            (perf_counter() - prefetch_start) * 1000,
+        )
+
+    def _get_list_options_numbered(self, list_name: str) -> list[tuple[int, Any]]:
+        """:py:class:`list` : Returns the number and name of each option of a list.
+
+        The option numbers are computed once per list, and cached alongside
+        the list options dataframe.
+        """
+        df_list_options = self._get_list_options_df(list_name)
+        normalized_list_name = str(list_name).replace("_", "/")
+        if normalized_list_name not in self._list_option_numbers_cache:
+            self._list_option_numbers_cache[normalized_list_name] = (
+                self._get_list_option_numbers(df_list_options)
+            )
+        return list(
+            zip(
+                self._list_option_numbers_cache[normalized_list_name],
+                df_list_options[df_list_options.columns[0]],
+            )
+        )
 
     def _get_list_choices(
         self, datadicc_row: pd.Series, other_text: str
     ) -> Tuple[str, list]:
-        df_list_options = self._get_list_options_df(str(datadicc_row["List"]))
-
-        list_choices = ""
-        list_variable_choices_aux = []
+        list_options_numbered = self._get_list_options_numbered(
+            str(datadicc_row["List"])
+        )
 
-        for list_option in df_list_options[df_list_options.columns[0]]:
-            cont_lo = self._get_list_option_number(df_list_options, str(list_option))
-            try:
-                list_variable_choices_aux.append([cont_lo, list_option])
-                list_choices += f"{str(cont_lo)}, {str(list_option)} | "
-            except Exception as e:
-                logger.error(e)
-                raise RuntimeError("Failed to determine list choices")
+        try:
+            list_variable_choices_aux = [
+                [list_option_number, list_option]
+                for list_option_number, list_option in list_options_numbered
+            ]
+            list_choices = "".join(
+                f"{str(list_option_number)}, {str(list_option)} | "
+                for list_option_number, list_option in list_options_numbered
+            )
+        except Exception as e:
+            logger.error(e)
+            raise RuntimeError("Failed to determine list choices")
 
         list_choices = f"{list_choices}88, {other_text}"
 
@@ -196,37 +287,35 @@ class ArcList:
     def _append_updated_other_info_list_content(
         datadicc_row: pd.Series,
         iteration_number: int,
-        df_other_info: pd.DataFrame,
+        other_info_rows: list[dict],
         questions_for_this_list: list,
     ) -> List:
         skip_logic_variable = f'{datadicc_row['Sec']}_{datadicc_row['vari']}_{str(iteration_number)}addi'.replace(
             str(iteration_number), str(iteration_number - 1)
         )
 
-        if len(df_other_info) > 1:
-            for index, other_info_row in df_other_info.iterrows():
-                other_info_row_updated = other_info_row.copy()
-                if iteration_number == 0:
-                    question_text = (
-                        f'{ARROWS[iteration_number]} {datadicc_row['Question']}'
-                    )
-                else:
-                    question_text = f'{ARROWS[iteration_number]} {datadicc_row['Question']} {str(iteration_number + 1)}'
-                other_info_row_updated["Question"] = question_text
-                other_info_row_updated["Variable"] = (
-                    f'{datadicc_row['Sec']} {datadicc_row['vari']}_{str(iteration_number)}{datadicc_row['mod']}'
-                )
-                other_info_row_updated["Skip Logic"] = f"[{skip_logic_variable}]='1'"
-                other_info_row_updated["List"] = None
-                other_info_row_updated["mod"] = (
-                    f'{str(iteration_number)}{datadicc_row['mod']}'
-                )
-                other_info_row_updated["vari"] = datadicc_row["vari"]
-                questions_for_this_list.append(other_info_row_updated)
+        if len(other_info_rows) > 1:
+            if iteration_number == 0:
+                question_text = f'{ARROWS[iteration_number]} {datadicc_row['Question']}'
+            else:
+                question_text = f'{ARROWS[iteration_number]} {datadicc_row['Question']} {str(iteration_number + 1)}'
+            # All the rows get the same values
+            updated_values = {
+                "Question": question_text,
+                "Variable": f'{datadicc_row['Sec']} {datadicc_row['vari']}_{str(iteration_number)}{datadicc_row['mod']}',
+                "Skip Logic": f"[{skip_logic_variable}]='1'",
+                "List": None,
+                "mod": f'{str(iteration_number)}{datadicc_row['mod']}',
+                "vari": datadicc_row["vari"],
+            }
+            questions_for_this_list.extend(
+                {**other_info_row, **updated_values}
+                for other_info_row in other_info_rows
+            )
 
-        elif len(df_other_info) == 1:
-            other_info_row = df_other_info.iloc[0]
-            other_info_row_updated = other_info_row.copy()
+        elif len(other_info_rows) == 1:
+            other_info_row = other_info_rows[0]
+            other_info_row_updated = dict(other_info_row)
             if iteration_number == 0:
                 other_info_row_updated["Question"] = (
                     f'{ARROWS[iteration_number]}{other_info_row['Question']}'
@@ -277,10 +366,11 @@ class ArcList:
             additional_row["List"] = None
             additional_row["mod"] = f"{str(iteration_number)}addi"
             additional_row["vari"] = datadicc_row["vari"]
-            questions_for_this_list.append(additional_row)
+            questions_for_this_list.append(additional_row.to_dict())
         return questions_for_this_list
 
     def get_list_content(self, df_datadicc: pd.DataFrame) -> tuple[pd.DataFrame, list]:
+        # The rows are collected as dicts, and made into a dataframe at the end
         all_rows_lists = []
         list_variable_choices = []
         df_datadicc_lists = df_datadicc.loc[df_datadicc["Type"] == "list"]
@@ -296,6 +386,8 @@ class ArcList:
         any_additional_text = translations_for_language["any_additional"]
         other_text = translations_for_language["other"]
 
+        data_dictionary = DataDictionary(df_datadicc)
+
         for _, datadicc_row in df_datadicc_lists.iterrows():
             if pd.isnull(datadicc_row["List"]):
                 logger.warning("List without corresponding repository file")
@@ -305,6 +397,15 @@ class ArcList:
                     datadicc_row, other_text
                 )
 
+                # The other rows of the question, e.g. its units, copied for
+                # each iteration
+                df_sec_vari = data_dictionary.get_sec_vari_rows(
+                    datadicc_row["Sec"], datadicc_row["vari"]
+                )
+                other_info_rows = df_sec_vari.loc[
+                    df_sec_vari["Variable"] != datadicc_row["Variable"]
+                ].to_dict("records")
+
                 iteration_total = 5
                 questions_for_this_list = []
 
@@ -326,20 +427,14 @@ class ArcList:
                         specify_other_infection_text,
                     )
 
-                    questions_for_this_list.append(dropdown_row)
-                    questions_for_this_list.append(other_row)
-
-                    other_info = df_datadicc.loc[
-                        (df_datadicc["Sec"] == datadicc_row["Sec"])
-                        & (df_datadicc["vari"] == datadicc_row["vari"])
-                        & (df_datadicc["Variable"] != datadicc_row["Variable"])
-                    ]
+                    questions_for_this_list.append(dropdown_row.to_dict())
+                    questions_for_this_list.append(other_row.to_dict())
 
                     questions_for_this_list = (
                         self._append_updated_other_info_list_content(
                             datadicc_row,
                             iteration_number,
-                            other_info,
+                            other_info_rows,
                             questions_for_this_list,
                         )
                     )
@@ -355,10 +450,8 @@ class ArcList:
                         )
                     )
 
-                all_rows_lists.append(datadicc_row)
-
-                for question_for_this_list in questions_for_this_list:
-                    all_rows_lists.append(question_for_this_list)
+                all_rows_lists.append(datadicc_row.to_dict())
+                all_rows_lists.extend(questions_for_this_list)
 
                 list_variable_choices.append(
                     [datadicc_row["Variable"], list_variable_choices_aux]
@@ -368,6 +461,41 @@ class ArcList:
 
         return df_arc_list, list_variable_choices
 
+    @staticmethod
+    def _get_list_option_numbers(df_list_options: pd.DataFrame) -> list[int]:
+        """:py:class:`list` : Returns the number of every option of a list, in order.
+
+        These are the same as ``_get_list_option_number`` returns for each
+        option, but computed in a single pass rather than a scan of the list
+        per option: the ``Value`` of the first row with the option's name, or
+        else its position, with 88 and 99 remapped to 89 and 100.
+        """
+        list_options = df_list_options[df_list_options.columns[0]].tolist()
+
+        first_positions = {}
+        for position, list_option in enumerate(list_options):
+            if isinstance(list_option, str):
+                first_positions.setdefault(list_option, position)
+        positions = []
+        for list_option in list_options:
+            position = first_positions.get(str(list_option))
+            if position is None:
+                # Raises the same error as looking up the option by its name
+                ArcList._get_list_option_number(df_list_options, str(list_option))
+            positions.append(position)
+
+        if "Value" in df_list_options.columns:
+            values = df_list_options["Value"].tolist()
+            list_option_numbers = [int(values[position]) for position in positions]
+        else:
+            # fallback to index-based counting
+            list_option_numbers = [position + 1 for position in positions]
+
+        return [
+            _LIST_OPTION_NUMBER_REMAPPING.get(list_option_number, list_option_number)
+            for list_option_number in list_option_numbers
+        ]
+
     @staticmethod
     def _get_list_option_number(df_list_options: pd.DataFrame, list_option: str) -> int:
         if "Value" in df_list_options.columns:
@@ -385,11 +513,7 @@ class ArcList:
                 + 1
             )
 
-        if list_option_number == 88:
-            list_option_number = 89
-        elif list_option_number == 99:
-            list_option_number = 100
-        return list_option_number
+        return _LIST_OPTION_NUMBER_REMAPPING.get(list_option_number, list_option_number)
 
     @staticmethod
     def _get_list_data_dropdown_other_rows(
@@ -455,45 +579,51 @@ class ArcList:
                 logger.warning("List without corresponding repository file")
             else:
                 df_list_options = self._get_list_options_df(str(row["List"]))
+                list_options_numbered = self._get_list_options_numbered(
+                    str(row["List"])
+                )
 
                 l2_choices = ""
                 l1_choices = ""
                 list_variable_choices_aux = []
-                for list_option in df_list_options[df_list_options.columns[0]]:
-                    list_option_number = self._get_list_option_number(
-                        df_list_options, str(list_option)
-                    )
-                    try:
-                        df_list_options["Selected"] = pd.to_numeric(
-                            df_list_options["Selected"], errors="coerce"
-                        )
-
-                        selected_value = (
-                            df_list_options["Selected"]
-                            .loc[
-                                df_list_options[df_list_options.columns[0]]
-                                == list_option
-                            ]
-                            .iloc[0]
-                        )
+                try:
+                    selected_values = pd.to_numeric(
+                        df_list_options["Selected"], errors="coerce"
+                    ).tolist()
+                    # The selected value of an option is that of its first row
+                    selected_positions = {}
+                    for position, list_option in enumerate(
+                        df_list_options[df_list_options.columns[0]]
+                    ):
+                        if not pd.isna(list_option):
+                            selected_positions.setdefault(list_option, position)
+
+                    l1_choices_list = []
+                    l2_choices_list = []
+                    for list_option_number, list_option in list_options_numbered:
+                        selected_value = selected_values[
+                            selected_positions[list_option]
+                        ]
 
                         choices_text = (
                             f"{str(list_option_number)}, {str(list_option)} | "
                         )
                         if selected_value == 1:
-                            l1_choices += choices_text
+                            l1_choices_list.append(choices_text)
                             list_variable_choices_aux.append(
                                 [list_option_number, list_option, 1]
                             )
                         else:
-                            l2_choices += choices_text
+                            l2_choices_list.append(choices_text)
                             list_variable_choices_aux.append(
                                 [list_option_number, list_option, 0]
                             )
+                    l1_choices = "".join(l1_choices_list)
+                    l2_choices = "".join(l2_choices_list)
 
-                    except Exception as e:
-                        logger.error(e)
-                        raise RuntimeError("Failed to add to lists of choices")
+                except Exception as e:
+                    logger.error(e)
+                    raise RuntimeError("Failed to add to lists of choices")
 
                 list_variable_choices.append(
                     [row["Variable"], list_variable_choices_aux]
@@ -530,3 +660,80 @@ class ArcList:
         )
         df_arc_list = pd.DataFrame(all_rows_lists).reset_index(drop=True)
         return df_arc_list, multilist_variable_choices
+
+    def get_all_list_content(
+        self, df_datadicc: pd.DataFrame
+    ) -> tuple[pd.DataFrame, list, list, list]:
+        """:py:class:`tuple` : Expands the lists, user lists and multi-lists together.
+
+        The expansions give the same rows and choices as expanding the lists,
+        then the user lists and then the multi-lists, each from the data
+        dictionary with the rows of the previous expansions added, but the
+        rows of all three are returned together, so they can be added to the
+        data dictionary at once, with a single ``add_transformed_rows``.
+
+        Parameters
+        ----------
+        df_datadicc : pandas.DataFrame
+            The data dictionary.
+
+        Returns
+        -------
+        tuple
+            A tuple of the rows of all the expansions (as a dataframe), and
+            the list, user list and multi-list choices.
+        """
+        df_arc_lists, list_variable_choices = self.get_list_content(df_datadicc)
+
+        # The rows an expansion replaces are seen by the later expansions,
+        # but the rows it inserts are new variables with no list, so the later
+        # expansions would skip them anyway
+        df_datadicc = _replace_rows(df_datadicc, df_arc_lists)
+        df_ulist, ulist_variable_choices = self.get_user_list_content(df_datadicc)
+
+        df_datadicc = _replace_rows(df_datadicc, df_ulist)
+        df_multilist, multilist_variable_choices = self.get_multi_list_content(
+            df_datadicc
+        )
+
+        df_all_lists = [
+            df_list
+            for df_list in (df_arc_lists, df_ulist, df_multilist)
+            if not df_list.empty
+        ]
+        df_all_lists = (
+            pd.concat(df_all_lists, ignore_index=True)
+            if df_all_lists
+            else pd.DataFrame()
+        )
+        return (
+            df_all_lists,
+            list_variable_choices,
+            ulist_variable_choices,
+            multilist_variable_choices,
+        )
+
+
+def _replace_rows(df_datadicc: pd.DataFrame, df_rows: pd.DataFrame) -> pd.DataFrame:
+    # Replaces the first row of each variable with its last row in `df_rows`,
+    # as `add_transformed_rows` does
+    if df_rows.empty:
+        return df_datadicc
+    data_dictionary = DataDictionary(df_datadicc)
+    replaced_rows = {}
+    for rows_position, variable in enumerate(df_rows["Variable"]):
+        positions = data_dictionary.get_positions(variable)
+        if positions:
+            replaced_rows[positions[0]] = rows_position
+    if not replaced_rows:
+        return df_datadicc
+
+    df_datadicc = df_datadicc.copy()
+    datadicc_positions = list(replaced_rows)
+    rows_positions = list(replaced_rows.values())
+    for column_index, column in enumerate(df_datadicc.columns):
+        if column in df_rows.columns:
+            df_datadicc.iloc[datadicc_positions, column_index] = (
+                df_rows[column].iloc[rows_positions].to_numpy()
+            )
+    return df_datadicc
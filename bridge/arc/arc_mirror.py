@@ -0,0 +1,186 @@
+import json
+import tarfile
+from collections.abc import Callable, MutableMapping
+from pathlib import Path
+
+import pandas as pd
+from requests.exceptions import RequestException
+
+from bridge.arc.arc_api import (
+    ARC_MIRROR_API_DIR,
+    ARC_MIRROR_RAW_DIR,
+    GITHUB_API_URL,
+    GITHUB_RAW_CONTENT_URL,
+    ArcApiClient,
+    ArcApiClientError,
+)
+from bridge.arc.arc_shared_cache import ArcSharedCache
+from bridge.arc.arc_lists import LIST_TYPES
+from bridge.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ArcMirrorSyncClient(ArcApiClient):
+    """An ARC API client that also writes everything it downloads to a mirror.
+
+    The mirror directory layout is the one read by ``ArcApiClient`` when
+    ``ARC_MIRROR_DIR`` is set: API responses are stored as JSON files under
+    ``api/`` and raw files under ``raw/``, with the same paths as on GitHub.
+    """
+
+    def __init__(self, mirror_dir: str | Path) -> None:
+        super().__init__()
+        self.mirror_dir = Path(mirror_dir)
+        # Always sync from GitHub, even if an existing mirror is in use
+        self.base_url_api = GITHUB_API_URL
+        self.base_url_raw_content = GITHUB_RAW_CONTENT_URL
+        self.is_mirror = False
+
+    def get_mirror_path(self, data_url: str) -> Path:
+        if data_url.startswith(f"{GITHUB_API_URL}/"):
+            relative_path = data_url.removeprefix(f"{GITHUB_API_URL}/")
+            return self.mirror_dir.joinpath(ARC_MIRROR_API_DIR, f"{relative_path}.json")
+        if data_url.startswith(f"{GITHUB_RAW_CONTENT_URL}/"):
+            relative_path = data_url.removeprefix(f"{GITHUB_RAW_CONTENT_URL}/")
+            return self.mirror_dir.joinpath(ARC_MIRROR_RAW_DIR, relative_path)
+        raise ArcApiClientError(f"Cannot mirror data from '{data_url}'")
+
+    def _write_mirror_json(self, data_url: str, response_json: list | dict) -> None:
+        mirror_path = self.get_mirror_path(data_url)
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        mirror_path.write_text(json.dumps(response_json), encoding="utf-8")
+
+    def _get_api_response(self, data_url: str) -> dict:
+        response_json = super()._get_api_response(data_url)
+        self._write_mirror_json(data_url, response_json)
+        return response_json
+
+    def _get_paginated_api_response(self, data_url: str) -> list:
+        # Store all the pages together under the unpaginated URL
+        response_json = super()._get_paginated_api_response(data_url)
+        self._write_mirror_json(data_url, response_json)
+        return response_json
+
+    def _write_to_dataframe(self, data_path: str, json: bool = False) -> pd.DataFrame:
+        try:
+            content = self._get_raw_content(data_path)
+        except RequestException as e:
+            logger.error(e)
+            raise ArcApiClientError(f"Failed to fetch data: {data_path}")
+
+        mirror_path = self.get_mirror_path(data_path)
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        mirror_path.write_bytes(content)
+        return ArcApiClient._write_to_dataframe(str(mirror_path), json)
+
+    def _get_dataframe_raw_content(
+        self, repo: str, ref: str, path: str
+    ) -> pd.DataFrame:
+        # Bypass the disk cache so that every file is written to the mirror
+        return self._write_to_dataframe(
+            "/".join([self.base_url_raw_content, repo, ref, path])
+        )
+
+    def get_shared_cache(self) -> ArcSharedCache | None:
+        # Bypass the shared cache so that every file is written to the mirror
+        return None
+
+    def _get_cached_dataframe(
+        self,
+        memory_cache: MutableMapping,
+        cache_name: str,
+        cache_key: tuple[str, ...],
+        load_function: Callable[[], pd.DataFrame],
+        ttl_seconds: int | None = None,
+    ) -> pd.DataFrame:
+        # Bypass the memory cache so that every file is written to the mirror
+        return load_function()
+
+
+def _sync_optional(sync_function, *args) -> None:
+    # Not every ARC version and language has every file
+    try:
+        sync_function(*args)
+    except ArcApiClientError as e:
+        logger.warning(f"Skipped syncing ARC data: {e}")
+
+
+def sync_arc_mirror(
+    mirror_dir: str | Path,
+    versions: list[str] | None = None,
+    languages: list[str] | None = None,
+) -> list[str]:
+    """:py:class:`list` : Downloads ARC data from GitHub into a local mirror.
+
+    Parameters
+    ----------
+    mirror_dir : str, pathlib.Path
+        The mirror directory, which is created if it does not exist.
+
+    versions : list, default=None
+        Optional ARC versions to sync, defaults to ``None`` for all versions.
+
+    languages : list, default=None
+        Optional languages to sync, defaults to ``None`` for all languages.
+        English is always synced, as it is needed for translations.
+
+    Returns
+    -------
+    list
+        The ARC versions that were synced.
+    """
+    client = ArcMirrorSyncClient(mirror_dir)
+    version_list = client.get_arc_version_list()
+    if versions:
+        unknown_versions = sorted(set(versions) - set(version_list))
+        if unknown_versions:
+            raise ArcApiClientError(f"Unknown ARC versions: {unknown_versions}")
+        version_list = [version for version in version_list if version in versions]
+
+    for version in version_list:
+        logger.info(f"Syncing ARC version {version}")
+        client.get_dataframe_arc_sha(client.get_arc_version_sha(version), version)
+        _sync_optional(client.get_dataframe_crf_metadata, version)
+
+        for language in client.get_arc_language_list_version(version):
+            if languages and language not in languages and language != "English":
+                continue
+            df_version = client.get_dataframe_arc_version_language(version, language)
+            list_names = (
+                df_version.loc[df_version["Type"].isin(LIST_TYPES), "List"]
+                .dropna()
+                .astype(str)
+                .str.replace("_", "/")
+                .unique()
+            )
+            for list_name in list_names:
+                _sync_optional(
+                    client.get_dataframe_arc_list_version_language,
+                    version,
+                    language,
+                    list_name,
+                )
+            _sync_optional(client.get_dataframe_paper_like_details, version, language)
+            _sync_optional(client.get_dataframe_supplemental_phrases, version, language)
+
+    return version_list
+
+
+def write_arc_mirror_archive(mirror_dir: str | Path, archive_path: str | Path) -> None:
+    """Writes the mirror directory to a ``.tar.gz`` archive.
+
+    The archive can be used directly as ``ARC_MIRROR_DIR``.
+
+    Parameters
+    ----------
+    mirror_dir : str, pathlib.Path
+        The mirror directory.
+
+    archive_path : str, pathlib.Path
+        The target archive path, including the filename.
+    """
+    mirror_dir = Path(mirror_dir)
+    with tarfile.open(archive_path, "w:gz") as archive:
+        for child_path in sorted(mirror_dir.iterdir()):
+            archive.add(child_path, arcname=child_path.name)
@@ -0,0 +1,116 @@
+import hashlib
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from os import getenv
+from threading import Lock
+from time import time
+
+from bridge.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# The number of GitHub API requests in each rate limit window reserved for
+# user-facing requests. Once the remaining budget falls to the reserve,
+# cached responses are used where possible, and background requests, such as
+# the warm-up and metadata refreshes, are deferred until the window resets.
+ARC_RATE_LIMIT_RESERVE = int(getenv("ARC_RATE_LIMIT_RESERVE", "10"))
+
+_BACKGROUND_REQUESTS: ContextVar[bool] = ContextVar(
+    "arc_background_requests", default=False
+)
+
+
+@contextmanager
+def background_requests() -> Iterator[None]:
+    """Marks the GitHub API requests made in the context as non-critical.
+
+    Background requests are deferred, by raising an ``ArcApiClientError``,
+    rather than using up the rate limit budget reserved for user-facing
+    requests. The context is per thread, so it must be entered in the thread
+    making the requests.
+    """
+    token = _BACKGROUND_REQUESTS.set(True)
+    try:
+        yield
+    finally:
+        _BACKGROUND_REQUESTS.reset(token)
+
+
+def is_background_request() -> bool:
+    return _BACKGROUND_REQUESTS.get()
+
+
+def get_token_key(github_token: str | None) -> str:
+    """:py:class:`str` : Returns the key of the rate limit budget for a token.
+
+    GitHub rate limits are per token, or per IP address for unauthenticated
+    requests. Tokens are hashed so that they never appear in logs or metrics.
+    """
+    if not github_token:
+        return "unauthenticated"
+    return hashlib.sha256(github_token.encode("utf-8")).hexdigest()[:12]
+
+
+class ArcRateLimitBudget:
+    """A thread-safe tracker of the GitHub API rate limit budget of each token.
+
+    The budget is updated from the ``X-RateLimit-Limit``,
+    ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset`` headers of every API
+    response, and is considered restored once its reset time has passed.
+    """
+
+    def __init__(self, reserve: int = ARC_RATE_LIMIT_RESERVE) -> None:
+        self.reserve = reserve
+        self._lock = Lock()
+        self._budgets: dict[str, dict[str, int]] = {}
+
+    def update(self, token_key: str, headers: Mapping[str, str]) -> None:
+        try:
+            budget = {
+                "limit": int(headers["X-RateLimit-Limit"]),
+                "remaining": int(headers["X-RateLimit-Remaining"]),
+                "reset_at": int(headers["X-RateLimit-Reset"]),
+            }
+        except (KeyError, TypeError, ValueError):
+            # Not every response has rate limit headers, e.g. cached ones
+            return
+
+        with self._lock:
+            self._budgets[token_key] = budget
+        if budget["remaining"] <= self.reserve:
+            logger.warning(
+                "GitHub API rate limit budget is low remaining=%s limit=%s reset_at=%s",
+                budget["remaining"],
+                budget["limit"],
+                budget["reset_at"],
+            )
+
+    def get_remaining(self, token_key: str) -> int | None:
+        with self._lock:
+            budget = self._budgets.get(token_key)
+            if budget is None or time() >= budget["reset_at"]:
+                return None
+            return budget["remaining"]
+
+    def is_low(self, token_key: str) -> bool:
+        remaining = self.get_remaining(token_key)
+        return remaining is not None and remaining <= self.reserve
+
+    def is_exhausted(self, token_key: str) -> bool:
+        return self.get_remaining(token_key) == 0
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                token_key: {**budget, "reserve": self.reserve}
+                for token_key, budget in self._budgets.items()
+            }
+
+
+ARC_RATE_LIMIT_BUDGET = ArcRateLimitBudget()
+
+
+def get_rate_limit_stats() -> dict[str, dict[str, int]]:
+    """:py:class:`dict` : Returns the GitHub API rate limit budget of each token."""
+    return ARC_RATE_LIMIT_BUDGET.get_stats()
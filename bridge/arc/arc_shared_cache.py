@@ -0,0 +1,205 @@
+import pickle
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from os import getenv
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any
+
+import pandas as pd
+
+from bridge import __version__
+from bridge.utils.logger import setup_logger
+
+# Redis support is optional, and is installed with the `redis` extra
+try:
+    import redis
+except ImportError:  # pragma: no cover
+    redis = None
+
+logger = setup_logger(__name__)
+
+# A cache of ARC data shared by all the worker processes, and across
+# restarts, behind the in-memory caches of each worker. Either the path of a
+# SQLite database file (optionally as a `sqlite:///` URL), or a `redis://` URL.
+# Disabled if not set.
+ARC_SHARED_CACHE_URL = getenv("ARC_SHARED_CACHE_URL", "")
+
+# Bump this if the format of the cached values changes, so old entries are
+# ignored.
+_SHARED_CACHE_FORMAT_VERSION = "1"
+
+_SHARED_CACHE_INSTANCES: dict[str, "ArcSharedCache"] = {}
+_SHARED_CACHE_INSTANCES_LOCK = Lock()
+
+
+class SqliteSharedCacheBackend:
+    """A shared cache backend storing entries in a SQLite database file.
+
+    Every operation uses its own connection, with the database in WAL mode, so
+    the backend can be used by any number of threads and worker processes.
+    Expired entries are removed as new entries are written.
+    """
+
+    def __init__(self, db_path: str | Path, timeout_seconds: float = 30) -> None:
+        self.db_path = Path(db_path)
+        self.timeout_seconds = timeout_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS arc_cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with closing(
+            sqlite3.connect(self.db_path, timeout=self.timeout_seconds)
+        ) as connection:
+            # Commits the transaction, or rolls it back on an error
+            with connection:
+                yield connection
+
+    def get(self, key: str) -> bytes | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM arc_cache "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time()),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        expires_at = None if ttl_seconds is None else time() + ttl_seconds
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM arc_cache WHERE expires_at <= ?",
+                (time(),),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO arc_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM arc_cache")
+
+
+class RedisSharedCacheBackend:
+    """A shared cache backend storing entries in Redis.
+
+    The client can be any object implementing the ``get`` and ``set`` Redis
+    commands, as the ``redis`` client does.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "bridge:arc:") -> None:
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisSharedCacheBackend":
+        if redis is None:
+            raise RuntimeError(
+                "The Redis shared cache needs the optional `redis` dependencies"
+            )
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> bytes | None:
+        return self.client.get(f"{self.key_prefix}{key}")
+
+    def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        self.client.set(f"{self.key_prefix}{key}", value, ex=ttl_seconds)
+
+
+class ArcSharedCache:
+    """A cache of ARC data shared by all the worker processes.
+
+    Values, such as ARC dataframes, are pickled and stored in the backend under
+    a key built from their parts, e.g. the kind of data, the ARC version, the
+    language and the commit SHA. Entries for a commit SHA never change, so
+    they don't expire, while entries for mutable data, such as translations
+    from the ``main`` branch, are given a TTL. Keys include the BRIDGE
+    version, as some values, such as the processed ARC versions, depend on
+    how BRIDGE transforms the ARC data.
+
+    The cache is best effort: backend errors are logged and treated as misses,
+    so that a failing backend never breaks the app. As loading a pickle can
+    run arbitrary code, the backend must only be writable by the app.
+    """
+
+    def __init__(self, backend: Any) -> None:
+        self.backend = backend
+
+    @staticmethod
+    def get_key(*key_parts: str) -> str:
+        return "|".join(
+            [
+                _SHARED_CACHE_FORMAT_VERSION,
+                __version__,
+                pd.__version__,
+                *map(str, key_parts),
+            ]
+        )
+
+    def get(self, *key_parts: str) -> Any:
+        key = self.get_key(*key_parts)
+        try:
+            value = self.backend.get(key)
+            if value is None:
+                return None
+            return pickle.loads(value)
+        except Exception as e:
+            logger.warning(f"Failed to read ARC shared cache entry {key}: {e}")
+            return None
+
+    def set(self, *key_parts: str, value: Any, ttl_seconds: int | None = None) -> None:
+        key = self.get_key(*key_parts)
+        try:
+            self.backend.set(
+                key,
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write ARC shared cache entry {key}: {e}")
+
+
+def get_shared_cache_backend(cache_url: str) -> Any:
+    """Returns the shared cache backend for a cache URL.
+
+    Parameters
+    ----------
+    cache_url : str
+        A ``redis://`` or ``rediss://`` URL, or the path of a SQLite database
+        file, optionally as a ``sqlite:///`` URL.
+
+    Returns
+    -------
+    SqliteSharedCacheBackend, RedisSharedCacheBackend
+        The shared cache backend.
+    """
+    if cache_url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisSharedCacheBackend.from_url(cache_url)
+    return SqliteSharedCacheBackend(cache_url.removeprefix("sqlite:///"))
+
+
+def get_arc_shared_cache() -> ArcSharedCache | None:
+    if not ARC_SHARED_CACHE_URL:
+        return None
+
+    with _SHARED_CACHE_INSTANCES_LOCK:
+        shared_cache = _SHARED_CACHE_INSTANCES.get(ARC_SHARED_CACHE_URL)
+        if shared_cache is None:
+            try:
+                backend = get_shared_cache_backend(ARC_SHARED_CACHE_URL)
+            except Exception as e:
+                logger.warning(f"ARC shared cache is disabled: {e}")
+                return None
+            shared_cache = ArcSharedCache(backend)
+            _SHARED_CACHE_INSTANCES[ARC_SHARED_CACHE_URL] = shared_cache
+        return shared_cache
@@ -0,0 +1,172 @@
+import json
+import os
+import shutil
+import tempfile
+from os import getenv
+from pathlib import Path
+
+import pandas as pd
+
+from bridge import __version__
+from bridge.arc.arc_api import ArcApiClient, ArcApiClientError
+from bridge.utils.logger import setup_logger
+
+# Parquet support is optional, and is installed with the `snapshot` extra
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+logger = setup_logger(__name__)
+
+# Directory of precompiled ARC snapshots, built with `bridge-cli arc snapshot`
+ARC_SNAPSHOT_DIR = getenv("ARC_SNAPSHOT_DIR", "")
+
+# Bump this if the snapshot format changes, so old snapshots are ignored.
+_SNAPSHOT_FORMAT_VERSION = "1"
+
+SNAPSHOT_DATA_FILENAME = "datadicc.parquet"
+SNAPSHOT_METADATA_FILENAME = "metadata.json"
+
+
+class ArcSnapshotStore:
+    """A directory of precompiled ARC snapshots, one per version and language.
+
+    Each snapshot holds the finished data dictionary of the version and
+    language, as a Parquet file that is memory-mapped when loaded, together
+    with a JSON metadata file holding the commit SHA, the grouped presets, the
+    ``ulist`` and ``multilist`` choices and the tree items.
+
+    Snapshots are only loaded if they were built with the same snapshot format
+    and BRIDGE version, as the output of the pipeline may change between
+    versions, and from the commit the ARC version is currently tagged at, as
+    the tag may have been moved since. The commit is looked up in the cached
+    index of ARC tags, so this usually needs no request.
+    """
+
+    def __init__(self, snapshot_dir: str | Path) -> None:
+        self.snapshot_dir = Path(snapshot_dir)
+
+    @staticmethod
+    def is_available() -> bool:
+        return pyarrow is not None
+
+    def get_snapshot_path(self, version: str, language: str) -> Path:
+        return self.snapshot_dir.joinpath(version, language)
+
+    def get(self, version: str, language: str) -> dict | None:
+        snapshot_path = self.get_snapshot_path(version, language)
+        metadata_path = snapshot_path.joinpath(SNAPSHOT_METADATA_FILENAME)
+        if not metadata_path.is_file():
+            return None
+
+        try:
+            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            if (
+                metadata["format_version"] != _SNAPSHOT_FORMAT_VERSION
+                or metadata["bridge_version"] != __version__
+            ):
+                logger.info(
+                    f"Ignoring outdated ARC snapshot for version {version} "
+                    f"and language {language}"
+                )
+                return None
+            if not self._is_current_commit(version, metadata["commit"]):
+                logger.info(
+                    f"Ignoring ARC snapshot for version {version} and language "
+                    f"{language} built from commit {metadata['commit']}, as "
+                    "the version has been tagged at another commit since"
+                )
+                return None
+            df_datadicc = pd.read_parquet(
+                snapshot_path.joinpath(SNAPSHOT_DATA_FILENAME),
+                engine="pyarrow",
+                memory_map=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load ARC snapshot {snapshot_path}: {e}")
+            return None
+
+        return {
+            "datadicc": df_datadicc,
+            "commit": metadata["commit"],
+            "grouped_presets": metadata["grouped_presets"],
+            "ulist_variable_choices": metadata["ulist_variable_choices"],
+            "multilist_variable_choices": metadata["multilist_variable_choices"],
+            "tree_items": metadata["tree_items"],
+        }
+
+    @staticmethod
+    def _is_current_commit(version: str, commit: str) -> bool:
+        try:
+            return ArcApiClient().get_arc_version_sha(version) == commit
+        except ArcApiClientError as e:
+            # Building the data needs the commit too, so the snapshot is the
+            # best there is
+            logger.warning(
+                f"Unable to check the commit of the ARC snapshot for version "
+                f"{version}: {e}"
+            )
+            return True
+
+    def set(
+        self,
+        version: str,
+        language: str,
+        df_datadicc: pd.DataFrame,
+        commit: str,
+        grouped_presets: dict,
+        ulist_variable_choices: str,
+        multilist_variable_choices: str,
+        tree_items: dict,
+    ) -> bool:
+        snapshot_path = self.get_snapshot_path(version, language)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        # Build the snapshot in a temporary directory first, so the app never
+        # loads a partially written snapshot
+        tmp_path = Path(
+            tempfile.mkdtemp(prefix=f".{language}.", dir=snapshot_path.parent)
+        )
+        try:
+            data_path = tmp_path.joinpath(SNAPSHOT_DATA_FILENAME)
+            df_datadicc.to_parquet(data_path, engine="pyarrow")
+            # Mixed-type columns don't always survive Parquet unchanged, and
+            # a snapshot must give exactly the same output as the pipeline
+            if not pd.read_parquet(data_path, engine="pyarrow").equals(df_datadicc):
+                raise ValueError("data dictionary changed in Parquet round trip")
+            metadata = {
+                "format_version": _SNAPSHOT_FORMAT_VERSION,
+                "bridge_version": __version__,
+                "version": version,
+                "language": language,
+                "commit": commit,
+                "grouped_presets": grouped_presets,
+                "ulist_variable_choices": ulist_variable_choices,
+                "multilist_variable_choices": multilist_variable_choices,
+                "tree_items": tree_items,
+            }
+            tmp_path.joinpath(SNAPSHOT_METADATA_FILENAME).write_text(
+                json.dumps(metadata), encoding="utf-8"
+            )
+            shutil.rmtree(snapshot_path, ignore_errors=True)
+            os.replace(tmp_path, snapshot_path)
+        except Exception as e:
+            logger.warning(
+                f"Failed to write ARC snapshot for version {version} and "
+                f"language {language}: {e}"
+            )
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return False
+        return True
+
+
+def get_arc_snapshot_store() -> ArcSnapshotStore | None:
+    if not ARC_SNAPSHOT_DIR:
+        return None
+    if not ArcSnapshotStore.is_available():
+        logger.warning(
+            "ARC_SNAPSHOT_DIR is set but pyarrow is not installed, so ARC "
+            "snapshots are disabled: install the `snapshot` extra to use them"
+        )
+        return None
+    return ArcSnapshotStore(ARC_SNAPSHOT_DIR)
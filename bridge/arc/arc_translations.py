@@ -1,9 +1,9 @@
-import re
 from typing import Tuple
 
 import pandas as pd
 
 from bridge.arc.arc_api import ArcApiClient
+from bridge.utils.skip_logic import parse_skip_logic
 
 
 def get_arc_translation(
@@ -46,40 +46,18 @@ def get_arc_translation(
             df_merged[col].notna(), col
         ]
 
-    df_current_datadicc["Branch"] = df_current_datadicc.apply(
-        lambda row: process_skip_logic(row, df_current_datadicc), axis=1
-    )
+    df_current_datadicc["Branch"] = get_branches(df_current_datadicc)
     return df_current_datadicc
 
 
 def _extract_logic_components(skip_logic_column: str) -> Tuple[list, list, list, list]:
     if isinstance(skip_logic_column, str) and pd.notna(skip_logic_column):
-        normalized_logic = re.sub(
-            r"\[([a-zA-Z0-9_]+)\((\d+)\)\]='(\d+)'", r"[\1]='\2'", skip_logic_column
-        )
-
-        variables = re.findall(r"\[([a-zA-Z0-9_]+)\]", normalized_logic)
-
-        raw_values = re.findall(r"[=!<>]=?\s*('[^']*'|\d+\.?\d*)", normalized_logic)
-        values = []
-        for raw_value in raw_values:
-            if raw_value.startswith("'") and raw_value.endswith("'"):
-                values.append(raw_value.strip("'"))
-            else:
-                if "." in raw_value:
-                    values.append(float(raw_value))
-                else:
-                    values.append(int(raw_value))
-
-        comparison_operators = re.findall(r"(<=|>=|<>|[=><!]=?)", normalized_logic)
-
-        logical_operators = re.findall(r"\b(and|or)\b", normalized_logic)
-
+        skip_logic = parse_skip_logic(skip_logic_column)
         return (
-            variables,
-            values,
-            comparison_operators,
-            logical_operators,
+            [comparison.variable for comparison in skip_logic.comparisons],
+            [comparison.value for comparison in skip_logic.comparisons],
+            [comparison.operator for comparison in skip_logic.comparisons],
+            list(skip_logic.logical_operators),
         )
 
     return (
@@ -90,48 +68,110 @@ def _extract_logic_components(skip_logic_column: str) -> Tuple[list, list, list,
     )
 
 
-def process_skip_logic(row: pd.Series, df_current_datadicc: pd.DataFrame) -> str:
-    branch = []
-    if "Skip Logic" in df_current_datadicc.columns:
-        skip_logic = row["Skip Logic"]
-        extracted_variables, labels, comparison_operators, logical_operators = (
-            _extract_logic_components(str(skip_logic))
-        )
-        logical_operators = logical_operators + [" "]
-        for i in range(len(extracted_variables)):
+def _parse_answer_options(answers: str) -> dict:
+    pairs = answers.split(" | ")
+    return {pair.split(", ")[0]: pair.split(", ")[1] for pair in pairs}
+
+
+def _get_variable_lookup(df_current_datadicc: pd.DataFrame) -> dict:
+    """:py:class:`dict` : Returns the question and answers of each variable.
+
+    The answers are parsed into a dict of answer values to labels, or are
+    ``None`` if the variable has no answer options. If the answer options
+    can't be parsed, the exception raised is stored instead, so that it is
+    reported in the same way for every branch referencing the variable. Only
+    the first row of a duplicated variable is used.
+    """
+    variable_lookup = {}
+    for variable, question, answers in zip(
+        df_current_datadicc["Variable"],
+        df_current_datadicc["Question"],
+        df_current_datadicc["Answer Options"],
+    ):
+        if variable in variable_lookup:
+            continue
+        if isinstance(answers, str) and pd.notna(answers):
             try:
-                answers = (
-                    df_current_datadicc["Answer Options"]
-                    .loc[df_current_datadicc["Variable"] == extracted_variables[i]]
-                    .iloc[0]
-                )
-                question = (
-                    df_current_datadicc["Question"]
-                    .loc[df_current_datadicc["Variable"] == extracted_variables[i]]
-                    .iloc[0]
-                )
-                comp_operators = comparison_operators[i]
-                if isinstance(answers, str) and pd.notna(answers):
-                    pairs = answers.split(" | ")
-                    dic_answer = {
-                        pair.split(", ")[0]: pair.split(", ")[1] for pair in pairs
-                    }
-                    answers_label = dic_answer.get(labels[i], "Unknown")
-
-                else:
-                    answers_label = labels[i]
-                branch.append(
-                    f"({question} {comp_operators} {answers_label}) {logical_operators[i]}"
-                )
-
-            except IndexError:
-                branch.append("Variable not found getARCTranslation")
+                answers = _parse_answer_options(answers)
             except Exception as e:
-                branch.append(f"Error getARCTranslation: {str(e)}")
+                answers = e
+        else:
+            answers = None
+        variable_lookup[variable] = (question, answers)
+    return variable_lookup
+
+
+def _get_branch(skip_logic: str, variable_lookup: dict) -> str:
+    branch = []
+    extracted_variables, labels, comparison_operators, logical_operators = (
+        _extract_logic_components(skip_logic)
+    )
+    logical_operators = logical_operators + [" "]
+    for i in range(len(extracted_variables)):
+        try:
+            try:
+                question, answers = variable_lookup[extracted_variables[i]]
+            except KeyError:
+                raise IndexError
+            comp_operators = comparison_operators[i]
+            if isinstance(answers, Exception):
+                raise answers
+            if answers is not None:
+                answers_label = answers.get(labels[i], "Unknown")
+            else:
+                answers_label = labels[i]
+            branch.append(
+                f"({question} {comp_operators} {answers_label}) {logical_operators[i]}"
+            )
+
+        except IndexError:
+            branch.append("Variable not found getARCTranslation")
+        except Exception as e:
+            branch.append(f"Error getARCTranslation: {str(e)}")
 
     return "  ".join(branch)
 
 
+def get_branches(df_current_datadicc: pd.DataFrame) -> pd.Series:
+    """:py:class:`pandas.Series` : Returns the branch text of each variable.
+
+    The branch text describes the skip logic of each variable in terms of the
+    questions and answer labels of the variables it references, e.g.
+    ``(Reason why the patient was tested = Other)``. The referenced variables
+    are looked up in a single index of the data dictionary, and the branch
+    text is built once for each distinct skip logic.
+
+    Parameters
+    ----------
+    df_current_datadicc : pandas.DataFrame
+        The data dictionary.
+
+    Returns
+    -------
+    pandas.Series
+        The branch text of each variable, with the same index as the data
+        dictionary.
+    """
+    if "Skip Logic" not in df_current_datadicc.columns:
+        return pd.Series("", index=df_current_datadicc.index, dtype=object)
+
+    variable_lookup = _get_variable_lookup(df_current_datadicc)
+    skip_logic = df_current_datadicc["Skip Logic"].astype(str)
+    branches = {
+        skip_logic_str: _get_branch(skip_logic_str, variable_lookup)
+        for skip_logic_str in skip_logic.unique()
+    }
+    return skip_logic.map(branches).astype(object)
+
+
+def process_skip_logic(row: pd.Series, df_current_datadicc: pd.DataFrame) -> str:
+    if "Skip Logic" not in df_current_datadicc.columns:
+        return ""
+    return _get_branch(
+        str(row["Skip Logic"]), _get_variable_lookup(df_current_datadicc)
+    )
+
+
 def get_translations(language: str | None) -> dict:
     translations = {
         "English": {
@@ -1,8 +1,12 @@
+import hashlib
 import re
+from collections.abc import MutableMapping
 from typing import Tuple
 
 import pandas as pd
 
+from bridge.arc.arc_cache import ArcMemoryCache
+
 INCLUDE_NOT_SHOW = [
     "otherl3",
     "otherl2",
@@ -28,9 +32,95 @@ ROWS_FOR_TREE = [
     "Type",
 ]
 
+# Tree items by version, units conversion and fingerprint of the data
+# dictionary columns they're built from
+_TREE_ITEMS_CACHE: MutableMapping[tuple[str, bool, str], dict] = ArcMemoryCache(
+    "arc_tree_items"
+)
+
 
 def get_tree_items(
     df_datadicc: pd.DataFrame, version: str, dynamic_units_conversion: bool
+) -> dict:
+    """:py:class:`dict` : Returns the tree items of a data dictionary.
+
+    Choosing presets or list options changes the data dictionary, but not
+    the columns the tree is built from, so the tree items are cached by a
+    fingerprint of those columns, and only rebuilt when they change. The
+    tree items are shared, so callers must not modify them in place.
+
+    Parameters
+    ----------
+    df_datadicc : pandas.DataFrame
+        The data dictionary.
+    version : str
+        The ARC version, the title of the tree.
+    dynamic_units_conversion : bool
+        Whether the ARC version has dynamic units conversion.
+
+    Returns
+    -------
+    dict
+        The tree items.
+    """
+    cache_key = (
+        version,
+        dynamic_units_conversion,
+        _get_tree_fingerprint(df_datadicc, dynamic_units_conversion),
+    )
+    tree = _TREE_ITEMS_CACHE.get(cache_key)
+    if tree is None:
+        tree = _build_tree_items(df_datadicc, version, dynamic_units_conversion)
+        _TREE_ITEMS_CACHE[cache_key] = tree
+    return tree
+
+
+def set_tree_items(
+    df_datadicc: pd.DataFrame,
+    version: str,
+    dynamic_units_conversion: bool,
+    tree: dict,
+) -> None:
+    """Caches tree items already built for a data dictionary.
+
+    This is used for the tree items of a precompiled ARC snapshot, so that
+    ``get_tree_items`` returns them rather than building them again.
+
+    Parameters
+    ----------
+    df_datadicc : pandas.DataFrame
+        The data dictionary.
+    version : str
+        The ARC version, the title of the tree.
+    dynamic_units_conversion : bool
+        Whether the ARC version has dynamic units conversion.
+    tree : dict
+        The tree items of the data dictionary.
+    """
+    cache_key = (
+        version,
+        dynamic_units_conversion,
+        _get_tree_fingerprint(df_datadicc, dynamic_units_conversion),
+    )
+    _TREE_ITEMS_CACHE[cache_key] = tree
+
+
+def _get_tree_fingerprint(
+    df_datadicc: pd.DataFrame, dynamic_units_conversion: bool
+) -> str:
+    columns = (
+        ROWS_FOR_TREE if dynamic_units_conversion else ROWS_FOR_TREE + ["Validation"]
+    )
+    columns = [column for column in columns if column in df_datadicc.columns]
+    row_hashes = pd.util.hash_pandas_object(df_datadicc[columns], index=True)
+    fingerprint = hashlib.blake2b(digest_size=16)
+    fingerprint.update(repr(columns).encode())
+    fingerprint.update(row_hashes.to_numpy().tobytes())
+    return fingerprint.hexdigest()
+
+
+def _build_tree_items(
+    df_datadicc: pd.DataFrame, version: str, dynamic_units_conversion: bool
 ) -> dict:
     df_tree = _create_tree_item_dataframe(df_datadicc, dynamic_units_conversion)
 
@@ -9,6 +9,7 @@ import pandas as pd
 from dash import Input, Output, State
 
 from bridge.arc import arc_core
+from bridge.arc.arc_data_dictionary import DataDictionary
 from bridge.generate_pdf.form import Form
 from bridge.utils.logger import setup_logger
 
@@ -152,10 +153,9 @@ def _checked_updates_for_units(
     # This has three units, which confuses matters when two are checked!
     # labs_glucose / labs_glucose_units is missing from checked and needs to be added
     # Only do this for last checked variable
+    data_dictionary = DataDictionary(df_datadicc)
     last_checked_variable = checked[-1]
-    base_var = df_datadicc.loc[df_datadicc["Variable"] == last_checked_variable][
-        "Sec_vari"
-    ].values[0]
+    base_var = data_dictionary.get_value(last_checked_variable, "Sec_vari")
     no_base_var_checked = len(
         [variable for variable in checked if base_var in variable]
     )
@@ -164,16 +164,15 @@ def _checked_updates_for_units(
         if not dynamic_units_conversion:
             last_checked_units = f"{base_var}_units"
 
-            df_units = df_datadicc.loc[df_datadicc["Validation"] == "units"]
-            if last_checked_units in df_units["Variable"].values:
+            df_last_checked_units = data_dictionary.get_rows(last_checked_units)
+            if (df_last_checked_units["Validation"] == "units").any():
                 if last_checked_units not in checked:
                     checked.append(last_checked_units)
         else:
-            df_datadicc_base_var = df_datadicc[df_datadicc["Variable"] == base_var]
+            question_english = data_dictionary.get_value(base_var, "Question_english")
             if (
-                df_datadicc_base_var["Question_english"]
-                .str.contains("(select units)", case=False, na=False, regex=False)
-                .values[0]
+                isinstance(question_english, str)
+                and "(SELECT UNITS)" in question_english.upper()
             ):
                 if base_var not in checked:
                     checked.append(base_var)
@@ -306,10 +305,9 @@ def _get_include_not_show(
     possible_vars_to_include = [
         f"{var}_{suffix}" for var in selected_variables for suffix in INCLUDE_NOT_SHOW
     ]
+    data_dictionary = DataDictionary(df_current_datadicc)
     actual_vars_to_include = [
-        var
-        for var in possible_vars_to_include
-        if var in df_current_datadicc["Variable"].values
+        var for var in possible_vars_to_include if var in data_dictionary
     ]
     selected_variables = list(selected_variables) + list(actual_vars_to_include)
     # Deduplicate the final list in case of any overlaps
@@ -326,32 +324,28 @@ def _add_select_units_field(
     if not dynamic_units_conversion:
         # E.g. demog_height_units
         df_datadicc["select units"] = df_datadicc["Validation"] == "units"
-
-        # E.g. Add demog_height_cm / demog_height_in
-        for _, row in df_datadicc[df_datadicc["select units"]].iterrows():
-            variable_key = f"{row['Variable']}"
-            mask_sec_vari = (df_datadicc["Sec"] == row["Sec"]) & (
-                df_datadicc["vari"] == row["vari"]
-            )
-            df_datadicc.loc[mask_sec_vari, "select units"] = True
-
-            # Only show the original one (NOT suffixed "_units") in the grid
-            df_datadicc.loc[df_datadicc["Variable"] == variable_key, "select units"] = (
-                False
-            )
-
     else:
         # E.g. demog_height (demog_height_units doesn't exist)
         df_datadicc["select units"] = df_datadicc["Question_english"].str.contains(
             "(select units)", case=False, na=False, regex=False
         )
+
+    data_dictionary = DataDictionary(df_datadicc)
+    select_units = df_datadicc["select units"].tolist()
+    df_select_units = df_datadicc.loc[df_datadicc["select units"]]
+    for variable, sec, vari in zip(
+        df_select_units["Variable"], df_select_units["Sec"], df_select_units["vari"]
+    ):
         # E.g. Add demog_height_cm / demog_height_in
-        for _, row in df_datadicc[df_datadicc["select units"]].iterrows():
-            mask_sec_vari = (df_datadicc["Sec"] == row["Sec"]) & (
-                df_datadicc["vari"] == row["vari"]
-            )
-            df_datadicc.loc[mask_sec_vari, "select units"] = True
+        for position in data_dictionary.get_sec_vari_positions(sec, vari):
+            select_units[position] = True
 
+        if not dynamic_units_conversion:
+            # Only show the original one (NOT suffixed "_units") in the grid
+            for position in data_dictionary.get_positions(f"{variable}"):
+                select_units[position] = False
+
+    df_datadicc["select units"] = select_units
     return df_datadicc
 
 
@@ -417,25 +411,24 @@ def _assign_units_answer_options(
     if dynamic_units_conversion:
         return df_units
 
+    data_dictionary = DataDictionary(df_datadicc)
     for idx, row in df_units.iterrows():
         variable = row["Variable"]
 
-        df_variable = df_datadicc[df_datadicc["Variable"] == variable]
-        if df_variable.empty:
+        if variable not in data_dictionary:
             continue
 
-        base_var = df_variable["Sec_vari"].values[0]
+        base_var = data_dictionary.get_value(variable, "Sec_vari")
         units_variable = f"{base_var}_units"
 
-        if units_variable not in df_datadicc["Variable"].values:
+        if units_variable not in data_dictionary:
             continue
 
         unit_name = _extract_parenthesis_content(str(row["Question"]))
         if not unit_name:
             continue
 
-        df_parent = df_datadicc[df_datadicc["Variable"] == units_variable]
-        options_raw = df_parent["Answer Options"].values[0]
+        options_raw = data_dictionary.get_value(units_variable, "Answer Options")
 
         if not isinstance(options_raw, str):
             continue
@@ -486,11 +479,12 @@ def _units_transformation(
     unit_variables_to_delete = []
     seen_variables = set()
 
+    units_dictionary = DataDictionary(df_units)
     for _, row in df_units.iterrows():
         if row["count"] > 1:
-            df_matching_rows = df_units[
-                (df_units["Sec"] == row["Sec"]) & (df_units["vari"] == row["vari"])
-            ]
+            df_matching_rows = units_dictionary.get_sec_vari_rows(
+                row["Sec"], row["vari"]
+            )
 
             for delete_variable in df_matching_rows["Variable"].values:
                 unit_variables_to_delete.append(delete_variable)
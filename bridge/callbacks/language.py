@@ -1,18 +1,24 @@
 import json
-from copy import deepcopy
+from collections.abc import MutableMapping
 from time import perf_counter
 
 import dash_bootstrap_components as dbc
 from dash import html
 import pandas as pd
 
-from bridge.arc import arc_core, arc_translations
+from bridge.arc import arc_core, arc_translations, arc_tree
+from bridge.arc.arc_cache import ArcMemoryCache, SingleFlight, get_dataframe_view
 from bridge.arc.arc_lists import ArcList
+from bridge.arc.arc_rate_limit import is_background_request
+from bridge.arc.arc_snapshot import ArcSnapshotStore, get_arc_snapshot_store
 from bridge.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-_VERSION_LANGUAGE_CACHE: dict[tuple[str, str, bool], tuple] = {}
+_VERSION_LANGUAGE_CACHE: MutableMapping[tuple[str, str, bool], tuple] = ArcMemoryCache(
+    "version_language"
+)
+_VERSION_LANGUAGE_SINGLE_FLIGHT = SingleFlight()
 
 
 class Language:
@@ -153,25 +159,117 @@ class Language:
         """
         cache_initial_load = self.initial_load if self.language != "English" else False
         cache_key = (self.version, self.language, cache_initial_load)
-        if cache_key in _VERSION_LANGUAGE_CACHE:
-            (
-                df_cached,
-                cached_commit,
-                cached_grouped_presets,
-                cached_accordion_items,
-                cached_ulist_json,
-                cached_multilist_json,
-            ) = _VERSION_LANGUAGE_CACHE[cache_key]
-            return (
-                df_cached.copy(deep=True),
-                cached_commit,
-                deepcopy(cached_grouped_presets),
-                deepcopy(cached_accordion_items),
-                cached_ulist_json,
-                cached_multilist_json,
+        cache_entry = _VERSION_LANGUAGE_CACHE.get(cache_key)
+        if cache_entry is None:
+            # Concurrent misses for the same version and language, e.g. from
+            # several users switching to it at once, wait for a single build.
+            # Background builds, e.g. the warm-up, may be deferred, so aren't
+            # shared with user-facing builds of the same data
+            cache_entry = _VERSION_LANGUAGE_SINGLE_FLIGHT.do(
+                (cache_key, is_background_request()),
+                lambda: self.build_cache_entry(cache_initial_load),
             )
+        (
+            df_cached,
+            cached_commit,
+            cached_grouped_presets,
+            cached_accordion_items,
+            cached_ulist_json,
+            cached_multilist_json,
+        ) = cache_entry
+        # The accordion components are only ever serialised, never
+        # modified, so they are shared rather than copied
+        return (
+            get_dataframe_view(df_cached),
+            cached_commit,
+            {
+                section: list(preset_names)
+                for section, preset_names in cached_grouped_presets.items()
+            },
+            list(cached_accordion_items),
+            cached_ulist_json,
+            cached_multilist_json,
+        )
+
+    def build_cache_entry(self, cache_initial_load: bool) -> tuple:
+        """:py:class:`tuple` : Builds and caches the version language data.
+
+        The data is loaded from its snapshot, if there is one, together with
+        its tree items, otherwise it is built from ARC.
+
+        Parameters
+        ----------
+        cache_initial_load : bool
+            Whether this is the partially translated data of the initial load.
+
+        Returns
+        -------
+        tuple
+            The cache entry, in the same form as the tuple returned by
+            ``get_version_language_related_data``.
+        """
+        cache_key = (self.version, self.language, cache_initial_load)
+        # Another thread may have built the data since the cache was checked
+        cache_entry = _VERSION_LANGUAGE_CACHE.get(cache_key)
+        if cache_entry is not None:
+            return cache_entry
 
         build_start = perf_counter()
+        # Snapshots are only built for the fully translated data
+        snapshot = None if cache_initial_load else self.get_snapshot()
+        if snapshot is not None:
+            df_version_language = snapshot["datadicc"]
+            commit = snapshot["commit"]
+            self.grouped_presets = snapshot["grouped_presets"]
+            ulist_json = snapshot["ulist_variable_choices"]
+            multilist_json = snapshot["multilist_variable_choices"]
+            # So the tree isn't built again when the data is displayed
+            arc_tree.set_tree_items(
+                df_version_language,
+                self.version,
+                arc_core.get_dynamic_units_conversion_bool(self.version),
+                snapshot["tree_items"],
+            )
+        else:
+            (
+                df_version_language,
+                commit,
+                ulist_json,
+                multilist_json,
+            ) = self.build_version_language_data()
+
+        cache_entry = (
+            df_version_language,
+            commit,
+            self.grouped_presets,
+            self.build_accordion_items(),
+            ulist_json,
+            multilist_json,
+        )
+        _VERSION_LANGUAGE_CACHE[cache_key] = cache_entry
+        logger.debug(
+            "language.get_version_language_related_data cache=MISS snapshot=%s version=%s language=%s initial_load=%s elapsed_ms=%.3f",
+            snapshot is not None,
+            self.version,
+            self.language,
+            cache_initial_load,
+            (perf_counter() - build_start) * 1000,
+        )
+        return cache_entry
+
+    def build_version_language_data(self) -> tuple[pd.DataFrame, str, str, str]:
+        """:py:class:`tuple` : Builds the version language data from ARC.
+
+        This runs the full pipeline: loading the ARC version, translating it,
+        and expanding its lists, user lists and multi-lists. The grouped
+        presets are set on the instance.
+
+        Returns
+        -------
+        tuple
+            A tuple of the version language (as a dataframe), ARC commit SHA,
+            and the ``ulist`` choices and ``multilist`` choices as JSON.
+        """
         df_version, presets, commit = arc_core.get_arc(self.version)
 
         if self.initial_load or self.language == "English":
@@ -183,32 +281,21 @@ class Language:
             df_version_language
         )
 
-        df_arc_lists, list_variable_choices = ArcList(
-            self.version, self.language
-        ).get_list_content(df_version_language)
-        df_version_language = arc_core.add_transformed_rows(
-            df_version_language,
-            df_arc_lists,
-            arc_core.get_variable_order(df_version_language),
-        )
-
-        df_ulist, ulist_variable_choices = ArcList(
-            self.version, self.language
-        ).get_user_list_content(df_version_language)
-
-        df_version_language = arc_core.add_transformed_rows(
-            df_version_language,
-            df_ulist,
-            arc_core.get_variable_order(df_version_language),
-        )
-
-        df_multilist, multilist_variable_choices = ArcList(
-            self.version, self.language
-        ).get_multi_list_content(df_version_language)
+        arc_list = ArcList(self.version, self.language)
+        # Download all the list CSVs up front, concurrently, rather than one
+        # at a time during each of the list expansions below
+        arc_list.prefetch_list_options(df_version_language)
 
+        # All the list expansions are added to the data dictionary at once
+        (
+            df_all_lists,
+            _,
+            ulist_variable_choices,
+            multilist_variable_choices,
+        ) = arc_list.get_all_list_content(df_version_language)
         df_version_language = arc_core.add_transformed_rows(
             df_version_language,
-            df_multilist,
+            df_all_lists,
             arc_core.get_variable_order(df_version_language),
         )
 
@@ -216,28 +303,58 @@ class Language:
         for section, preset_name in presets:
             self.grouped_presets.setdefault(section, []).append(preset_name)
 
-        accordion_items = self.build_accordion_items()
-        output = (
+        return (
             df_version_language,
             commit,
-            self.grouped_presets,
-            accordion_items,
             json.dumps(ulist_variable_choices),
             json.dumps(multilist_variable_choices),
         )
-        _VERSION_LANGUAGE_CACHE[cache_key] = (
-            output[0].copy(deep=True),
-            output[1],
-            deepcopy(output[2]),
-            deepcopy(output[3]),
-            output[4],
-            output[5],
+
+    def get_snapshot(self) -> dict | None:
+        """:py:class:`dict` : Returns the precompiled snapshot of the version language, if any.
+
+        Returns
+        -------
+        dict
+            The snapshot, or ``None`` if snapshots are disabled or there is no
+            snapshot for the version and language.
+        """
+        snapshot_store = get_arc_snapshot_store()
+        if snapshot_store is None:
+            return None
+        return snapshot_store.get(self.version, self.language)
+
+    def write_snapshot(self, snapshot_store: ArcSnapshotStore) -> bool:
+        """:py:class:`bool` : Builds and writes the snapshot of the version language.
+
+        Parameters
+        ----------
+        snapshot_store : bridge.arc.arc_snapshot.ArcSnapshotStore
+            The snapshot store to write to.
+
+        Returns
+        -------
+        bool
+            Whether the snapshot was written.
+        """
+        (
+            df_version_language,
+            commit,
+            ulist_json,
+            multilist_json,
+        ) = self.build_version_language_data()
+        tree_items = arc_tree.get_tree_items(
+            df_version_language,
+            self.version,
+            arc_core.get_dynamic_units_conversion_bool(self.version),
         )
-        logger.debug(
-            "language.get_version_language_related_data cache=MISS version=%s language=%s initial_load=%s elapsed_ms=%.3f",
+        return snapshot_store.set(
             self.version,
             self.language,
-            cache_initial_load,
-            (perf_counter() - build_start) * 1000,
+            df_version_language,
+            commit,
+            self.grouped_presets,
+            ulist_json,
+            multilist_json,
+            tree_items,
         )
-        return output
@@ -12,6 +12,7 @@ from dash import dcc, html, Input, Output, State, ALL
 
 from bridge.arc import arc_translations, arc_tree
 from bridge.arc.arc_api import ArcApiClient, ArcApiClientError
+from bridge.arc.arc_data_dictionary import DataDictionary
 from bridge.utils.crf import clean_crf_metadata
 from bridge.utils.logger import setup_logger
 from bridge.utils.trigger_id import get_trigger_id
@@ -307,28 +308,13 @@ def display_selected_in_modal(
         list_options_mapping = _build_list_options_mapping(ulist_multilist)
         df_datadicc = pd.read_json(io.StringIO(current_datadicc_saved), orient="split")
         selected_variable = selected[0]
-        if selected_variable in list(df_datadicc["Variable"]):
+        selected_row = DataDictionary(df_datadicc).get_row(selected_variable)
+        if selected_row is not None:
             process_start = perf_counter()
-            question = (
-                df_datadicc["Question"]
-                .loc[df_datadicc["Variable"] == selected[0]]
-                .iloc[0]
-            )
-            definition = (
-                df_datadicc["Definition"]
-                .loc[df_datadicc["Variable"] == selected[0]]
-                .iloc[0]
-            )
-            completion = (
-                df_datadicc["Completion Guideline"]
-                .loc[df_datadicc["Variable"] == selected[0]]
-                .iloc[0]
-            )
-            skip_logic = (
-                df_datadicc["Branch"]
-                .loc[df_datadicc["Variable"] == selected[0]]
-                .iloc[0]
-            )
+            question = selected_row["Question"]
+            definition = selected_row["Definition"]
+            completion = selected_row["Completion Guideline"]
+            skip_logic = selected_row["Branch"]
 
             if selected_variable in list_options_mapping:
                 options, checked_items = build_checklist_dom_from_mapping(
@@ -354,11 +340,7 @@ def display_selected_in_modal(
                 )
             else:
                 options = []
-                answer_options = (
-                    df_datadicc["Answer Options"]
-                    .loc[df_datadicc["Variable"] == selected_variable]
-                    .iloc[0]
-                )
+                answer_options = selected_row["Answer Options"]
                 if isinstance(answer_options, str):
                     for ulist_multilist_variable in _split_answer_options(
                         answer_options
@@ -538,6 +520,8 @@ def update_list_variables_checked(
     variable_name_not_selected = f"{variable_name}_otherl2"
     list_options = []
     variable_list_options = []
+    checked_options = set(df_checked["Option"])
+    data_dictionary = DataDictionary(df_current_datadicc)
 
     position = 0
     for var_select in variable_choices_list:
@@ -548,7 +532,7 @@ def update_list_variables_checked(
             for option_var_select in var_select[1]:
                 list_item_number = option_var_select[0]
                 list_item_name = option_var_select[1]
-                if list_item_name in (list(df_checked["Option"])):
+                if list_item_name in checked_options:
                     list_options.append([list_item_number, list_item_name, 1])
                     select_answer_options += (
                         str(list_item_number) + ", " + str(list_item_name) + " | "
@@ -562,15 +546,16 @@ def update_list_variables_checked(
             variable_list_options.append([var_select, list_options])
             variable_choices_list[position][1] = variable_list_options[0][1]
 
-            df_current_datadicc.loc[
-                df_current_datadicc["Variable"] == variable_name, "Answer Options"
-            ] = select_answer_options + "88, " + other_text
-
-            if variable_name_not_selected in list(df_current_datadicc["Variable"]):
-                df_current_datadicc.loc[
-                    df_current_datadicc["Variable"] == variable_name_not_selected,
-                    "Answer Options",
-                ] = not_select_answer_options + "88, " + other_text
+            data_dictionary.set_value(
+                variable_name,
+                "Answer Options",
+                select_answer_options + "88, " + other_text,
+            )
+            data_dictionary.set_value(
+                variable_name_not_selected,
+                "Answer Options",
+                not_select_answer_options + "88, " + other_text,
+            )
 
         position += 1
     return (
@@ -9,6 +9,7 @@ from dash import html, Input, Output, State
 
 from bridge.arc import arc_translations, arc_tree
 from bridge.arc.arc_api import ArcApiClient
+from bridge.arc.arc_data_dictionary import DataDictionary
 from bridge.utils.logger import setup_logger
 from bridge.utils.crf import get_selected_crf_presets
 
@@ -166,6 +167,11 @@ def _update_list_items(
     other_text = translations_for_language["other"]
 
     df_datadicc_list = df_datadicc.loc[df_datadicc["Type"] == list_type]
+    data_dictionary = DataDictionary(df_datadicc)
+
+    list_items_saved_by_variable = {}
+    for variable_name, list_items_saved in json.loads(list_saved):
+        list_items_saved_by_variable.setdefault(variable_name, list_items_saved)
 
     list_variable_choices_updated = []
 
@@ -188,29 +194,24 @@ def _update_list_items(
         else:
             selected_column = "Selected"
 
-        df_list_saved = pd.DataFrame(
-            json.loads(list_saved), columns=["Variable", selected_column]
+        list_items_saved = list_items_saved_by_variable[variable_name]
+
+        df_template_list_data[selected_column] = df_template_list_data[
+            selected_column
+        ].apply(
+            lambda x: 1.0 if isinstance(x, str) and x.replace(" ", "") == "1" else x
         )
-        list_items_saved = df_list_saved.loc[
-            df_list_saved["Variable"] == variable_name, selected_column
-        ].values[0]
+        df_template_checked = df_template_list_data[
+            df_template_list_data[selected_column] == float(1)
+        ]
+
+        checked_list = list(df_template_checked.iloc[:, 0].values)
 
         for list_item in list_items_saved:
             # Update the list items saved with the settings in the template
             list_item_name = list_item[1]
             list_item_number = list_item[0]
 
-            df_template_list_data[selected_column] = df_template_list_data[
-                selected_column
-            ].apply(
-                lambda x: 1.0 if isinstance(x, str) and x.replace(" ", "") == "1" else x
-            )
-            df_template_checked = df_template_list_data[
-                df_template_list_data[selected_column] == float(1)
-            ]
-
-            checked_list = list(df_template_checked.iloc[:, 0].values)
-
             if list_item_name in checked_list:
                 list_items_updated.append([list_item_number, str(list_item_name), 1])
                 select_answer_options += f"{list_item_number}, {str(list_item_name)} | "
@@ -220,14 +221,16 @@ def _update_list_items(
                     f"{list_item_number}, {str(list_item_name)} | "
                 )
 
-        df_datadicc.loc[df_datadicc["Variable"] == variable_name, "Answer Options"] = (
-            f"{select_answer_options}88, {other_text}"
+        data_dictionary.set_value(
+            variable_name,
+            "Answer Options",
+            f"{select_answer_options}88, {other_text}",
+        )
+        data_dictionary.set_value(
+            variable_name_not_selected,
+            "Answer Options",
+            f"{not_select_answer_options}88, {other_text}",
         )
-
-        if variable_name_not_selected in list(df_datadicc["Variable"]):
-            df_datadicc.loc[
-                df_datadicc["Variable"] == variable_name_not_selected, "Answer Options"
-            ] = f"{not_select_answer_options}88, {other_text}"
 
         list_variable_choices_updated.append([variable_name, list_items_updated])
 
@@ -10,6 +10,7 @@ import pandas as pd
 from dash import html, Input, Output, State
 
 from bridge.arc import arc_translations, arc_tree, arc_core
+from bridge.arc.arc_data_dictionary import DataDictionary
 from bridge.callbacks.language import Language
 from bridge.utils.logger import setup_logger
 
@@ -279,6 +280,9 @@ def _update_list_variables_checked_upload(
         json.loads(list_saved), columns=["Variable", selected_column]
     )
     df_list_upload = df_list_upload[df_list_upload[selected_column].notnull()]
+    data_dictionary = DataDictionary(df_datadicc)
+    list_saved_dictionary = DataDictionary(df_list_saved)
+    list_upload_dictionary = DataDictionary(df_list_upload)
 
     list_variable_choices_updated = []
 
@@ -289,20 +293,18 @@ def _update_list_variables_checked_upload(
         variable_name = row["Variable"]
         variable_name_not_selected = f"{variable_name}_otherl2"
 
-        df_upload_variable = df_list_upload.loc[
-            df_list_upload["Variable"] == variable_name
-        ]
-
-        list_items_saved = df_list_saved.loc[
-            df_list_saved["Variable"] == variable_name, selected_column
-        ].values[0]
+        list_items_saved = list_saved_dictionary.get_value(
+            variable_name, selected_column
+        )
 
         for list_item in list_items_saved:
             list_item_name = list_item[1]
             list_item_number = list_item[0]
 
-            if not df_upload_variable.empty:
-                variables_checked = df_upload_variable[selected_column].values[0]
+            if variable_name in list_upload_dictionary:
+                variables_checked = list_upload_dictionary.get_value(
+                    variable_name, selected_column
+                )
                 checked_list = variables_checked.split("|")
                 if list_item_name in checked_list:
                     list_items_updated.append(
@@ -324,14 +326,16 @@ def _update_list_variables_checked_upload(
                     f"{list_item_number}, {str(list_item_name)} | "
                 )
 
-        df_datadicc.loc[df_datadicc["Variable"] == variable_name, "Answer Options"] = (
-            f"{select_answer_options}88, {other_text}"
+        data_dictionary.set_value(
+            variable_name,
+            "Answer Options",
+            f"{select_answer_options}88, {other_text}",
+        )
+        data_dictionary.set_value(
+            variable_name_not_selected,
+            "Answer Options",
+            f"{not_select_answer_options}88, {other_text}",
         )
-
-        if variable_name_not_selected in list(df_datadicc["Variable"]):
-            df_datadicc.loc[
-                df_datadicc["Variable"] == variable_name_not_selected, "Answer Options"
-            ] = f"{not_select_answer_options}88, {other_text}"
 
         list_variable_choices_updated.append([variable_name, list_items_updated])
 
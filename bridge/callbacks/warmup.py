@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from os import getenv
+from threading import Event, Lock, Thread
+from time import perf_counter
+
+from packaging.version import parse
+
+from bridge.arc import arc_core
+from bridge.arc.arc_api import ArcApiClient, ArcApiClientError
+from bridge.arc.arc_rate_limit import background_requests
+from bridge.callbacks.language import Language
+from bridge.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# The background warm-up of every ARC version and language is opt-in
+ARC_WARMUP_ENABLED = getenv("ARC_WARMUP_ENABLED", "false").lower() in ("1", "true")
+ARC_WARMUP_MAX_WORKERS = int(getenv("ARC_WARMUP_MAX_WORKERS", "2"))
+# Languages are warmed up in this order, followed by any others alphabetically
+ARC_WARMUP_LANGUAGES = [
+    language.strip()
+    for language in getenv(
+        "ARC_WARMUP_LANGUAGES", "English,Spanish,French,Portuguese"
+    ).split(",")
+    if language.strip()
+]
+
+
+def get_warmup_plan(
+    version_language_lists: dict[str, list[str]],
+    language_priority: list[str],
+) -> list[tuple[str, str]]:
+    """:py:class:`list` : Returns the ARC versions and languages in warm-up order.
+
+    Versions are ordered latest first, and the languages of each version in
+    the given priority order, followed by any other languages alphabetically.
+
+    Parameters
+    ----------
+    version_language_lists : dict
+        The available languages of each ARC version.
+
+    language_priority : list
+        The languages to warm up first, in order.
+
+    Returns
+    -------
+    list
+        A list of ``(version, language)`` tuples.
+    """
+
+    def language_sort_key(language: str) -> tuple[int, str]:
+        if language in language_priority:
+            return language_priority.index(language), language
+        return len(language_priority), language
+
+    return [
+        (version, language)
+        for version in sorted(
+            version_language_lists,
+            key=lambda version: parse(version.replace("v", "")),
+            reverse=True,
+        )
+        for language in sorted(version_language_lists[version], key=language_sort_key)
+    ]
+
+
+class ArcWarmup:
+    """A background warm-up of the caches for every ARC version and language.
+
+    The warm-up runs in a daemon thread, which builds the version language
+    data for each ARC version and language in warm-up order, with at most
+    ``max_workers`` built concurrently, so the first user to select them
+    doesn't have to wait for a cold build. If given a ``ready`` event, such
+    as that of the ARC bootstrap, the warm-up waits for it to be set first, so
+    it doesn't compete with loading the initial ARC data. Failures are logged
+    and skipped.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = ARC_WARMUP_MAX_WORKERS,
+        language_priority: list[str] | None = None,
+        ready: Event | None = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.language_priority = (
+            ARC_WARMUP_LANGUAGES if language_priority is None else language_priority
+        )
+        self.ready = ready
+        self._lock = Lock()
+        self._thread: Thread | None = None
+        self._progress = {
+            "status": "pending",
+            "total": 0,
+            "completed": 0,
+            "failed": 0,
+            "elapsed_ms": 0.0,
+        }
+
+    def get_progress(self) -> dict:
+        with self._lock:
+            return dict(self._progress)
+
+    def _update_progress(self, **kwargs) -> None:
+        with self._lock:
+            self._progress.update(kwargs)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = Thread(target=self.run, name="arc-warmup", daemon=True)
+        self._thread.start()
+
+    def get_plan(self) -> list[tuple[str, str]]:
+        with background_requests():
+            version_list, _ = arc_core.get_arc_versions()
+            version_language_lists = {
+                version: ArcApiClient().get_arc_language_list_version(version)
+                for version in version_list
+            }
+        return get_warmup_plan(version_language_lists, self.language_priority)
+
+    @staticmethod
+    def warm_up(version: str, language: str) -> None:
+        # The warm-up is deferred rather than using up the GitHub rate limit
+        # budget reserved for users
+        with background_requests():
+            Language(version, language).get_version_language_related_data()
+
+    def run(self) -> None:
+        if self.ready is not None:
+            self.ready.wait()
+        warmup_start = perf_counter()
+        self._update_progress(status="running")
+
+        try:
+            plan = self.get_plan()
+        except ArcApiClientError as e:
+            logger.error(f"ARC warm-up failed to list versions and languages: {e}")
+            self._update_progress(status="failed")
+            return
+
+        self._update_progress(total=len(plan))
+        completed = 0
+        failed = 0
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="arc-warmup"
+        ) as executor:
+            futures = {
+                executor.submit(self.warm_up, version, language): (version, language)
+                for version, language in plan
+            }
+            for future in as_completed(futures):
+                version, language = futures[future]
+                try:
+                    future.result()
+                    completed += 1
+                except Exception as e:
+                    failed += 1
+                    logger.warning(
+                        f"ARC warm-up failed for version {version} and "
+                        f"language {language}: {e}"
+                    )
+                self._update_progress(
+                    completed=completed,
+                    failed=failed,
+                    elapsed_ms=(perf_counter() - warmup_start) * 1000,
+                )
+
+        self._update_progress(status="complete")
+        logger.info(
+            "ARC warm-up complete total=%s failed=%s elapsed_ms=%.3f",
+            len(plan),
+            failed,
+            (perf_counter() - warmup_start) * 1000,
+        )
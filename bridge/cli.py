@@ -1,4 +1,6 @@
 __all__ = [
+    "sync_arc_mirror",
+    "build_arc_snapshots",
     "generate_paperlike_crf_pdf",
     "generate_paperlike_crf_word",
 ]
@@ -16,11 +18,14 @@ import click
 import pandas as pd
 
 # -- Internal libraries --
+import bridge.arc.arc_mirror as arc_mirror
 import bridge.generate_pdf.paper_crf as paper_crf
 import bridge.generate_pdf.paper_word as paper_word
 
 from bridge import __version__
-from bridge.arc.arc_api import ArcApiClientError
+from bridge.arc.arc_api import ArcApiClient, ArcApiClientError
+from bridge.arc.arc_snapshot import ArcSnapshotStore
+from bridge.callbacks.language import Language
 from bridge.utils.logger import setup_logger
 
 
@@ -31,14 +36,159 @@ logger = setup_logger(__name__)  # pragma: no cover
 def bridge_cli(): ...
 
 
-@bridge_cli.group("arc", help="ARC-related commands. Not implemented.")
+@bridge_cli.group("arc", help="ARC-related commands.")
 def arc(): ...
 
 
+@arc.command(
+    "sync", help="Downloads ARC data from GitHub into a local offline mirror."
+)  # pragma: no cover
+@click.option(
+    "--mirror-dir",
+    required=True,
+    help="Path (absolute or relative) to the mirror directory, created if it doesn't exist",
+)
+@click.option(
+    "--arc-version",
+    "arc_versions",
+    multiple=True,
+    required=False,
+    help="Optional ARC version to sync, can be repeated, defaults to all versions",
+)
+@click.option(
+    "--language",
+    "languages",
+    multiple=True,
+    required=False,
+    help="Optional language to sync, can be repeated, defaults to all languages (English is always synced)",
+)
+@click.option(
+    "--archive-path",
+    required=False,
+    help="Optional target path, including filename with `.tar.gz` extension, to also write the mirror as an archive",
+)
+def sync_arc_mirror(
+    mirror_dir: str,
+    arc_versions: tuple[str, ...] = (),
+    languages: tuple[str, ...] = (),
+    archive_path: str | None = None,
+) -> None:
+    """Downloads ARC data from GitHub into a local offline mirror.
+
+    The mirror directory, or the archive, can then be used by setting the
+    ``ARC_MIRROR_DIR`` environment variable.
+
+    Parameters
+    ----------
+    mirror_dir : str
+        The local path to the mirror directory.
+
+    arc_versions : tuple, default=()
+        Optional ARC versions to sync, defaults to all versions.
+
+    languages : tuple, default=()
+        Optional languages to sync, defaults to all languages.
+
+    archive_path : str, default=None
+        Optional path to also write the mirror to as a ``.tar.gz`` archive.
+    """
+    mirror_dir = Path(mirror_dir).resolve()
+    mirror_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        synced_versions = arc_mirror.sync_arc_mirror(
+            mirror_dir,
+            versions=list(arc_versions) or None,
+            languages=list(languages) or None,
+        )
+    except ArcApiClientError as e:
+        logger.error(e)
+        sys.exit(1)
+
+    logger.info(f"ARC versions {synced_versions} synced to mirror {mirror_dir}.")
+
+    if archive_path:
+        archive_path = Path(archive_path).resolve()
+        arc_mirror.write_arc_mirror_archive(mirror_dir, archive_path)
+        logger.info(f"ARC mirror written to archive {archive_path}.")
+
+
 @bridge_cli.group("crf", help="Case report form (CRF)-related commands.")
 def crf(): ...
 
 
+@arc.command(
+    "snapshot",
+    help="Builds precompiled ARC snapshots for each ARC version and language.",
+)  # pragma: no cover
+@click.option(
+    "--snapshot-dir",
+    required=True,
+    help="Path (absolute or relative) to the snapshot directory, created if it doesn't exist",
+)
+@click.option(
+    "--arc-version",
+    "arc_versions",
+    multiple=True,
+    required=False,
+    help="Optional ARC version to build, can be repeated, defaults to all versions",
+)
+@click.option(
+    "--language",
+    "languages",
+    multiple=True,
+    required=False,
+    help="Optional language to build, can be repeated, defaults to all languages",
+)
+def build_arc_snapshots(
+    snapshot_dir: str,
+    arc_versions: tuple[str, ...] = (),
+    languages: tuple[str, ...] = (),
+) -> None:
+    """Builds precompiled ARC snapshots for each ARC version and language.
+
+    The snapshot directory can then be used by setting the
+    ``ARC_SNAPSHOT_DIR`` environment variable.
+
+    Parameters
+    ----------
+    snapshot_dir : str
+        The local path to the snapshot directory.
+
+    arc_versions : tuple, default=()
+        Optional ARC versions to build, defaults to all versions.
+
+    languages : tuple, default=()
+        Optional languages to build, defaults to all languages.
+    """
+    if not ArcSnapshotStore.is_available():
+        logger.error("ARC snapshots need pyarrow: install the `snapshot` extra")
+        sys.exit(1)
+
+    snapshot_store = ArcSnapshotStore(Path(snapshot_dir).resolve())
+    failed = []
+    try:
+        client = ArcApiClient()
+        for arc_version in arc_versions or client.get_arc_version_list():
+            for language in client.get_arc_language_list_version(arc_version):
+                if languages and language not in languages:
+                    continue
+                logger.info(
+                    f"Building ARC snapshot for version {arc_version} and language {language}."
+                )
+                if not Language(arc_version, language).write_snapshot(snapshot_store):
+                    failed.append((arc_version, language))
+    except ArcApiClientError as e:
+        logger.error(e)
+        sys.exit(1)
+
+    if failed:
+        logger.error(f"Failed to build ARC snapshots for {failed}.")
+        sys.exit(1)
+
+    logger.info(f"ARC snapshots written to {snapshot_store.snapshot_dir}.")
+
+
 @crf.group("paperlike-pdf", help="Commands relating to paperlike PDFs of CRFs.")
 def paperlike_pdf(): ...
 
@@ -1,4 +1,3 @@
-import re
 from typing import List, Callable
 
 import pandas as pd
@@ -12,6 +11,7 @@ from bridge.generate_pdf.form_classes import (
     Dependency,
     SubsectionStyle,
 )
+from bridge.utils.skip_logic import parse_skip_logic
 from bridge.generate_pdf.form_construct import (
     construct_medication_form,
     construct_standard_row,
@@ -92,21 +92,10 @@ class Form:
 
     @staticmethod
     def _parse_branching_logic(logic_str: str) -> List[Dependency]:
-        dependency_list = []
-
-        # Split on boolean operators while keeping the operators
-        tokens = re.split(r"\s+(and|or)\s+", logic_str, flags=re.IGNORECASE)
-
-        for token in tokens:
-            if token.lower() in ["and", "or"]:
-                continue
-            # Match patterns like [field]='1' or [field] < 5
-            match = re.match(r'\[(\w+)\] ?([!=<>]+) ?[\'"]?(\w+)[\'"]?', token)
-
-            if match:
-                field, operator, value = match.groups()
-                dependency_list.append(Dependency(field, operator, value))
-        return dependency_list
+        return [
+            Dependency(comparison.variable, comparison.operator, str(comparison.value))
+            for comparison in parse_skip_logic(logic_str).comparisons
+        ]
 
     def _format_multi_choice_field(
         self, row: pd.Series, new_field: Field
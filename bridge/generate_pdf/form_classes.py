@@ -10,13 +10,13 @@ Section >               a group of questions in a form, all under on Section Hea
           Dependency    each field can have dependencies, this holds the dependencies from the Branching Logic in a clear and reproducible way
 """
 
-import re
 from enum import Enum
 from typing import List, Callable
 
 from reportlab.platypus import Paragraph
 
 from bridge.generate_pdf import styles
+from bridge.utils.skip_logic import parse_skip_logic
 
 LINE_PLACEHOLDER = "_" * 40
 
@@ -749,13 +749,7 @@ class Section:
         """Extract dependencies from a branching logic string."""
         if not branching_logic_str:
             return set()
-        pattern = r"\[([^\]]+)\]"  # Matches content within square brackets
-        matches = re.findall(pattern, branching_logic_str)
-
-        for match in matches:
-            if match.endswith("t(88)"):
-                matches.append(match.removesuffix("t(88)"))
-        return set(matches)
+        return set(parse_skip_logic(branching_logic_str).variables)
 
     def divide_by_branching_logic(self):
         """Divides self.fields into subsections based on headings and dependencies."""
@@ -0,0 +1,150 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# The tokens of a skip logic: references to variables, e.g. `[demog_sex]`, or
+# `[inclu_testreason(88)]` for a checkbox option, comparison operators,
+# logical operators and values, quoted or not. Anything else, e.g.
+# parentheses and whitespace, is skipped.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<reference>\[\s*(?P<variable>[^\[\]()]+?)\s*(?:\((?P<option>[^()\[\]]*)\))?\s*\])
+    | (?P<comparison_operator><>|!=|<=|>=|==|=|<|>)
+    | (?P<logical_operator>\b(?:and|or)\b)
+    | (?P<value>'[^']*'|"[^"]*"|[\w.+-]+)
+    """,
+    flags=re.VERBOSE | re.IGNORECASE,
+)
+_NUMBER_PATTERN = re.compile(r"[+-]?\d+(\.\d*)?")
+
+# The values of a checkbox option reference meaning that it is checked
+_CHECKED_VALUES = ("1", 1)
+
+
+class SkipLogicCondition(NamedTuple):
+    """A single reference to a variable in a skip logic, e.g. `[demog_sex]='1'`.
+
+    The operator and value are ``None`` if the reference isn't compared to a
+    value.
+    """
+
+    variable: str
+    # The option of a checkbox option reference, e.g. `88` of
+    # `[inclu_testreason(88)]`
+    option: str | None
+    operator: str | None
+    # Quoted values are text, and unquoted numbers are an `int` or `float`
+    value: str | int | float | None
+
+    @property
+    def reference(self) -> str:
+        """:py:class:`str` : Returns the reference, as in the skip logic."""
+        if self.option is None:
+            return self.variable
+        return f"{self.variable}({self.option})"
+
+    def get_comparison(self) -> "SkipLogicCondition":
+        """:py:class:`SkipLogicCondition` : Returns the condition as a comparison of the variable.
+
+        A checkbox option reference compared to 1, e.g.
+        `[inclu_testreason(88)]='1'`, is the comparison of the variable to the
+        option, e.g. `[inclu_testreason]='88'`, and compared to anything else,
+        e.g. `[inclu_testreason(88)]='0'`, is `[inclu_testreason]<>'88'`.
+        """
+        if self.option is None:
+            return self
+        operator = "=" if self.value in _CHECKED_VALUES else "<>"
+        return SkipLogicCondition(self.variable, None, operator, self.option)
+
+
+class SkipLogic(NamedTuple):
+    """A skip logic (REDCap branching logic), parsed into its conditions.
+
+    All the fields are derived from the conditions, in the order they appear in
+    the logic, and are tuples, so that a parsed skip logic can be shared by
+    every caller.
+    """
+
+    # Every reference, including those not compared to a value
+    conditions: tuple[SkipLogicCondition, ...]
+    # The comparisons of the conditions compared to a value, as returned by
+    # `SkipLogicCondition.get_comparison`
+    comparisons: tuple[SkipLogicCondition, ...]
+    # The logical operators joining the comparisons, lowercase, or "" if
+    # there is none between two comparisons
+    logical_operators: tuple[str, ...]
+    # The references and variables of all the conditions
+    references: tuple[str, ...]
+    variables: tuple[str, ...]
+
+
+def _parse_value(raw_value: str) -> str | int | float:
+    if raw_value[0] in "'\"":
+        return raw_value[1:-1]
+    if _NUMBER_PATTERN.fullmatch(raw_value):
+        if "." in raw_value:
+            return float(raw_value)
+        return int(raw_value)
+    return raw_value
+
+
+@lru_cache(maxsize=4096)
+def parse_skip_logic(skip_logic: str) -> SkipLogic:
+    """:py:class:`SkipLogic` : Parses a skip logic string.
+
+    The skip logic is tokenized once, into a condition for each variable
+    reference, with the comparison operator and value following it, joined
+    by the logical operators. The same skip logic strings appear in many rows
+    of the ARC data dictionary, and are parsed for both the ARC translations
+    and the PDF forms, so the parsed result is memoized.
+
+    Parameters
+    ----------
+    skip_logic : str
+        A skip logic, e.g. ``[demog_sex]='1' and [demog_age]>=18``.
+
+    Returns
+    -------
+    SkipLogic
+        The parsed skip logic.
+    """
+    conditions = []
+    comparisons = []
+    logical_operators = []
+    logical_operator = ""
+
+    variable = option = operator = None
+    for match in _TOKEN_PATTERN.finditer(skip_logic):
+        token_type = match.lastgroup
+        if token_type == "reference":
+            if variable is not None:
+                conditions.append(SkipLogicCondition(variable, option, None, None))
+            variable = match.group("variable")
+            option = match.group("option")
+            operator = None
+        elif token_type == "comparison_operator":
+            if variable is not None and operator is None:
+                operator = match.group("comparison_operator")
+        elif token_type == "logical_operator":
+            if comparisons and variable is None:
+                logical_operator = match.group("logical_operator").lower()
+        elif variable is not None and operator is not None:
+            condition = SkipLogicCondition(
+                variable, option, operator, _parse_value(match.group("value"))
+            )
+            conditions.append(condition)
+            if comparisons:
+                logical_operators.append(logical_operator)
+            comparisons.append(condition.get_comparison())
+            logical_operator = ""
+            variable = option = operator = None
+    if variable is not None:
+        conditions.append(SkipLogicCondition(variable, option, None, None))
+
+    return SkipLogic(
+        conditions=tuple(conditions),
+        comparisons=tuple(comparisons),
+        logical_operators=tuple(logical_operators),
+        references=tuple(condition.reference for condition in conditions),
+        variables=tuple(condition.variable for condition in conditions),
+    )
@@ -1,6 +1,10 @@
 import os
+import shutil
+import tarfile
+from threading import Event
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -8,6 +12,11 @@ from requests.exceptions import RequestException
 
 from bridge.arc import arc_api
 from bridge.arc.arc_api import ArcApiClient, ArcApiClientError
+from bridge.arc.arc_rate_limit import (
+    ArcRateLimitBudget,
+    background_requests,
+    is_background_request,
+)
 
 
 @pytest.fixture(scope="session")
@@ -24,6 +33,16 @@ def client_development():
     return ArcApiClient()
 
 
+@pytest.fixture()
+def empty_generation_caches():
+    with (
+        mock.patch.object(arc_api, "_ARC_PAPER_LIKE_DF_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_SUPPLEMENTAL_PHRASES_DF_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_CRF_METADATA_DF_CACHE", {}),
+    ):
+        yield
+
+
 @pytest.fixture()
 def data_path():
     data_path = "my/test/path"
@@ -65,30 +84,141 @@ def mock_language_json():
     return language_json
 
 
+class FakeResponse:
+    def __init__(self, json_data=None, status_code=200, headers=None, content=b""):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RequestException
+
+    def json(self):
+        return self.json_data
+
+
 @mock.patch("bridge.arc.arc_api.logger")
 def test_get_api_response_exception(_mock_logger, client_production):
-    class FakeResponse:
-        def raise_for_status(self):
-            raise RequestException
+    mock_session = mock.Mock()
+    mock_session.get.return_value = FakeResponse(status_code=500)
 
-    with mock.patch("bridge.arc.arc_api.requests.get", return_value=FakeResponse()):
+    with mock.patch("bridge.arc.arc_api.get_arc_session", return_value=mock_session):
         with pytest.raises(ArcApiClientError):
             client_production._get_api_response("test_url")
 
 
 @mock.patch("bridge.arc.arc_api.logger")
 def test_get_api_response(_mock_logger, mock_language_json, client_production):
-    class FakeResponse:
-        def raise_for_status(self):
-            pass
+    mock_session = mock.Mock()
+    mock_session.get.return_value = FakeResponse(mock_language_json)
 
-        @staticmethod
-        def json():
-            return mock_language_json
-
-    with mock.patch("bridge.arc.arc_api.requests.get", return_value=FakeResponse()):
+    with mock.patch("bridge.arc.arc_api.get_arc_session", return_value=mock_session):
         output = client_production._get_api_response("test_url")
         assert output == mock_language_json
+        assert mock_session.get.call_args.kwargs["timeout"] == (
+            arc_api.ARC_HTTP_TIMEOUT_SECONDS
+        )
+
+
+@mock.patch("bridge.arc.arc_api.logger")
+def test_get_api_response_not_modified(
+    _mock_logger, mock_language_json, client_production
+):
+    mock_session = mock.Mock()
+    mock_session.get.side_effect = [
+        FakeResponse(
+            mock_language_json,
+            headers={"ETag": '"abc"', "Last-Modified": "Mon, 01 Jun 2026 00:00:00 GMT"},
+        ),
+        FakeResponse(status_code=304),
+    ]
+
+    with mock.patch.object(arc_api, "_API_RESPONSE_CACHE", {}):
+        with mock.patch(
+            "bridge.arc.arc_api.get_arc_session", return_value=mock_session
+        ):
+            client_production._get_api_response("test_url")
+            output = client_production._get_api_response("test_url")
+
+    assert output == mock_language_json
+    second_call_headers = mock_session.get.call_args_list[1].kwargs["headers"]
+    assert second_call_headers["If-None-Match"] == '"abc"'
+    assert second_call_headers["If-Modified-Since"] == "Mon, 01 Jun 2026 00:00:00 GMT"
+
+
+@mock.patch("bridge.arc.arc_api.logger")
+@mock.patch("bridge.arc.arc_rate_limit.logger")
+def test_get_api_response_rate_limit_low(
+    _mock_rate_limit_logger, _mock_logger, mock_language_json, client_production
+):
+    mock_session = mock.Mock()
+    mock_session.get.return_value = FakeResponse(
+        mock_language_json,
+        headers={
+            "ETag": '"abc"',
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": "9999999999",
+        },
+    )
+
+    with (
+        mock.patch.object(arc_api, "_API_RESPONSE_CACHE", {}),
+        mock.patch.object(
+            arc_api, "ARC_RATE_LIMIT_BUDGET", ArcRateLimitBudget(reserve=10)
+        ),
+        mock.patch("bridge.arc.arc_api.get_arc_session", return_value=mock_session),
+    ):
+        client_production._get_api_response("test_url")
+        # The cached response is used rather than spending the reserve
+        assert client_production._get_api_response("test_url") == mock_language_json
+        # Background requests are deferred
+        with background_requests():
+            with pytest.raises(ArcApiClientError, match="Deferred"):
+                client_production._get_api_response("other_url")
+        # User-facing requests can use the reserve
+        client_production._get_api_response("other_url")
+
+    assert mock_session.get.call_count == 2
+
+
+def test_get_arc_session_reused():
+    with mock.patch.object(arc_api, "_SESSION", None):
+        session = arc_api.get_arc_session()
+        assert arc_api.get_arc_session() is session
+        adapter = session.get_adapter("https://api.github.com")
+        assert adapter.max_retries.total == arc_api.ARC_HTTP_MAX_RETRIES
+        assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_get_arc_session_new_process():
+    with mock.patch.object(arc_api, "_SESSION", None):
+        session = arc_api.get_arc_session()
+        with mock.patch("bridge.arc.arc_api.os.getpid", return_value=-1):
+            assert arc_api.get_arc_session() is not session
+
+
+@mock.patch("bridge.arc.arc_api.logger")
+def test_write_to_dataframe_url(_mock_logger):
+    mock_session = mock.Mock()
+    mock_session.get.return_value = FakeResponse(content=b"Variable\nsubjid\n")
+
+    with mock.patch("bridge.arc.arc_api.get_arc_session", return_value=mock_session):
+        output = ArcApiClient._write_to_dataframe("https://test/ARC.csv")
+
+    assert_frame_equal(output, pd.DataFrame({"Variable": ["subjid"]}))
+
+
+@mock.patch("bridge.arc.arc_api.logger")
+def test_write_to_dataframe_url_exception(_mock_logger):
+    mock_session = mock.Mock()
+    mock_session.get.return_value = FakeResponse(status_code=404)
+
+    with mock.patch("bridge.arc.arc_api.get_arc_session", return_value=mock_session):
+        with pytest.raises(ArcApiClientError):
+            ArcApiClient._write_to_dataframe("https://test/ARC.csv")
 
 
 @mock.patch("bridge.arc.arc_api.pd.read_csv")
@@ -157,15 +287,62 @@ def test_get_arc_version_list_with_cache_old(
 
     cache_key = ("production",)
     cache_dict = {cache_key: (["v1.0.4", "v1.0.0"], 5)}
-    with mock.patch.object(arc_api, "_ARC_VERSION_LIST_CACHE", cache_dict):
-        expected = [
-            "v1.1.0",
-            "v1.0.4",
-            "v1.0.0",
-        ]
+    refreshes = []
+    with (
+        mock.patch.object(arc_api, "_ARC_VERSION_LIST_CACHE", cache_dict),
+        mock.patch(
+            "bridge.arc.arc_api.refresh_metadata_in_background",
+            side_effect=lambda refresh_key, refresh_function: refreshes.append(
+                (refresh_key, refresh_function)
+            ),
+        ),
+    ):
+        # The stale list is returned without waiting for GitHub
         output = client_production.get_arc_version_list()
+        assert output == ["v1.0.4", "v1.0.0"]
+
+        ((refresh_key, refresh_function),) = refreshes
+        assert refresh_key == ("arc_version_list", "production")
+        refresh_function()
+        assert cache_dict[cache_key][0] == ["v1.1.0", "v1.0.4", "v1.0.0"]
 
-        assert output == expected
+
+@mock.patch("bridge.arc.arc_api.logger")
+def test_refresh_metadata_in_background(mock_logger):
+    release = Event()
+    refresh_function = mock.Mock(side_effect=lambda: release.wait(5))
+
+    with mock.patch.object(arc_api, "_METADATA_REFRESHES", set()):
+        refresh_thread = arc_api.refresh_metadata_in_background(
+            ("arc_version_list",), refresh_function
+        )
+        # Only a single refresh of each entry is in flight at a time
+        assert (
+            arc_api.refresh_metadata_in_background(
+                ("arc_version_list",), refresh_function
+            )
+            is None
+        )
+        release.set()
+        refresh_thread.join(5)
+        refresh_function.assert_called_once()
+
+        # Failures are logged, and the entry can be refreshed again
+        refresh_function.side_effect = ArcApiClientError("Deferred request")
+        arc_api.refresh_metadata_in_background(
+            ("arc_version_list",), refresh_function
+        ).join(5)
+        mock_logger.warning.assert_called_once()
+        assert arc_api._METADATA_REFRESHES == set()
+
+
+def test_refresh_metadata_in_background_is_background_request():
+    background_request_flags = []
+    arc_api.refresh_metadata_in_background(
+        ("test_background_request",),
+        lambda: background_request_flags.append(is_background_request()),
+    ).join(5)
+    assert background_request_flags == [True]
 
 
 @mock.patch("bridge.arc.arc_api.monotonic", return_value=0)
@@ -278,6 +455,52 @@ def test_get_arc_version_sha_with_cache(client_production):
         assert output == expected_sha
 
 
+@mock.patch("bridge.arc.arc_api.ArcApiClient._get_api_response")
+def test_get_arc_version_sha_paginated(mock_tag_json, client_production):
+    expected_sha = "87e78283e0412d78e247fd2a2618e2bb09a0ca17"
+    first_page = [
+        {"commit": {"sha": f"{i:040x}"}, "name": f"v2.0.{i}"}
+        for i in range(arc_api.GITHUB_API_PAGE_SIZE)
+    ]
+    second_page = [{"commit": {"sha": expected_sha}, "name": "v1.0.0"}]
+    mock_tag_json.side_effect = [first_page, second_page]
+
+    with (
+        mock.patch.object(arc_api, "_VERSION_SHA_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_TAG_SHA_INDEX_CACHE", {}),
+    ):
+        assert client_production.get_arc_version_sha("v1.0.0") == expected_sha
+        # Answered from the index, without any further requests
+        assert client_production.get_arc_version_sha("v2.0.1") == f"{1:040x}"
+
+    url = "https://api.github.com/repos/ISARICResearch/ARC/tags"
+    assert mock_tag_json.call_args_list == [
+        mock.call(f"{url}?per_page=100&page=1"),
+        mock.call(f"{url}?per_page=100&page=2"),
+    ]
+
+
+@mock.patch("bridge.arc.arc_api.ArcApiClient._get_api_response")
+def test_get_arc_version_sha_index_refreshed(mock_tag_json, client_production):
+    mock_tag_json.side_effect = [
+        [{"commit": {"sha": "abc"}, "name": "v1.0.0"}],
+        [
+            {"commit": {"sha": "def"}, "name": "v1.1.0"},
+            {"commit": {"sha": "abc"}, "name": "v1.0.0"},
+        ],
+    ]
+
+    with (
+        mock.patch.object(arc_api, "_VERSION_SHA_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_TAG_SHA_INDEX_CACHE", {}),
+    ):
+        assert client_production.get_arc_version_sha("v1.0.0") == "abc"
+        # A newly released version refreshes the index
+        assert client_production.get_arc_version_sha("v1.1.0") == "def"
+
+    assert mock_tag_json.call_count == 2
+
+
 @mock.patch("bridge.arc.arc_api.ArcApiClient._get_api_response")
 def test_get_arc_version_sha_development(mock_tag_json, client_development):
     expected_sha = "000000a"
@@ -374,6 +597,47 @@ def test_get_dataframe_arc_list_version_language_with_cache(client_production):
     assert_frame_equal(df_output, df_cache)
 
 
+@mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
+@mock.patch("bridge.arc.arc_api.get_arc_shared_cache")
+def test_get_dataframe_arc_sha_shared_cache(
+    mock_get_shared_cache, mock_write_to_df, client_production
+):
+    df_shared = pd.DataFrame({"Variable": ["subjid"]})
+    mock_get_shared_cache.return_value.get.return_value = df_shared
+
+    with mock.patch.object(arc_api, "_ARC_DF_CACHE", {}) as cache_dict:
+        df_output = client_production.get_dataframe_arc_sha("abc123", "v1.1.1")
+
+    assert_frame_equal(df_output, df_shared)
+    mock_get_shared_cache.return_value.get.assert_called_once_with(
+        "arc_df", "production", "abc123", "v1.1.1"
+    )
+    mock_write_to_df.assert_not_called()
+    assert cache_dict[("production", "abc123", "v1.1.1")] is df_shared
+
+
+@mock.patch("bridge.arc.arc_api.ArcApiClient._get_dataframe_raw_content")
+@mock.patch("bridge.arc.arc_api.get_arc_shared_cache")
+def test_get_dataframe_arc_version_language_shared_cache_miss(
+    mock_get_shared_cache, mock_raw_content, client_production
+):
+    df_translation = pd.DataFrame({"Variable": ["subjid"]})
+    mock_get_shared_cache.return_value.get.return_value = None
+    mock_raw_content.return_value = df_translation
+
+    with mock.patch.object(arc_api, "_ARC_TRANSLATION_DF_CACHE", {}):
+        client_production.get_dataframe_arc_version_language("v1.1.1", "French")
+
+    mock_get_shared_cache.return_value.set.assert_called_once_with(
+        "arc_translation_df",
+        "production",
+        "v1.1.1",
+        "French",
+        value=df_translation,
+        ttl_seconds=arc_api.ARC_METADATA_CACHE_TTL_SECONDS,
+    )
+
+
 @mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
 def test_get_dataframe_arc_list_version_language_development(
     mock_write_to_df, client_development
@@ -427,12 +691,35 @@ def test_get_arc_language_list_version(
     assert output == expected
 
 
-def test_get_arc_language_list_version_with_cache(client_production):
+@mock.patch("bridge.arc.arc_api.refresh_metadata_in_background")
+@mock.patch("bridge.arc.arc_api.monotonic", return_value=0)
+def test_get_arc_language_list_version_with_cache(
+    _mock_mono, mock_refresh, client_production
+):
+    cache_key = ("production", "v1.1.1")
+    cache_dict = {cache_key: (["a", "b", "c"], 0)}
+    with mock.patch.object(arc_api, "_ARC_LANGUAGE_LIST_CACHE", cache_dict):
+        output = client_production.get_arc_language_list_version("v1.1.1")
+    assert output == ["a", "b", "c"]
+    mock_refresh.assert_not_called()
+
+
+@mock.patch("bridge.arc.arc_api.refresh_metadata_in_background")
+@mock.patch("bridge.arc.arc_api.monotonic", return_value=1234567890)
+def test_get_arc_language_list_version_with_cache_old(
+    _mock_mono, mock_refresh, client_production
+):
     cache_key = ("production", "v1.1.1")
-    cache_dict = {cache_key: ["a", "b", "c"]}
+    cache_dict = {cache_key: (["a", "b", "c"], 0)}
     with mock.patch.object(arc_api, "_ARC_LANGUAGE_LIST_CACHE", cache_dict):
         output = client_production.get_arc_language_list_version("v1.1.1")
+    # The stale list is returned, and refreshed in the background
     assert output == ["a", "b", "c"]
+    assert mock_refresh.call_args.args[0] == (
+        "arc_language_list",
+        "production",
+        "v1.1.1",
+    )
 
 
 def test_get_arc_language_list_version_development(client_development):
@@ -486,6 +773,21 @@ def test_get_dataframe_arc_sha_with_cache(client_production):
     assert_frame_equal(df_output, df_cache)
 
 
+def test_get_dataframe_arc_sha_with_cache_not_copied(client_production):
+    cache_key = ("production", "abc123mysha", "v1.1.1")
+    df_cache = pd.DataFrame({"Form": ["A form", "B form", "C form"]})
+    cache_dict = {cache_key: df_cache}
+    with mock.patch.object(arc_api, "_ARC_DF_CACHE", cache_dict):
+        df_output = client_production.get_dataframe_arc_sha("abc123mysha", "v1.1.1")
+
+    # The data is shared on a cache hit, and only copied when modified
+    assert np.shares_memory(df_output["Form"].values, df_cache["Form"].values)
+    df_output.loc[0, "Form"] = "D form"
+    df_output["Section"] = "inclu"
+    assert df_cache["Form"].to_list() == ["A form", "B form", "C form"]
+    assert "Section" not in df_cache.columns
+
+
 @mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
 def test_get_dataframe_arc_version_language_prod(mock_write_to_df, client_production):
     client_production.get_dataframe_arc_version_language("v1.1.1", "English")
@@ -518,7 +820,7 @@ def test_get_dataframe_arc_version_language_with_cache(client_production):
 
 @mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
 def test_get_dataframe_paper_like_details_prod__no_api_client_error(
-    mock_write_to_df, client_production
+    mock_write_to_df, client_production, empty_generation_caches
 ):
     client_production.get_dataframe_paper_like_details("v1.1.1", "English")
     url = "https://raw.githubusercontent.com/ISARICResearch/ARC-Translations/main/ARCH1.1.1/English/paper_like_details.csv"
@@ -529,7 +831,7 @@ def test_get_dataframe_paper_like_details_prod__no_api_client_error(
     "bridge.arc.arc_api.ArcApiClient._write_to_dataframe", side_effect=ArcApiClientError
 )
 def test_get_dataframe_paper_like_details_prod__api_client_error_caught_and_raised(
-    mock_write_to_df, client_production
+    mock_write_to_df, client_production, empty_generation_caches
 ):
     with pytest.raises(ArcApiClientError):
         client_production.get_dataframe_paper_like_details("v1.1.1", "English")
@@ -539,7 +841,7 @@ def test_get_dataframe_paper_like_details_prod__api_client_error_caught_and_rais
 
 @mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
 def test_get_dataframe_paper_like_details_dev__no_api_client_error(
-    mock_write_to_df, client_development
+    mock_write_to_df, client_development, empty_generation_caches
 ):
     client_development.get_dataframe_paper_like_details("v1.1.1", "English")
     url = "https://raw.githubusercontent.com/ISARICResearch/DataPlatform/main/ARCH/ARCH1.1.1/paper_like_details.csv"
@@ -550,7 +852,7 @@ def test_get_dataframe_paper_like_details_dev__no_api_client_error(
     "bridge.arc.arc_api.ArcApiClient._write_to_dataframe", side_effect=ArcApiClientError
 )
 def test_get_dataframe_paper_like_details_dev__api_client_error_caught_and_raised(
-    mock_write_to_df, client_development
+    mock_write_to_df, client_development, empty_generation_caches
 ):
     with pytest.raises(ArcApiClientError):
         client_development.get_dataframe_paper_like_details("v1.1.1", "English")
@@ -560,7 +862,7 @@ def test_get_dataframe_paper_like_details_dev__api_client_error_caught_and_raise
 
 @mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
 def test_get_dataframe_supplemental_phrases_prod__no_api_client_error(
-    mock_write_to_df, client_production
+    mock_write_to_df, client_production, empty_generation_caches
 ):
     client_production.get_dataframe_supplemental_phrases("v1.1.1", "English")
     url = "https://raw.githubusercontent.com/ISARICResearch/ARC-Translations/main/ARCH1.1.1/English/supplemental_phrases.csv"
@@ -571,7 +873,7 @@ def test_get_dataframe_supplemental_phrases_prod__no_api_client_error(
     "bridge.arc.arc_api.ArcApiClient._write_to_dataframe", side_effect=ArcApiClientError
 )
 def test_get_dataframe_supplemental_phrases_prod__api_client_error_caught_and_raised(
-    mock_write_to_df, client_production
+    mock_write_to_df, client_production, empty_generation_caches
 ):
     with pytest.raises(ArcApiClientError):
         client_production.get_dataframe_supplemental_phrases("v1.1.1", "English")
@@ -586,7 +888,7 @@ def test_get_dataframe_crf_metadata__prod__no_matching_version(client_production
 
 @mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
 def test_get_dataframe_crf_metadata__prod__no_api_client_error(
-    mock_write_to_df, client_production
+    mock_write_to_df, client_production, empty_generation_caches
 ):
     client_production.get_dataframe_crf_metadata("v1.4.0")
     url = "https://raw.githubusercontent.com/ISARICResearch/ARC/refs/tags/v1.4.0/crf_metadata.csv"
@@ -597,7 +899,7 @@ def test_get_dataframe_crf_metadata__prod__no_api_client_error(
     "bridge.arc.arc_api.ArcApiClient._write_to_dataframe", side_effect=ArcApiClientError
 )
 def test_get_dataframe_crf_metadata__prod__api_client_error_caught_and_raised(
-    mock_write_to_df, client_production
+    mock_write_to_df, client_production, empty_generation_caches
 ):
     with pytest.raises(ArcApiClientError):
         client_production.get_dataframe_crf_metadata("v1.4.0")
@@ -608,7 +910,7 @@ def test_get_dataframe_crf_metadata__prod__api_client_error_caught_and_raised(
 @mock.patch("bridge.arc.arc_api.ArcApiClient._get_api_response")
 @mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
 def test_get_dataframe_supplemental_phrases_dev(
-    mock_write_to_df, mock_release_json, client_development
+    mock_write_to_df, mock_release_json, client_development, empty_generation_caches
 ):
     release_json = [
         {"name": "v1.1.0", "tag_name": "v1.1.2"},
@@ -620,3 +922,102 @@ def test_get_dataframe_supplemental_phrases_dev(
     client_development.get_dataframe_supplemental_phrases("v1.0.0", "English")
     url = "https://raw.githubusercontent.com/ISARICResearch/ARC-Translations/main/ARCH1.1.2/English/supplemental_phrases.csv"
     mock_write_to_df.assert_called_with(url)
+
+
+@mock.patch("bridge.arc.arc_api.ArcApiClient._get_api_response")
+@mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
+def test_get_generation_dataframes_cached(
+    mock_write_to_df, mock_release_json, client_development, empty_generation_caches
+):
+    mock_release_json.return_value = [{"tag_name": "v1.1.2"}]
+    mock_write_to_df.return_value = pd.DataFrame({"Variable": ["subjid"]})
+
+    for _ in range(2):
+        client_development.get_dataframe_paper_like_details("v1.0.0", "English")
+        client_development.get_dataframe_supplemental_phrases("v1.0.0", "English")
+        client_development.get_dataframe_crf_metadata("v1.0.0")
+
+    assert mock_write_to_df.call_count == 3
+    mock_release_json.assert_called_once()
+
+
+def test_get_arc_disk_cache_disabled():
+    with mock.patch.object(arc_api, "ARC_DISK_CACHE_DIR", ""):
+        assert arc_api.get_arc_disk_cache() is None
+
+
+@mock.patch("bridge.arc.arc_api.ArcApiClient._write_to_dataframe")
+def test_get_dataframe_arc_sha_disk_cache(
+    mock_write_to_df, client_production, tmp_path
+):
+    sha = "87e78283e0412d78e247fd2a2618e2bb09a0ca17"
+    df_mock = pd.DataFrame({"Variable": ["subjid", "inclu_disease"]})
+    mock_write_to_df.return_value = df_mock
+
+    with mock.patch.object(arc_api, "ARC_DISK_CACHE_DIR", str(tmp_path)):
+        with mock.patch.object(arc_api, "_ARC_DF_CACHE", {}):
+            df_output = client_production.get_dataframe_arc_sha(sha, "v1.1.1")
+        assert_frame_equal(df_output, df_mock)
+        assert mock_write_to_df.call_count == 1
+
+        # A new process would start with an empty in-memory cache
+        with mock.patch.object(arc_api, "_ARC_DF_CACHE", {}):
+            df_output = client_production.get_dataframe_arc_sha(sha, "v1.1.1")
+        assert_frame_equal(df_output, df_mock)
+        assert mock_write_to_df.call_count == 1
+
+
+def test_get_arc_mirror_dir_disabled():
+    with mock.patch.object(arc_api, "ARC_MIRROR_DIR", ""):
+        assert arc_api.get_arc_mirror_dir() is None
+
+
+def test_get_arc_mirror_dir_archive(tmp_path):
+    mirror_dir = tmp_path.joinpath("mirror")
+    mirror_dir.joinpath("api", "ARC").mkdir(parents=True)
+    mirror_dir.joinpath("api", "ARC", "releases.json").write_text("[]")
+    archive_path = tmp_path.joinpath("mirror.tar.gz")
+    with tarfile.open(archive_path, "w:gz") as archive:
+        archive.add(mirror_dir.joinpath("api"), arcname="api")
+
+    with mock.patch.object(arc_api, "ARC_MIRROR_DIR", str(archive_path)):
+        extract_dir = arc_api.get_arc_mirror_dir()
+        assert extract_dir.joinpath("api", "ARC", "releases.json").read_text() == "[]"
+        # The archive is only extracted once
+        assert arc_api.get_arc_mirror_dir() == extract_dir
+    shutil.rmtree(extract_dir)
+
+
+@mock.patch.dict(os.environ, {"ENV": "production"})
+def test_arc_api_client_mirror(tmp_path):
+    sha = "87e78283e0412d78e247fd2a2618e2bb09a0ca17"
+    tmp_path.joinpath("api", "ARC").mkdir(parents=True)
+    tmp_path.joinpath("api", "ARC", "releases.json").write_text(
+        '[{"tag_name": "v1.1.1"}]'
+    )
+    tmp_path.joinpath("raw", "ARC", sha).mkdir(parents=True)
+    tmp_path.joinpath("raw", "ARC", sha, "ARC.csv").write_text("Variable\nsubjid\n")
+
+    with (
+        mock.patch.object(arc_api, "ARC_MIRROR_DIR", str(tmp_path)),
+        mock.patch.object(arc_api, "_ARC_VERSION_LIST_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_DF_CACHE", {}),
+        mock.patch("bridge.arc.arc_api.get_arc_session") as mock_get_session,
+    ):
+        client = ArcApiClient()
+        assert client.is_mirror
+        assert client.get_arc_version_list() == ["v1.1.1"]
+        assert_frame_equal(
+            client.get_dataframe_arc_sha(sha, "v1.1.1"),
+            pd.DataFrame({"Variable": ["subjid"]}),
+        )
+        mock_get_session.assert_not_called()
+
+
+@mock.patch("bridge.arc.arc_api.logger")
+def test_get_api_response_mirror_missing(_mock_logger, tmp_path):
+    with (
+        mock.patch.object(arc_api, "ARC_MIRROR_DIR", str(tmp_path)),
+        pytest.raises(ArcApiClientError),
+    ):
+        ArcApiClient._get_api_response(str(tmp_path.joinpath("api", "ARC", "tags")))
@@ -0,0 +1,218 @@
+from threading import Event
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from bridge.arc.arc_api import ArcApiClientError
+from bridge.arc import arc_api
+from bridge.arc import arc_bootstrap as arc_bootstrap_module
+from bridge.arc.arc_bootstrap import (
+    ArcBootstrap,
+    build_arc_bootstrap,
+    load_arc_bootstrap,
+    read_arc_bootstrap_snapshot,
+    write_arc_bootstrap_snapshot,
+)
+
+
+@mock.patch("bridge.arc.arc_bootstrap.ArcApiClient")
+@mock.patch("bridge.arc.arc_bootstrap.ArcList")
+@mock.patch("bridge.arc.arc_bootstrap.arc_tree.get_tree_items")
+@mock.patch("bridge.arc.arc_bootstrap.arc_core")
+def test_build_arc_bootstrap(
+    mock_arc_core, mock_get_tree_items, mock_arc_list, mock_client
+):
+    df_arc = pd.DataFrame({"Variable": ["subjid"]})
+    mock_arc_core.get_arc_versions.return_value = (["v1.1.0", "v1.2.0"], "v1.2.0")
+    mock_arc_core.get_arc.return_value = (
+        df_arc,
+        [["ARChetype Disease CRF", "Covid"]],
+        "abc123",
+    )
+    mock_arc_core.add_required_datadicc_columns.return_value = df_arc
+    mock_arc_core.add_transformed_rows.return_value = df_arc
+    mock_arc_core.get_dynamic_units_conversion_bool.return_value = False
+    mock_get_tree_items.return_value = {"title": "v1.2.0"}
+    mock_arc_list.return_value.get_all_list_content.return_value = (
+        df_arc,
+        [],
+        [["a"]],
+        [],
+    )
+    mock_client.return_value.get_arc_language_list_version.return_value = [
+        "English",
+        "French",
+    ]
+    mock_client.return_value.get_dataframe_crf_metadata.return_value = pd.DataFrame()
+
+    arc_bootstrap_data = build_arc_bootstrap()
+
+    assert arc_bootstrap_data["commit"] == "abc123"
+    assert arc_bootstrap_data["version_list"] == ["v1.1.0", "v1.2.0"]
+    assert arc_bootstrap_data["version_latest"] == "v1.2.0"
+    assert arc_bootstrap_data["language_list"] == ["English", "French"]
+    assert arc_bootstrap_data["language_default"] == "English"
+    assert arc_bootstrap_data["tree_items_data"] == {"title": "v1.2.0"}
+    assert arc_bootstrap_data["ulist_variable_json"] == '[["a"]]'
+    assert arc_bootstrap_data["grouped_presets_json"] == (
+        '{"ARChetype Disease CRF": ["Covid"]}'
+    )
+    mock_arc_list.assert_called_once_with("v1.2.0", "English")
+    mock_arc_list.return_value.prefetch_list_options.assert_called_once_with(df_arc)
+    mock_arc_core.add_transformed_rows.assert_called_once()
+
+
+def test_arc_bootstrap_get():
+    loaded = Event()
+
+    def loader():
+        loaded.wait()
+        return {"version_latest": "v1.2.0"}
+
+    arc_bootstrap = ArcBootstrap(loader)
+    assert arc_bootstrap.get_status()["status"] == "pending"
+    arc_bootstrap.start()
+    assert not arc_bootstrap.is_ready()
+    assert not arc_bootstrap.ready.is_set()
+    assert arc_bootstrap.get_status()["status"] == "loading"
+    with pytest.raises(ArcApiClientError):
+        arc_bootstrap.get(timeout=0.01)
+
+    loaded.set()
+    assert arc_bootstrap.get(timeout=5) == {"version_latest": "v1.2.0"}
+    assert arc_bootstrap.is_ready()
+    assert arc_bootstrap.ready.is_set()
+    assert arc_bootstrap.get_status()["status"] == "ready"
+
+
+@mock.patch("bridge.arc.arc_bootstrap.logger")
+def test_arc_bootstrap_get_retries_after_failure(_mock_logger):
+    loader = mock.Mock(
+        side_effect=[ArcApiClientError("Failed to fetch data"), {"version": 1}]
+    )
+    arc_bootstrap = ArcBootstrap(loader)
+
+    with pytest.raises(ArcApiClientError):
+        arc_bootstrap.get(timeout=5)
+    assert arc_bootstrap.get_status()["status"] == "failed"
+    assert arc_bootstrap.get_status()["error"] == "Failed to fetch data"
+    assert not arc_bootstrap.ready.is_set()
+
+    assert arc_bootstrap.get(timeout=5) == {"version": 1}
+    assert loader.call_count == 2
+
+
+def test_arc_bootstrap_start_once():
+    loader = mock.Mock(return_value={"version": 1})
+    arc_bootstrap = ArcBootstrap(loader)
+    arc_bootstrap.start()
+    arc_bootstrap.get(timeout=5)
+    arc_bootstrap.start()
+    arc_bootstrap.get(timeout=5)
+    loader.assert_called_once()
+
+
+ARC_BOOTSTRAP_DATA = {
+    "commit": "abc123",
+    "version_latest": "v1.2.0",
+    "arc_json": "{}",
+}
+
+
+@mock.patch("bridge.arc.arc_bootstrap.ArcApiClient")
+@mock.patch("bridge.arc.arc_bootstrap.arc_core.get_arc_versions")
+def test_read_arc_bootstrap_snapshot(mock_get_versions, mock_client, tmp_path):
+    snapshot_path = tmp_path.joinpath("bootstrap.json")
+    write_arc_bootstrap_snapshot(snapshot_path, ARC_BOOTSTRAP_DATA)
+    mock_get_versions.return_value = (["v1.2.0"], "v1.2.0")
+    mock_client.return_value.get_arc_version_sha.return_value = "abc123"
+
+    assert read_arc_bootstrap_snapshot(snapshot_path) == ARC_BOOTSTRAP_DATA
+
+
+@mock.patch("bridge.arc.arc_bootstrap.ArcApiClient")
+@mock.patch("bridge.arc.arc_bootstrap.arc_core.get_arc_versions")
+def test_read_arc_bootstrap_snapshot_conditional_requests(
+    mock_get_versions, mock_client, tmp_path
+):
+    snapshot_path = tmp_path.joinpath("bootstrap.json")
+    releases_url = "https://api.github.com/repos/ISARICResearch/ARC/releases"
+    validators = {"If-None-Match": '"abc"'}
+    with mock.patch.object(
+        arc_api,
+        "_API_RESPONSE_CACHE",
+        {releases_url: (validators, [{"tag_name": "v1.2.0"}])},
+    ):
+        write_arc_bootstrap_snapshot(snapshot_path, ARC_BOOTSTRAP_DATA)
+    mock_get_versions.return_value = (["v1.2.0"], "v1.2.0")
+    mock_client.return_value.get_arc_version_sha.return_value = "abc123"
+
+    # After a restart, the revalidation requests send the stored validators
+    with mock.patch.object(arc_api, "_API_RESPONSE_CACHE", {}):
+        assert read_arc_bootstrap_snapshot(snapshot_path) == ARC_BOOTSTRAP_DATA
+        assert arc_api._API_RESPONSE_CACHE == {
+            releases_url: (validators, [{"tag_name": "v1.2.0"}])
+        }
+
+
+@mock.patch("bridge.arc.arc_bootstrap.ArcApiClient")
+@mock.patch("bridge.arc.arc_bootstrap.arc_core.get_arc_versions")
+def test_read_arc_bootstrap_snapshot_stale(mock_get_versions, mock_client, tmp_path):
+    snapshot_path = tmp_path.joinpath("bootstrap.json")
+    write_arc_bootstrap_snapshot(snapshot_path, ARC_BOOTSTRAP_DATA)
+
+    # A new ARC release
+    mock_get_versions.return_value = (["v1.2.0", "v1.3.0"], "v1.3.0")
+    assert read_arc_bootstrap_snapshot(snapshot_path) is None
+
+    # The release tag has moved to a new commit
+    mock_get_versions.return_value = (["v1.2.0"], "v1.2.0")
+    mock_client.return_value.get_arc_version_sha.return_value = "def456"
+    assert read_arc_bootstrap_snapshot(snapshot_path) is None
+
+
+@mock.patch("bridge.arc.arc_bootstrap.logger")
+@mock.patch("bridge.arc.arc_bootstrap.arc_core.get_arc_versions")
+def test_read_arc_bootstrap_snapshot_offline(mock_get_versions, _mock_logger, tmp_path):
+    snapshot_path = tmp_path.joinpath("bootstrap.json")
+    write_arc_bootstrap_snapshot(snapshot_path, ARC_BOOTSTRAP_DATA)
+    mock_get_versions.side_effect = ArcApiClientError("Failed to fetch data")
+
+    assert read_arc_bootstrap_snapshot(snapshot_path) == ARC_BOOTSTRAP_DATA
+
+
+def test_read_arc_bootstrap_snapshot_other_bridge_version(tmp_path):
+    snapshot_path = tmp_path.joinpath("bootstrap.json")
+    with mock.patch.object(arc_bootstrap_module, "__version__", "0.1"):
+        write_arc_bootstrap_snapshot(snapshot_path, ARC_BOOTSTRAP_DATA)
+    assert read_arc_bootstrap_snapshot(snapshot_path) is None
+
+
+def test_read_arc_bootstrap_snapshot_missing(tmp_path):
+    assert read_arc_bootstrap_snapshot(tmp_path.joinpath("bootstrap.json")) is None
+
+
+@mock.patch("bridge.arc.arc_bootstrap.read_arc_bootstrap_snapshot")
+@mock.patch("bridge.arc.arc_bootstrap.build_arc_bootstrap")
+def test_load_arc_bootstrap_writes_snapshot(mock_build, mock_read, tmp_path):
+    snapshot_path = tmp_path.joinpath("bootstrap.json")
+    mock_read.return_value = None
+    mock_build.return_value = ARC_BOOTSTRAP_DATA
+
+    with mock.patch.object(
+        arc_bootstrap_module, "ARC_BOOTSTRAP_SNAPSHOT_PATH", str(snapshot_path)
+    ):
+        assert load_arc_bootstrap() == ARC_BOOTSTRAP_DATA
+        mock_read.return_value = ARC_BOOTSTRAP_DATA
+        assert load_arc_bootstrap() == ARC_BOOTSTRAP_DATA
+
+    mock_build.assert_called_once()
+    assert snapshot_path.is_file()
+
+
+@mock.patch("bridge.arc.arc_bootstrap.build_arc_bootstrap")
+def test_load_arc_bootstrap_no_snapshot(mock_build):
+    mock_build.return_value = ARC_BOOTSTRAP_DATA
+    with mock.patch.object(arc_bootstrap_module, "ARC_BOOTSTRAP_SNAPSHOT_PATH", ""):
+        assert load_arc_bootstrap() == ARC_BOOTSTRAP_DATA
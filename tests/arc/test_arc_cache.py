@@ -0,0 +1,149 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import monotonic, sleep
+
+import pandas as pd
+import pytest
+
+from bridge.arc import arc_api, arc_cache
+from bridge.arc.arc_cache import ArcMemoryCache, SingleFlight, get_entry_size
+
+
+def get_df(n_rows):
+    return pd.DataFrame({"Variable": [f"var_{i}" for i in range(n_rows)]})
+
+
+def test_get_entry_size():
+    df = get_df(10)
+    df_size = int(df.memory_usage(deep=True).sum())
+    assert get_entry_size(df) == df_size
+    assert get_entry_size((df, "abc")) > df_size
+
+
+def test_get_set():
+    cache = ArcMemoryCache("test_get_set", 1024**2)
+    df = get_df(10)
+    cache[("v1.1.1", "English")] = df
+    assert ("v1.1.1", "English") in cache
+    assert cache[("v1.1.1", "English")] is df
+    assert cache.get(("v1.1.1", "French")) is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_missing_key():
+    cache = ArcMemoryCache("test_missing_key", 1024**2)
+    assert "v1.1.1" not in cache
+    with pytest.raises(KeyError):
+        cache["v1.1.1"]
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_evict_least_recently_used():
+    df = get_df(100)
+    cache = ArcMemoryCache("test_evict", 2 * get_entry_size(df))
+    cache["v1.0.0"] = df
+    cache["v1.1.0"] = df
+    # Use v1.0.0 so that v1.1.0 is the least recently used
+    assert cache["v1.0.0"] is df
+    cache["v1.2.0"] = df
+
+    assert list(cache) == ["v1.0.0", "v1.2.0"]
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.total_bytes == 2 * get_entry_size(df)
+
+
+def test_replace_entry():
+    cache = ArcMemoryCache("test_replace", 1024**2)
+    cache["v1.0.0"] = get_df(100)
+    cache["v1.0.0"] = get_df(10)
+    assert len(cache) == 1
+    assert cache.total_bytes == get_entry_size(get_df(10))
+
+
+def test_entry_too_large():
+    df = get_df(100)
+    cache = ArcMemoryCache("test_too_large", get_entry_size(df) - 1)
+    cache["v1.0.0"] = df
+    assert "v1.0.0" not in cache
+    assert cache.total_bytes == 0
+
+
+def test_delete_and_clear():
+    cache = ArcMemoryCache("test_clear", 1024**2)
+    cache["v1.0.0"] = get_df(10)
+    cache["v1.1.0"] = get_df(10)
+    del cache["v1.0.0"]
+    assert list(cache) == ["v1.1.0"]
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_get_cache_stats():
+    cache = ArcMemoryCache("test_stats", 1024**2)
+    cache["v1.0.0"] = get_df(10)
+    stats = arc_cache.get_cache_stats()
+    assert stats["test_stats"]["entries"] == 1
+    assert stats["test_stats"]["bytes"] == cache.total_bytes
+    assert arc_api._ARC_DF_CACHE.name in stats
+
+
+def wait_for_coalesced(single_flight, count, timeout=5):
+    deadline = monotonic() + timeout
+    while single_flight.coalesced < count and monotonic() < deadline:
+        sleep(0.001)
+    assert single_flight.coalesced >= count
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    started = Event()
+    release = Event()
+    calls = []
+
+    def build():
+        calls.append("v1.1.0")
+        started.set()
+        release.wait(5)
+        return "data"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(single_flight.do, "v1.1.0", build)
+        started.wait(5)
+        followers = [
+            executor.submit(single_flight.do, "v1.1.0", build) for _ in range(3)
+        ]
+        try:
+            wait_for_coalesced(single_flight, 3)
+        finally:
+            release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert results == ["data"] * 4
+    assert calls == ["v1.1.0"]
+    # Once the call has finished the next one runs again
+    assert single_flight.do("v1.1.0", lambda: "new data") == "new data"
+
+
+def test_single_flight_shares_exceptions():
+    single_flight = SingleFlight()
+    started = Event()
+    release = Event()
+
+    def build():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("Failed to format ARC data")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "v1.1.0", build)
+        started.wait(5)
+        follower = executor.submit(single_flight.do, "v1.1.0", build)
+        try:
+            wait_for_coalesced(single_flight, 1)
+        finally:
+            release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="Failed to format ARC data"):
+                future.result()
@@ -1,3 +1,4 @@
+import warnings
 from unittest import mock
 
 import numpy as np
@@ -243,6 +244,31 @@ def test_get_dependencies():
     assert_frame_equal(df_output, df_expected)
 
 
+def test_get_dependencies_edge_cases():
+    df_datadicc = pd.DataFrame.from_dict(
+        {
+            "Variable": ["subjid", "pres_a", "pres_a", "pres_aother", "pres_b"],
+            "Skip Logic": [
+                np.nan,
+                "[pres_x(1)]='1' and [pres_y(2)(3)]='1'",
+                "[pres_z]='1'",
+                "[pres_a(88)]='1'",
+                # Malformed references without a closing bracket
+                "[pres_a='1' or [pres_c",
+            ],
+        }
+    )
+    df_output = arc_core.get_dependencies(df_datadicc)
+    assert df_output["Dependencies"].to_list() == [
+        ["subjid"],
+        # Dependencies are added to the first row of a duplicated variable
+        ["pres_x", "pres_y", "subjid", "subjid", "pres_aother"],
+        ["pres_z"],
+        ["pres_a", "subjid"],
+        ["pres_a='1' or", "pres_", "subjid"],
+    ]
+
+
 def test_add_transformed_rows():
     data = {
         "Variable": [
@@ -296,6 +322,124 @@ def test_add_transformed_rows():
     assert_frame_equal(df_output, df_expected)
 
 
+def test_add_transformed_rows_replaced_and_chained():
+    df_selected_variables = pd.DataFrame(
+        {
+            "Variable": ["inclu_x", "demog_list", "demog_age", "demog_list"],
+            "Question": ["X", "List", "Age", "Duplicate list"],
+        }
+    )
+    df_transformed = pd.DataFrame(
+        {
+            "Variable": [
+                "demog_list",
+                "demog_list_0item",
+                "demog_list_1item",
+                "demog_list_0item",
+                "inclu_y",
+                "other_z",
+            ],
+            "Question": ["Select", "Item 0", "Item 1", "Item 0 again", "Y", "Z"],
+            "Sec": ["demog", "demog", "demog", "demog", "inclu", "other"],
+            "vari": ["list", "list", "list", "list", "y", "z"],
+        }
+    )
+    variable_order = ["inclu_x", "inclu_y", "demog_list", "demog_age"]
+
+    df_output = arc_core.add_transformed_rows(
+        df_selected_variables, df_transformed, variable_order
+    )
+
+    df_expected = pd.DataFrame(
+        {
+            "Variable": [
+                "inclu_x",
+                "inclu_y",
+                "demog_list",
+                "demog_age",
+                "demog_list",
+                "demog_list_0item",
+                "demog_list_1item",
+                "other_z",
+            ],
+            "Question": [
+                "X",
+                "Y",
+                "Select",
+                "Age",
+                "Duplicate list",
+                "Item 0 again",
+                "Item 1",
+                "Z",
+            ],
+        }
+    )
+    assert_frame_equal(df_output, df_expected)
+
+
+def test_add_transformed_rows_all_none_replacement():
+    df_selected_variables = pd.DataFrame(
+        {
+            "Variable": ["demog_height", "demog_weight"],
+            "Maximum": [250.0, 300.0],
+            "Minimum": [0, 1],
+        }
+    )
+    df_transformed = pd.DataFrame(
+        {
+            "Variable": ["demog_height", "demog_weight_units"],
+            "Maximum": [None, None],
+            "Minimum": [None, None],
+            "Sec": ["demog", "demog"],
+            "vari": ["height", "weight"],
+        }
+    )
+
+    df_output = arc_core.add_transformed_rows(
+        df_selected_variables, df_transformed, ["demog_height", "demog_weight"]
+    )
+
+    df_expected = pd.DataFrame(
+        {
+            "Variable": ["demog_height", "demog_weight", "demog_weight_units"],
+            "Maximum": [np.nan, 300.0, np.nan],
+            "Minimum": [np.nan, 1.0, np.nan],
+        }
+    )
+    assert_frame_equal(df_output, df_expected)
+
+
+def test_add_transformed_rows_all_none_inserted():
+    df_selected_variables = pd.DataFrame(
+        {
+            "Variable": ["demog_height"],
+            "Maximum": [250.0],
+        }
+    )
+    df_transformed = pd.DataFrame(
+        {
+            "Variable": ["demog_height_units"],
+            "Maximum": [None],
+            "Sec": ["demog"],
+            "vari": ["height"],
+        }
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        df_output = arc_core.add_transformed_rows(
+            df_selected_variables, df_transformed, ["demog_height"]
+        )
+
+    df_expected = pd.DataFrame(
+        {
+            "Variable": ["demog_height", "demog_height_units"],
+            "Maximum": [250.0, np.nan],
+        }
+    )
+    assert_frame_equal(df_output, df_expected)
+
+
 @pytest.mark.parametrize(
     "version, expected_output",
     [
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from bridge.arc.arc_data_dictionary import DataDictionary
+
+
+def get_data_dictionary() -> DataDictionary:
+    df_datadicc = pd.DataFrame(
+        {
+            "Variable": [
+                "labs_glucose",
+                "labs_glucose_mmoll",
+                "labs_glucose_units",
+                "demog_sex",
+                "demog_sex",
+                np.nan,
+            ],
+            "Sec": ["labs", "labs", "labs", "demog", "demog", "demog"],
+            "vari": ["glucose", "glucose", "glucose", "sex", "sex", np.nan],
+            "Question": ["Glucose", "Glucose (mmol/L)", "Units", "Sex", "Sex 2", "-"],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+    return DataDictionary(df_datadicc)
+
+
+def test_data_dictionary_lookups():
+    data_dictionary = get_data_dictionary()
+
+    assert "labs_glucose_units" in data_dictionary
+    assert "labs_glucose_mgdl" not in data_dictionary
+    assert np.nan not in data_dictionary
+    assert data_dictionary.get_positions("demog_sex") == [3, 4]
+    assert data_dictionary.get_row("demog_sex")["Question"] == "Sex"
+    assert data_dictionary.get_row("demog_age") is None
+    assert data_dictionary.get_value("demog_sex", "Question") == "Sex"
+    assert data_dictionary.get_value("demog_age", "Question", "") == ""
+    assert_frame_equal(
+        data_dictionary.get_rows("demog_sex"),
+        data_dictionary.df.loc[[13, 14]],
+    )
+
+
+def test_data_dictionary_get_sec_vari_rows():
+    data_dictionary = get_data_dictionary()
+
+    df_output = data_dictionary.get_sec_vari_rows("labs", "glucose")
+    assert list(df_output["Variable"]) == [
+        "labs_glucose",
+        "labs_glucose_mmoll",
+        "labs_glucose_units",
+    ]
+    assert data_dictionary.get_sec_vari_rows("demog", np.nan).empty
+    assert data_dictionary.get_sec_vari_rows("labs", "height").empty
+
+
+def test_data_dictionary_set_value():
+    data_dictionary = get_data_dictionary()
+
+    data_dictionary.set_value("demog_sex", "Question", "Sex at birth")
+    data_dictionary.set_value("demog_age", "Question", "Age")
+    data_dictionary.set_value("labs_glucose", "Answer Options", "1, Yes")
+
+    df_datadicc = data_dictionary.df
+    assert list(df_datadicc["Question"]) == [
+        "Glucose",
+        "Glucose (mmol/L)",
+        "Units",
+        "Sex at birth",
+        "Sex at birth",
+        "-",
+    ]
+    assert df_datadicc["Answer Options"].iloc[0] == "1, Yes"
+    assert df_datadicc["Answer Options"].iloc[1:].isna().all()
@@ -0,0 +1,84 @@
+import os
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from bridge.arc.arc_disk_cache import ArcDiskCache
+
+SHA = "87e78283e0412d78e247fd2a2618e2bb09a0ca17"
+
+
+def test_is_commit_sha():
+    assert ArcDiskCache.is_commit_sha(SHA)
+    assert not ArcDiskCache.is_commit_sha("main")
+    assert not ArcDiskCache.is_commit_sha("v1.1.1")
+
+
+def test_get_entry_key_differs_by_path():
+    key_1 = ArcDiskCache.get_entry_key("ARC", SHA, "ARC.csv")
+    key_2 = ArcDiskCache.get_entry_key("ARC", SHA, "crf_metadata.csv")
+    assert key_1 != key_2
+    assert key_1 == ArcDiskCache.get_entry_key("ARC", SHA, "ARC.csv")
+
+
+def test_set_get(tmp_path):
+    disk_cache = ArcDiskCache(tmp_path, 1024**2, 60)
+    df = pd.DataFrame({"Variable": ["subjid", "inclu_disease"]})
+    disk_cache.set("ARC", SHA, "ARC.csv", df)
+    assert_frame_equal(disk_cache.get("ARC", SHA, "ARC.csv"), df)
+
+
+def test_get_miss(tmp_path):
+    disk_cache = ArcDiskCache(tmp_path, 1024**2, 60)
+    assert disk_cache.get("ARC", SHA, "ARC.csv") is None
+
+
+def test_get_mutable_ref_expired(tmp_path):
+    disk_cache = ArcDiskCache(tmp_path, 1024**2, 60)
+    df = pd.DataFrame({"Variable": ["subjid"]})
+    disk_cache.set("ARC-Translations", "main", "ARCH1.1.1/English/ARCH.csv", df)
+    entry_path = disk_cache.get_entry_path(
+        "ARC-Translations", "main", "ARCH1.1.1/English/ARCH.csv"
+    )
+    os.utime(entry_path, (0, 0))
+    assert (
+        disk_cache.get("ARC-Translations", "main", "ARCH1.1.1/English/ARCH.csv") is None
+    )
+
+
+def test_get_commit_sha_never_expires(tmp_path):
+    disk_cache = ArcDiskCache(tmp_path, 1024**2, 60)
+    df = pd.DataFrame({"Variable": ["subjid"]})
+    disk_cache.set("ARC", SHA, "ARC.csv", df)
+    os.utime(disk_cache.get_entry_path("ARC", SHA, "ARC.csv"), (0, 0))
+    assert_frame_equal(disk_cache.get("ARC", SHA, "ARC.csv"), df)
+
+
+def test_get_corrupt_entry(tmp_path):
+    disk_cache = ArcDiskCache(tmp_path, 1024**2, 60)
+    entry_path = disk_cache.get_entry_path("ARC", SHA, "ARC.csv")
+    entry_path.parent.mkdir(parents=True)
+    entry_path.write_bytes(b"not a pickle")
+    assert disk_cache.get("ARC", SHA, "ARC.csv") is None
+    assert not entry_path.exists()
+
+
+def test_evict_least_recently_used(tmp_path):
+    df = pd.DataFrame({"Variable": [f"var_{i}" for i in range(100)]})
+    disk_cache = ArcDiskCache(tmp_path, 1024**2, 60)
+    disk_cache.set("ARC", SHA, "old.csv", df)
+    entry_size = disk_cache.get_entry_path("ARC", SHA, "old.csv").stat().st_size
+    os.utime(disk_cache.get_entry_path("ARC", SHA, "old.csv"), (0, 0))
+
+    disk_cache.max_bytes = entry_size
+    disk_cache.set("ARC", SHA, "new.csv", df)
+
+    assert disk_cache.get("ARC", SHA, "old.csv") is None
+    assert_frame_equal(disk_cache.get("ARC", SHA, "new.csv"), df)
+
+
+def test_clear(tmp_path):
+    disk_cache = ArcDiskCache(tmp_path, 1024**2, 60)
+    disk_cache.set("ARC", SHA, "ARC.csv", pd.DataFrame({"Variable": ["subjid"]}))
+    disk_cache.clear()
+    assert disk_cache.get("ARC", SHA, "ARC.csv") is None
@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 from pandas._testing import assert_frame_equal, assert_series_equal
 
+from bridge.arc.arc_api import ArcApiClientError
 from bridge.arc.arc_lists import ArcList
 
 
@@ -269,6 +270,74 @@ def test_get_list_content_no_list(
     assert not list_output
 
 
+def test_append_updated_other_info_list_content():
+    datadicc_row = pd.Series(
+        {"Sec": "comor", "vari": "unlisted", "mod": None, "Question": "Other"}
+    )
+    other_info_rows = [
+        {"Variable": "comor_unlisted_units", "Type": "radio", "Maximum": 10},
+        {"Variable": "comor_unlisted_other", "Type": "text", "Maximum": None},
+    ]
+
+    questions_for_this_list = ArcList._append_updated_other_info_list_content(
+        datadicc_row, 1, other_info_rows, ["dropdown_row"]
+    )
+
+    updated_values = {
+        "Question": "> Other 2",
+        "Variable": "comor unlisted_1None",
+        "Skip Logic": "[comor_unlisted_0addi]='1'",
+        "List": None,
+        "mod": "1None",
+        "vari": "unlisted",
+    }
+    assert questions_for_this_list == [
+        "dropdown_row",
+        {"Type": "radio", "Maximum": 10, **updated_values},
+        {"Type": "text", "Maximum": None, **updated_values},
+    ]
+    # The other info rows are copied, not changed
+    assert other_info_rows[0]["Variable"] == "comor_unlisted_units"
+
+
+@mock.patch("bridge.arc.arc_lists.ArcApiClient.get_dataframe_arc_list_version_language")
+def test_prefetch_list_options(mock_get_list_df):
+    mock_get_list_df.side_effect = lambda _version, _language, list_name: (
+        pd.DataFrame({"Option": [list_name]})
+    )
+    data = {
+        "Variable": ["inclu_disease", "demog_race", "comor_unlisted", "subjid"],
+        "Type": ["user_list", "multi_list", "list", "text"],
+        "List": ["inclusion_Disease", "demographics_Race", "conditions_Other", None],
+    }
+    arc_list = ArcList("v1.1.1", "English")
+    arc_list.prefetch_list_options(pd.DataFrame.from_dict(data))
+
+    assert mock_get_list_df.call_count == 3
+    assert_frame_equal(
+        arc_list._get_list_options_df("inclusion_Disease"),
+        pd.DataFrame({"Option": ["inclusion/Disease"]}),
+    )
+    # The prefetched dataframes are used by the list expansions
+    assert mock_get_list_df.call_count == 3
+
+
+@mock.patch("bridge.arc.arc_lists.logger")
+@mock.patch("bridge.arc.arc_lists.ArcApiClient.get_dataframe_arc_list_version_language")
+def test_prefetch_list_options_failure(mock_get_list_df, mock_logger):
+    mock_get_list_df.side_effect = ArcApiClientError
+    data = {
+        "Variable": ["inclu_disease"],
+        "Type": ["user_list"],
+        "List": ["inclusion_Disease"],
+    }
+    arc_list = ArcList("v1.1.1", "English")
+    arc_list.prefetch_list_options(pd.DataFrame.from_dict(data))
+
+    assert arc_list._list_df_cache == {}
+    mock_logger.warning.assert_called_once()
+
+
 def test_set_cont_lo():
     data = {
         "Condition": [
@@ -356,6 +425,63 @@ def test_set_cont_lo_no_value():
     assert output_int == expected_int
 
 
+def test_get_list_option_numbers():
+    data = {
+        "Condition": [
+            "Acute-on-chronic renal failure",
+            "Asplenia",
+            "Atrial Fibrillation",
+            "Asplenia",
+        ],
+        "Value": [
+            88,
+            "99",
+            3,
+            4,
+        ],
+    }
+    df_list_options = pd.DataFrame.from_dict(data)
+
+    expected_list = [89, 100, 3, 100]
+    output_list = ArcList._get_list_option_numbers(df_list_options)
+    assert output_list == expected_list
+    assert output_list == [
+        ArcList._get_list_option_number(df_list_options, list_option)
+        for list_option in data["Condition"]
+    ]
+
+
+def test_get_list_option_numbers_no_value():
+    data = {
+        "Condition": [
+            "Acute-on-chronic renal failure",
+            "Asplenia",
+            "Asplenia",
+        ],
+    }
+    df_list_options = pd.DataFrame.from_dict(data)
+
+    expected_list = [1, 2, 2]
+    output_list = ArcList._get_list_option_numbers(df_list_options)
+    assert output_list == expected_list
+
+
+@mock.patch("bridge.arc.arc_lists.ArcApiClient.get_dataframe_arc_list_version_language")
+def test_get_list_options_numbered_cached(mock_list):
+    mock_list.return_value = pd.DataFrame({"Condition": ["Asplenia", "Cardiomyopathy"]})
+    arc_list = ArcList("v1.1.1", "English")
+
+    expected_list = [(1, "Asplenia"), (2, "Cardiomyopathy")]
+    assert arc_list._get_list_options_numbered("conditions_Comorbidities") == (
+        expected_list
+    )
+    assert arc_list._get_list_options_numbered("conditions/Comorbidities") == (
+        expected_list
+    )
+    mock_list.assert_called_once()
+    assert list(arc_list._list_option_numbers_cache) == ["conditions/Comorbidities"]
+
+
 @mock.patch("bridge.arc.arc_lists.logger")
 @mock.patch("bridge.arc.arc_lists.ArcApiClient.get_dataframe_arc_list_version_language")
 @mock.patch("bridge.arc.arc_lists.arc_translations.get_translations")
@@ -600,3 +726,61 @@ def test_get_multi_list_content(
 
     assert_frame_equal(df_output, df_expected_get_list_content)
     assert list_output == list_expected_get_list_content
+
+
+@mock.patch("bridge.arc.arc_lists.ArcList.get_multi_list_content")
+@mock.patch("bridge.arc.arc_lists.ArcList.get_user_list_content")
+@mock.patch("bridge.arc.arc_lists.ArcList.get_list_content")
+def test_get_all_list_content(
+    mock_list_content, mock_user_list_content, mock_multi_list_content
+):
+    df_datadicc = pd.DataFrame(
+        {
+            "Variable": ["comor_unlisted", "comor_unlisted_type", "demog_race"],
+            "Type": ["list", "user_list", "multi_list"],
+            "Question": ["Unlisted", "Type", "Race"],
+        }
+    )
+    df_lists = pd.DataFrame(
+        {
+            "Variable": [
+                "comor_unlisted",
+                "comor_unlisted_0item",
+                "comor_unlisted_type",
+            ],
+            "Type": ["list", "dropdown", "user_list"],
+            "Question": ["Unlisted", "Select unlisted", "Type updated"],
+        }
+    )
+    df_ulist = pd.DataFrame(
+        {
+            "Variable": ["comor_unlisted_type", "comor_unlisted_type_otherl2"],
+            "Type": ["user_list", "dropdown"],
+            "Question": ["Type updated", "Select type"],
+        }
+    )
+    mock_list_content.return_value = (df_lists, [["comor_unlisted", []]])
+    mock_user_list_content.return_value = (df_ulist, [["comor_unlisted_type", []]])
+    mock_multi_list_content.return_value = (pd.DataFrame(), [])
+
+    (
+        df_output,
+        list_output,
+        ulist_output,
+        multilist_output,
+    ) = ArcList("v1.1.1", "English").get_all_list_content(df_datadicc)
+
+    assert_frame_equal(df_output, pd.concat([df_lists, df_ulist], ignore_index=True))
+    assert list_output == [["comor_unlisted", []]]
+    assert ulist_output == [["comor_unlisted_type", []]]
+    assert multilist_output == []
+
+    # The later expansions see the rows replaced by the earlier ones
+    df_user_list_datadicc = mock_user_list_content.call_args.args[0]
+    assert list(df_user_list_datadicc["Variable"]) == list(df_datadicc["Variable"])
+    assert list(df_user_list_datadicc["Question"]) == [
+        "Unlisted",
+        "Type updated",
+        "Race",
+    ]
+    assert list(df_datadicc["Question"]) == ["Unlisted", "Type", "Race"]
@@ -0,0 +1,200 @@
+import os
+import tarfile
+from unittest import mock
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from bridge.arc import arc_api, arc_mirror
+from bridge.arc.arc_api import ArcApiClient, ArcApiClientError
+from bridge.arc.arc_mirror import ArcMirrorSyncClient
+
+SHA = "87e78283e0412d78e247fd2a2618e2bb09a0ca17"
+
+
+class FakeResponse:
+    def __init__(self, json_data=None, content=b""):
+        self.json_data = json_data
+        self.status_code = 200
+        self.headers = {}
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.json_data
+
+
+GITHUB_RESPONSES = {
+    "https://api.github.com/repos/ISARICResearch/ARC/releases": FakeResponse(
+        [{"tag_name": "v1.1.1"}]
+    ),
+    "https://api.github.com/repos/ISARICResearch/ARC/tags?per_page=100&page=1": FakeResponse(
+        [{"name": "v1.1.1", "commit": {"sha": SHA}}]
+    ),
+    "https://api.github.com/repos/ISARICResearch/ARC-Translations/contents/ARCH1.1.1": FakeResponse(
+        [{"name": "English"}, {"name": "French"}]
+    ),
+    f"https://raw.githubusercontent.com/ISARICResearch/ARC/{SHA}/ARC.csv": FakeResponse(
+        content=b"Variable,Type,List\nsubjid,text,\n"
+    ),
+    "https://raw.githubusercontent.com/ISARICResearch/ARC-Translations/main/ARCH1.1.1/English/ARCH.csv": FakeResponse(
+        content=b"Variable,Type,List\ninclu_country,list,Country_Country\n"
+    ),
+    "https://raw.githubusercontent.com/ISARICResearch/ARC-Translations/main/ARCH1.1.1/English/Lists/Country/Country.csv": FakeResponse(
+        content=b"Country,Selected\nUganda,0\n"
+    ),
+}
+
+
+def fake_get(url, **kwargs):
+    if url not in GITHUB_RESPONSES:
+        raise arc_api.requests.exceptions.HTTPError(url)
+    return GITHUB_RESPONSES[url]
+
+
+@pytest.fixture()
+def empty_caches():
+    with (
+        mock.patch.object(arc_api, "_VERSION_SHA_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_TAG_SHA_INDEX_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_DF_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_TRANSLATION_DF_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_LIST_DF_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_VERSION_LIST_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_LANGUAGE_LIST_CACHE", {}),
+        mock.patch.object(arc_api, "_API_RESPONSE_CACHE", {}),
+    ):
+        yield
+
+
+def test_get_mirror_path(tmp_path):
+    client = ArcMirrorSyncClient(tmp_path)
+    assert client.get_mirror_path(
+        "https://api.github.com/repos/ISARICResearch/ARC/releases"
+    ) == tmp_path.joinpath("api", "ARC", "releases.json")
+    assert client.get_mirror_path(
+        f"https://raw.githubusercontent.com/ISARICResearch/ARC/{SHA}/ARC.csv"
+    ) == tmp_path.joinpath("raw", "ARC", SHA, "ARC.csv")
+    with pytest.raises(ArcApiClientError):
+        client.get_mirror_path("https://example.com/ARC.csv")
+
+
+@mock.patch.dict(os.environ, {"ENV": "production"})
+@mock.patch("bridge.arc.arc_mirror.logger")
+@mock.patch("bridge.arc.arc_api.logger")
+@mock.patch("bridge.arc.arc_api.get_arc_session")
+def test_sync_arc_mirror(
+    mock_get_session, _mock_api_logger, _mock_mirror_logger, tmp_path, empty_caches
+):
+    mock_get_session.return_value.get.side_effect = fake_get
+
+    synced_versions = arc_mirror.sync_arc_mirror(tmp_path, languages=["Spanish"])
+
+    assert synced_versions == ["v1.1.1"]
+    assert tmp_path.joinpath("raw", "ARC", SHA, "ARC.csv").is_file()
+    assert tmp_path.joinpath("api", "ARC", "tags.json").is_file()
+    assert tmp_path.joinpath(
+        "raw",
+        "ARC-Translations",
+        "main",
+        "ARCH1.1.1",
+        "English",
+        "Lists",
+        "Country",
+        "Country.csv",
+    ).is_file()
+    # French is not synced as it was not requested
+    assert not tmp_path.joinpath(
+        "raw", "ARC-Translations", "main", "ARCH1.1.1", "French"
+    ).exists()
+
+
+@mock.patch.dict(os.environ, {"ENV": "production"})
+@mock.patch("bridge.arc.arc_api.get_arc_shared_cache")
+@mock.patch("bridge.arc.arc_mirror.logger")
+@mock.patch("bridge.arc.arc_api.logger")
+@mock.patch("bridge.arc.arc_api.get_arc_session")
+def test_sync_arc_mirror_with_shared_cache(
+    mock_get_session,
+    _mock_api_logger,
+    _mock_mirror_logger,
+    mock_get_shared_cache,
+    tmp_path,
+    empty_caches,
+):
+    mock_get_session.return_value.get.side_effect = fake_get
+    # Every dataframe is in the shared cache, e.g. loaded by the app
+    mock_get_shared_cache.return_value.get.return_value = pd.DataFrame(
+        {"Variable": ["inclu_country"], "Type": ["list"], "List": ["Country_Country"]}
+    )
+
+    arc_mirror.sync_arc_mirror(tmp_path, languages=["English"])
+
+    # The files are still downloaded and written to the mirror
+    assert tmp_path.joinpath("raw", "ARC", SHA, "ARC.csv").is_file()
+    assert tmp_path.joinpath(
+        "raw", "ARC-Translations", "main", "ARCH1.1.1", "English", "ARCH.csv"
+    ).is_file()
+    assert tmp_path.joinpath(
+        "raw",
+        "ARC-Translations",
+        "main",
+        "ARCH1.1.1",
+        "English",
+        "Lists",
+        "Country",
+        "Country.csv",
+    ).is_file()
+    mock_get_shared_cache.return_value.get.assert_not_called()
+    mock_get_shared_cache.return_value.set.assert_not_called()
+
+
+@mock.patch.dict(os.environ, {"ENV": "production"})
+@mock.patch("bridge.arc.arc_mirror.logger")
+@mock.patch("bridge.arc.arc_api.logger")
+@mock.patch("bridge.arc.arc_api.get_arc_session")
+def test_sync_arc_mirror_then_read(
+    mock_get_session, _mock_api_logger, _mock_mirror_logger, tmp_path, empty_caches
+):
+    mock_get_session.return_value.get.side_effect = fake_get
+    mirror_dir = tmp_path.joinpath("mirror")
+    arc_mirror.sync_arc_mirror(mirror_dir, languages=["English"])
+    archive_path = tmp_path.joinpath("mirror.tar.gz")
+    arc_mirror.write_arc_mirror_archive(mirror_dir, archive_path)
+    mock_get_session.reset_mock()
+
+    with tarfile.open(archive_path) as archive:
+        assert "api/ARC/releases.json" in archive.getnames()
+
+    with (
+        mock.patch.object(arc_api, "ARC_MIRROR_DIR", str(mirror_dir)),
+        mock.patch.object(arc_api, "_ARC_VERSION_LIST_CACHE", {}),
+        mock.patch.object(arc_api, "_VERSION_SHA_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_TAG_SHA_INDEX_CACHE", {}),
+        mock.patch.object(arc_api, "_ARC_LIST_DF_CACHE", {}),
+        mock.patch.object(arc_api, "_API_RESPONSE_CACHE", {}),
+    ):
+        client = ArcApiClient()
+        assert client.get_arc_version_list() == ["v1.1.1"]
+        assert client.get_arc_version_sha("v1.1.1") == SHA
+        assert_frame_equal(
+            client.get_dataframe_arc_list_version_language(
+                "v1.1.1", "English", "Country/Country"
+            ),
+            pd.DataFrame({"Country": ["Uganda"], "Selected": [0]}),
+        )
+    mock_get_session.assert_not_called()
+
+
+@mock.patch.dict(os.environ, {"ENV": "production"})
+@mock.patch("bridge.arc.arc_api.logger")
+@mock.patch("bridge.arc.arc_api.get_arc_session")
+def test_sync_arc_mirror_unknown_version(
+    mock_get_session, _mock_api_logger, tmp_path, empty_caches
+):
+    mock_get_session.return_value.get.side_effect = fake_get
+    with pytest.raises(ArcApiClientError):
+        arc_mirror.sync_arc_mirror(tmp_path, versions=["v0.0.1"])
@@ -0,0 +1,72 @@
+from unittest import mock
+
+from bridge.arc.arc_rate_limit import (
+    ArcRateLimitBudget,
+    background_requests,
+    get_token_key,
+    is_background_request,
+)
+
+
+def get_headers(remaining, reset_at=2000):
+    return {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset_at),
+    }
+
+
+def test_get_token_key():
+    assert get_token_key(None) == "unauthenticated"
+    assert get_token_key("abc123") == get_token_key("abc123")
+    assert "abc123" not in get_token_key("abc123")
+    assert get_token_key("abc123") != get_token_key("def456")
+
+
+def test_background_requests():
+    assert not is_background_request()
+    with background_requests():
+        assert is_background_request()
+    assert not is_background_request()
+
+
+@mock.patch("bridge.arc.arc_rate_limit.logger")
+@mock.patch("bridge.arc.arc_rate_limit.time", return_value=1000)
+def test_budget(_mock_time, _mock_logger):
+    budget = ArcRateLimitBudget(reserve=10)
+    assert budget.get_remaining("token") is None
+    assert not budget.is_low("token")
+
+    budget.update("token", get_headers(11))
+    assert budget.get_remaining("token") == 11
+    assert not budget.is_low("token")
+
+    budget.update("token", get_headers(10))
+    assert budget.is_low("token")
+    assert not budget.is_exhausted("token")
+    assert not budget.is_low("other token")
+
+    budget.update("token", get_headers(0))
+    assert budget.is_exhausted("token")
+    assert budget.get_stats() == {
+        "token": {"limit": 5000, "remaining": 0, "reset_at": 2000, "reserve": 10}
+    }
+
+
+@mock.patch("bridge.arc.arc_rate_limit.logger")
+@mock.patch("bridge.arc.arc_rate_limit.time")
+def test_budget_reset(mock_time, _mock_logger):
+    budget = ArcRateLimitBudget(reserve=10)
+    mock_time.return_value = 1000
+    budget.update("token", get_headers(0, reset_at=2000))
+    assert budget.is_exhausted("token")
+
+    mock_time.return_value = 2000
+    assert budget.get_remaining("token") is None
+    assert not budget.is_low("token")
+
+
+def test_budget_no_headers():
+    budget = ArcRateLimitBudget(reserve=10)
+    budget.update("token", {"ETag": '"abc"'})
+    assert budget.get_stats() == {}
@@ -0,0 +1,113 @@
+from unittest import mock
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from bridge.arc import arc_shared_cache
+from bridge.arc.arc_shared_cache import (
+    ArcSharedCache,
+    RedisSharedCacheBackend,
+    SqliteSharedCacheBackend,
+    get_shared_cache_backend,
+)
+
+
+class FakeRedisClient:
+    """A local stand-in for a Redis client, implementing ``get`` and ``set``."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expiry[key] = ex
+
+
+def get_df():
+    return pd.DataFrame({"Variable": ["subjid", "inclu_disease"], "Maximum": [1, 2]})
+
+
+def test_sqlite_get_set(tmp_path):
+    shared_cache = ArcSharedCache(SqliteSharedCacheBackend(tmp_path / "arc.sqlite3"))
+    shared_cache.set("arc_df", "production", "abc123", "v1.1.1", value=get_df())
+
+    assert_frame_equal(
+        shared_cache.get("arc_df", "production", "abc123", "v1.1.1"), get_df()
+    )
+    assert shared_cache.get("arc_df", "production", "def456", "v1.1.1") is None
+
+
+def test_get_after_bridge_upgrade(tmp_path):
+    shared_cache = ArcSharedCache(SqliteSharedCacheBackend(tmp_path / "arc.sqlite3"))
+    shared_cache.set("arc_version", "v1.1.1", "abc123", value=(get_df(), [], "abc123"))
+
+    # Entries from another BRIDGE version are ignored
+    with mock.patch.object(arc_shared_cache, "__version__", "0.0.1"):
+        assert shared_cache.get("arc_version", "v1.1.1", "abc123") is None
+    assert shared_cache.get("arc_version", "v1.1.1", "abc123") is not None
+
+
+def test_sqlite_shared_between_instances(tmp_path):
+    db_path = tmp_path / "arc.sqlite3"
+    ArcSharedCache(SqliteSharedCacheBackend(db_path)).set("v1.1.1", value=(1, "a"))
+    assert ArcSharedCache(SqliteSharedCacheBackend(db_path)).get("v1.1.1") == (1, "a")
+
+
+@mock.patch("bridge.arc.arc_shared_cache.time")
+def test_sqlite_ttl(mock_time, tmp_path):
+    backend = SqliteSharedCacheBackend(tmp_path / "arc.sqlite3")
+    mock_time.return_value = 1000
+    backend.set("translation", b"data", ttl_seconds=60)
+    backend.set("arc", b"data")
+
+    mock_time.return_value = 1059
+    assert backend.get("translation") == b"data"
+    mock_time.return_value = 1060
+    assert backend.get("translation") is None
+    assert backend.get("arc") == b"data"
+
+
+def test_redis_get_set():
+    client = FakeRedisClient()
+    shared_cache = ArcSharedCache(RedisSharedCacheBackend(client))
+    shared_cache.set("arc_list_df", "v1.1.1", "French", value=get_df(), ttl_seconds=60)
+
+    assert_frame_equal(shared_cache.get("arc_list_df", "v1.1.1", "French"), get_df())
+    (key,) = client.data
+    assert key.startswith("bridge:arc:")
+    assert client.expiry[key] == 60
+
+
+@mock.patch("bridge.arc.arc_shared_cache.logger")
+def test_backend_errors_are_misses(_mock_logger):
+    backend = mock.Mock()
+    backend.get.side_effect = ConnectionError("Connection refused")
+    backend.set.side_effect = ConnectionError("Connection refused")
+    shared_cache = ArcSharedCache(backend)
+
+    shared_cache.set("v1.1.1", value=get_df())
+    assert shared_cache.get("v1.1.1") is None
+
+
+def test_get_shared_cache_backend(tmp_path):
+    backend = get_shared_cache_backend(f"sqlite:///{tmp_path}/arc.sqlite3")
+    assert isinstance(backend, SqliteSharedCacheBackend)
+    assert backend.db_path == tmp_path / "arc.sqlite3"
+
+
+def test_get_arc_shared_cache(tmp_path):
+    with mock.patch.object(arc_shared_cache, "ARC_SHARED_CACHE_URL", ""):
+        assert arc_shared_cache.get_arc_shared_cache() is None
+
+    cache_url = str(tmp_path / "arc.sqlite3")
+    with (
+        mock.patch.object(arc_shared_cache, "ARC_SHARED_CACHE_URL", cache_url),
+        mock.patch.object(arc_shared_cache, "_SHARED_CACHE_INSTANCES", {}),
+    ):
+        shared_cache = arc_shared_cache.get_arc_shared_cache()
+        assert isinstance(shared_cache.backend, SqliteSharedCacheBackend)
+        assert arc_shared_cache.get_arc_shared_cache() is shared_cache
@@ -0,0 +1,116 @@
+import json
+from unittest import mock
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from bridge.arc import arc_snapshot
+from bridge.arc.arc_api import ArcApiClientError
+from bridge.arc.arc_snapshot import ArcSnapshotStore
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(autouse=True)
+def mock_get_arc_version_sha():
+    with mock.patch(
+        "bridge.arc.arc_snapshot.ArcApiClient.get_arc_version_sha",
+        return_value="abc123",
+    ) as mock_get_arc_version_sha:
+        yield mock_get_arc_version_sha
+
+
+def get_snapshot_args():
+    df_datadicc = pd.DataFrame(
+        {
+            "Variable": ["subjid", "inclu_disease"],
+            "Question": ["Participant ID", None],
+            "Maximum": [None, 10.0],
+        }
+    )
+    return (
+        df_datadicc,
+        "abc123",
+        {"ARChetype Disease CRF": ["Covid", "Dengue"]},
+        '{"inclu_disease": []}',
+        "{}",
+        {"title": "v1.1.1", "key": "ARC", "children": []},
+    )
+
+
+def test_get_arc_snapshot_store_disabled():
+    with mock.patch.object(arc_snapshot, "ARC_SNAPSHOT_DIR", ""):
+        assert arc_snapshot.get_arc_snapshot_store() is None
+
+
+@mock.patch("bridge.arc.arc_snapshot.logger")
+def test_get_arc_snapshot_store_no_pyarrow(_mock_logger, tmp_path):
+    with (
+        mock.patch.object(arc_snapshot, "ARC_SNAPSHOT_DIR", str(tmp_path)),
+        mock.patch.object(arc_snapshot, "pyarrow", None),
+    ):
+        assert arc_snapshot.get_arc_snapshot_store() is None
+
+
+def test_set_get(tmp_path):
+    snapshot_store = ArcSnapshotStore(tmp_path)
+    snapshot_args = get_snapshot_args()
+    assert snapshot_store.set("v1.1.1", "French", *snapshot_args)
+
+    snapshot = snapshot_store.get("v1.1.1", "French")
+    assert_frame_equal(snapshot["datadicc"], snapshot_args[0])
+    assert snapshot["commit"] == "abc123"
+    assert snapshot["grouped_presets"] == snapshot_args[2]
+    assert snapshot["ulist_variable_choices"] == snapshot_args[3]
+    assert snapshot["multilist_variable_choices"] == snapshot_args[4]
+    assert snapshot["tree_items"] == snapshot_args[5]
+
+
+def test_get_missing(tmp_path):
+    assert ArcSnapshotStore(tmp_path).get("v1.1.1", "French") is None
+
+
+@mock.patch("bridge.arc.arc_snapshot.logger")
+def test_get_outdated(_mock_logger, tmp_path):
+    snapshot_store = ArcSnapshotStore(tmp_path)
+    snapshot_store.set("v1.1.1", "French", *get_snapshot_args())
+    metadata_path = snapshot_store.get_snapshot_path("v1.1.1", "French").joinpath(
+        arc_snapshot.SNAPSHOT_METADATA_FILENAME
+    )
+    metadata = json.loads(metadata_path.read_text())
+    metadata["bridge_version"] = "0.1"
+    metadata_path.write_text(json.dumps(metadata))
+
+    assert snapshot_store.get("v1.1.1", "French") is None
+
+
+@mock.patch("bridge.arc.arc_snapshot.logger")
+def test_get_outdated_commit(_mock_logger, tmp_path, mock_get_arc_version_sha):
+    snapshot_store = ArcSnapshotStore(tmp_path)
+    snapshot_store.set("v1.1.1", "French", *get_snapshot_args())
+    # The ARC version has been tagged at another commit
+    mock_get_arc_version_sha.return_value = "def456"
+
+    assert snapshot_store.get("v1.1.1", "French") is None
+    mock_get_arc_version_sha.assert_called_once_with("v1.1.1")
+
+
+@mock.patch("bridge.arc.arc_snapshot.logger")
+def test_get_commit_unavailable(_mock_logger, tmp_path, mock_get_arc_version_sha):
+    snapshot_store = ArcSnapshotStore(tmp_path)
+    snapshot_store.set("v1.1.1", "French", *get_snapshot_args())
+    mock_get_arc_version_sha.side_effect = ArcApiClientError("Failed to fetch data")
+
+    assert snapshot_store.get("v1.1.1", "French")["commit"] == "abc123"
+
+
+@mock.patch("bridge.arc.arc_snapshot.logger")
+def test_set_mixed_types(_mock_logger, tmp_path):
+    snapshot_store = ArcSnapshotStore(tmp_path)
+    snapshot_args = list(get_snapshot_args())
+    snapshot_args[0] = pd.DataFrame({"Variable": ["subjid", 1]})
+
+    assert not snapshot_store.set("v1.1.1", "French", *snapshot_args)
+    assert snapshot_store.get("v1.1.1", "French") is None
+    assert list(tmp_path.joinpath("v1.1.1").iterdir()) == []
@@ -8,11 +8,11 @@ from pandas._testing import assert_frame_equal
 from bridge.arc import arc_translations
 
 
-@mock.patch("bridge.arc.arc_translations.process_skip_logic")
+@mock.patch("bridge.arc.arc_translations.get_branches")
 @mock.patch(
     "bridge.arc.arc_translations.ArcApiClient.get_dataframe_arc_version_language"
 )
-def test_get_arc_translation(mock_arc, mock_skip_logic):
+def test_get_arc_translation(mock_arc, mock_get_branches):
     version = "v1.1.1"
     language = "English"
     data = {
@@ -81,7 +81,7 @@ def test_get_arc_translation(mock_arc, mock_skip_logic):
     branch_logic = "[Some branch logic]"
 
     mock_arc.side_effect = [df_current_datadicc, df_not_english]
-    mock_skip_logic.return_value = branch_logic
+    mock_get_branches.return_value = [branch_logic, branch_logic]
 
     df_extra_columns = pd.DataFrame.from_dict(
         {
@@ -230,6 +230,78 @@ def test_process_skip_logic_index_error(mock_extract):
     assert output == expected
 
 
+def test_get_branches():
+    df_current_datadicc = pd.DataFrame(
+        {
+            "Variable": [
+                "inclu_testreason",
+                "inclu_testreason_oth",
+                "inclu_testreason_date",
+                "inclu_age",
+                "inclu_unknown",
+            ],
+            "Question": [
+                "Reason why the patient was tested",
+                "Other reason",
+                "Date tested",
+                "Age",
+                "Unknown",
+            ],
+            "Answer Options": [
+                "1, Symptomatic | 88, Other",
+                np.nan,
+                np.nan,
+                np.nan,
+                np.nan,
+            ],
+            "Skip Logic": [
+                np.nan,
+                "[inclu_testreason]='88'",
+                "[inclu_testreason]='88'",
+                "[inclu_testreason]='1' or [inclu_age]>=18",
+                "[inclu_missing]='1'",
+            ],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+    output = arc_translations.get_branches(df_current_datadicc)
+    assert output.index.to_list() == [10, 11, 12, 13, 14]
+    assert output.to_list() == [
+        "",
+        "(Reason why the patient was tested = Other)  ",
+        "(Reason why the patient was tested = Other)  ",
+        "(Reason why the patient was tested = Symptomatic) or  (Age >= 18)  ",
+        "Variable not found getARCTranslation",
+    ]
+
+
+def test_get_branches_checkbox_option():
+    df_current_datadicc = pd.DataFrame(
+        {
+            "Variable": ["inclu_testreason", "inclu_checked", "inclu_unchecked"],
+            "Question": ["Reason why the patient was tested", "Checked", "Unchecked"],
+            "Answer Options": ["1, Symptomatic | 88, Other", np.nan, np.nan],
+            "Skip Logic": [
+                np.nan,
+                "[inclu_testreason(88)]='1'",
+                "[inclu_testreason(88)]='0'",
+            ],
+        }
+    )
+    output = arc_translations.get_branches(df_current_datadicc)
+    # An unchecked option is the variable not being equal to the option
+    assert output.to_list() == [
+        "",
+        "(Reason why the patient was tested = Other)  ",
+        "(Reason why the patient was tested <> Other)  ",
+    ]
+
+
+def test_get_branches_no_skip_logic():
+    df_current_datadicc = pd.DataFrame({"Variable": ["subjid"], "Question": ["PIN"]})
+    assert arc_translations.get_branches(df_current_datadicc).to_list() == [""]
+
+
 def test_get_translations():
     english_dict = arc_translations.get_translations("English")
     spanish_dict = arc_translations.get_translations("Spanish")
@@ -7,6 +7,11 @@ from pandas.testing import assert_frame_equal
 from bridge.arc import arc_tree
 
 
+@pytest.fixture(autouse=True)
+def clear_tree_items_cache():
+    arc_tree._TREE_ITEMS_CACHE.clear()
+
+
 @pytest.fixture
 def df_tree_units():
     data_tree = {
@@ -825,3 +830,61 @@ def test_create_tree_item_dataframe_dynamic_true():
         df_datadicc, dynamic_units_conversion
     )
     assert_frame_equal(df_output, df_expected)
+
+
+def test_get_tree_items_cached():
+    data = {
+        "Form": ["presentation", "presentation"],
+        "Sec_name": ["DEMOGRAPHICS", "DEMOGRAPHICS"],
+        "vari": ["sex", "age"],
+        "mod": [None, None],
+        "Question": ["Sex", "Age"],
+        "Variable": ["demog_sex", "demog_age"],
+        "Type": ["radio", "number"],
+        "preset_ARChetype Disease CRF_Covid": [1, None],
+    }
+    df_datadicc = pd.DataFrame.from_dict(data)
+
+    with mock.patch(
+        "bridge.arc.arc_tree._create_tree_item_dataframe",
+        wraps=arc_tree._create_tree_item_dataframe,
+    ) as mock_df_tree:
+        output = arc_tree.get_tree_items(df_datadicc, "v1.1.1", True)
+
+        # Columns the tree isn't built from don't change the tree
+        df_datadicc["preset_ARChetype Disease CRF_Covid"] = [None, 1]
+        df_datadicc["Answer Options"] = "1, Yes | 0, No"
+        assert arc_tree.get_tree_items(df_datadicc, "v1.1.1", True) is output
+        assert mock_df_tree.call_count == 1
+
+        df_datadicc.loc[1, "Question"] = "Age (years)"
+        output_changed = arc_tree.get_tree_items(df_datadicc, "v1.1.1", True)
+        assert mock_df_tree.call_count == 2
+
+    section_node = output["children"][0]["children"][0]
+    assert [child["title"] for child in section_node["children"]] == ["Sex", "Age"]
+    section_node = output_changed["children"][0]["children"][0]
+    assert [child["title"] for child in section_node["children"]] == [
+        "Sex",
+        "Age (years)",
+    ]
+
+
+def test_set_tree_items():
+    data = {
+        "Form": ["presentation"],
+        "Sec_name": ["DEMOGRAPHICS"],
+        "vari": ["sex"],
+        "mod": [None],
+        "Question": ["Sex"],
+        "Variable": ["demog_sex"],
+        "Type": ["radio"],
+    }
+    df_datadicc = pd.DataFrame.from_dict(data)
+    tree = {"title": "v1.1.1", "key": "ARC", "children": []}
+
+    arc_tree.set_tree_items(df_datadicc, "v1.1.1", True, tree)
+
+    with mock.patch("bridge.arc.arc_tree._build_tree_items") as mock_build:
+        assert arc_tree.get_tree_items(df_datadicc, "v1.1.1", True) is tree
+        mock_build.assert_not_called()
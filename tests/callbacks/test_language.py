@@ -1,9 +1,14 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
 from unittest import mock
 
 import pandas as pd
+import pytest
 from pandas.testing import assert_frame_equal
 
+from bridge.arc.arc_api import ArcApiClientError
+from bridge.arc.arc_rate_limit import background_requests, is_background_request
 from bridge.callbacks.language import Language
 from bridge.callbacks import language as callback_language
 
@@ -28,11 +33,10 @@ def test_get_dataframe_arc_language(mock_translation):
 
 
 @mock.patch("bridge.callbacks.language.dbc.AccordionItem")
-@mock.patch("bridge.callbacks.language.ArcList.get_multi_list_content")
-@mock.patch("bridge.callbacks.language.ArcList.get_user_list_content")
 @mock.patch("bridge.callbacks.language.arc_core.get_variable_order")
 @mock.patch("bridge.callbacks.language.arc_core.add_transformed_rows")
-@mock.patch("bridge.callbacks.language.ArcList.get_list_content")
+@mock.patch("bridge.callbacks.language.ArcList.get_all_list_content")
+@mock.patch("bridge.callbacks.language.ArcList.prefetch_list_options")
 @mock.patch("bridge.callbacks.language.Language.get_dataframe_arc_language")
 @mock.patch("bridge.callbacks.language.arc_core.add_required_datadicc_columns")
 @mock.patch("bridge.callbacks.language.arc_core.get_arc")
@@ -40,11 +44,10 @@ def test_get_version_language_related_data(
     mock_get_arc,
     mock_add_required_data,
     mock_get_dataframe_arc_language,
-    mock_get_list_content,
+    mock_prefetch_list_options,
+    mock_get_all_list_content,
     mock_add_transformed_rows,
     mock_get_variable_order,
-    mock_get_user_list_content,
-    mock_get_multi_list_content,
     mock_accordian,
 ):
     version = "v1.0.0"
@@ -89,20 +92,14 @@ def test_get_version_language_related_data(
     mock_get_arc.return_value = (df_version, presets, commit)
     mock_add_required_data.return_value = df_version
     mock_get_dataframe_arc_language.return_value = df_version
-    mock_get_list_content.return_value = (
+    mock_get_all_list_content.return_value = (
         df_list,
         list_variable_choices,
-    )
-    mock_add_transformed_rows.return_value = df_version
-    mock_get_variable_order.return_value = variable_order
-    mock_get_user_list_content.return_value = (
-        df_list,
         ulist_variable_choices,
-    )
-    mock_get_multi_list_content.return_value = (
-        df_list,
         multilist_variable_choices,
     )
+    mock_add_transformed_rows.return_value = df_version
+    mock_get_variable_order.return_value = variable_order
     mock_accordian.return_value = accordian
 
     expected_presets = {
@@ -127,6 +124,10 @@ def test_get_version_language_related_data(
     assert output_accordian == expected_accordian
     assert output_ulist == json.dumps(ulist_variable_choices)
     assert output_multilist == json.dumps(multilist_variable_choices)
+    mock_prefetch_list_options.assert_called_once_with(df_version)
+    mock_add_transformed_rows.assert_called_once_with(
+        df_version, df_list, variable_order
+    )
 
 
 def test_get_version_language_related_data_with_cache():
@@ -172,3 +173,182 @@ def test_get_version_language_related_data_with_cache():
     assert output_accordian == cached_accordion_items
     assert output_ulist == cached_ulist_json
     assert output_multilist == cached_multilist_json
+    # The cached presets can't be modified through the returned presets
+    output_presets["section_1"].append("New preset")
+    assert cached_grouped_presets == {"section_1": ["A preset", "Another preset"]}
+    assert output_accordian is not cached_accordion_items
+
+
+@mock.patch("bridge.callbacks.language.Language.build_accordion_items")
+@mock.patch(
+    "bridge.callbacks.language.Language.build_version_language_data", autospec=True
+)
+@mock.patch("bridge.callbacks.language.Language.get_snapshot")
+def test_get_version_language_related_data_concurrent(
+    mock_get_snapshot, mock_build, mock_build_accordion_items
+):
+    started = Event()
+    release = Event()
+
+    def build_version_language_data(language):
+        language.grouped_presets = {}
+        started.set()
+        release.wait(5)
+        return pd.DataFrame({"Variable": ["subjid"]}), "abc123", "[]", "[]"
+
+    mock_get_snapshot.return_value = None
+    mock_build.side_effect = build_version_language_data
+    mock_build_accordion_items.return_value = []
+
+    with (
+        mock.patch.object(callback_language, "_VERSION_LANGUAGE_CACHE", {}),
+        ThreadPoolExecutor(max_workers=3) as executor,
+    ):
+        futures = [
+            executor.submit(
+                Language("v1.2.1", "French").get_version_language_related_data
+            )
+        ]
+        started.wait(5)
+        futures += [
+            executor.submit(
+                Language("v1.2.1", "French").get_version_language_related_data
+            )
+            for _ in range(2)
+        ]
+        release.set()
+        outputs = [future.result() for future in futures]
+
+    mock_build.assert_called_once()
+    assert [output[1] for output in outputs] == ["abc123"] * 3
+    # Each caller gets its own dataframe
+    assert outputs[0][0] is not outputs[1][0]
+
+
+@mock.patch("bridge.callbacks.language.Language.build_accordion_items")
+@mock.patch(
+    "bridge.callbacks.language.Language.build_version_language_data", autospec=True
+)
+@mock.patch("bridge.callbacks.language.Language.get_snapshot")
+def test_get_version_language_related_data_deferred_background_build(
+    mock_get_snapshot, mock_build, mock_build_accordion_items
+):
+    started = Event()
+    release = Event()
+
+    def build_version_language_data(language):
+        if is_background_request():
+            started.set()
+            release.wait(5)
+            raise ArcApiClientError("Deferred request")
+        language.grouped_presets = {}
+        return pd.DataFrame({"Variable": ["subjid"]}), "abc123", "[]", "[]"
+
+    def get_background_version_language_related_data():
+        with background_requests():
+            return Language("v1.2.1", "French").get_version_language_related_data()
+
+    mock_get_snapshot.return_value = None
+    mock_build.side_effect = build_version_language_data
+    mock_build_accordion_items.return_value = []
+
+    with (
+        mock.patch.object(callback_language, "_VERSION_LANGUAGE_CACHE", {}),
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        background_future = executor.submit(
+            get_background_version_language_related_data
+        )
+        started.wait(5)
+        # A user-facing request doesn't wait for, and fail with, the
+        # deferred background build
+        user_future = executor.submit(
+            Language("v1.2.1", "French").get_version_language_related_data
+        )
+        assert user_future.result(5)[1] == "abc123"
+        release.set()
+        with pytest.raises(ArcApiClientError):
+            background_future.result(5)
+
+
+@mock.patch("bridge.callbacks.language.arc_tree.set_tree_items")
+@mock.patch("bridge.callbacks.language.dbc.AccordionItem")
+@mock.patch("bridge.callbacks.language.Language.build_version_language_data")
+@mock.patch("bridge.callbacks.language.Language.get_snapshot")
+def test_get_version_language_related_data_from_snapshot(
+    mock_get_snapshot, mock_build, mock_accordian, mock_set_tree_items
+):
+    df_snapshot = pd.DataFrame.from_dict({"Form": ["presentation"]})
+    tree_items = {"title": "v1.2.1", "key": "ARC", "children": []}
+    mock_get_snapshot.return_value = {
+        "datadicc": df_snapshot,
+        "commit": "abc124",
+        "grouped_presets": {"section_1": ["A preset"]},
+        "ulist_variable_choices": "my ulist",
+        "multilist_variable_choices": "my multilist",
+        "tree_items": tree_items,
+    }
+    mock_accordian.return_value = "accordion"
+
+    with mock.patch.object(callback_language, "_VERSION_LANGUAGE_CACHE", {}):
+        (
+            df_output,
+            output_commit,
+            output_presets,
+            output_accordian,
+            output_ulist,
+            output_multilist,
+        ) = Language("v1.2.1", "French").get_version_language_related_data()
+
+    assert_frame_equal(df_output, df_snapshot)
+    assert output_commit == "abc124"
+    assert output_presets == {"section_1": ["A preset"]}
+    assert output_accordian == ["accordion"]
+    assert output_ulist == "my ulist"
+    assert output_multilist == "my multilist"
+    mock_build.assert_not_called()
+    mock_set_tree_items.assert_called_once_with(
+        df_snapshot, "v1.2.1", False, tree_items
+    )
+
+
+@mock.patch("bridge.callbacks.language.Language.get_snapshot")
+def test_get_version_language_related_data_initial_load_no_snapshot(
+    mock_get_snapshot,
+):
+    language = Language("v1.2.1", "French", initial_load=True)
+    with (
+        mock.patch.object(callback_language, "_VERSION_LANGUAGE_CACHE", {}),
+        mock.patch.object(
+            Language, "build_version_language_data", side_effect=RuntimeError
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        language.get_version_language_related_data()
+    mock_get_snapshot.assert_not_called()
+
+
+@mock.patch("bridge.callbacks.language.arc_tree.get_tree_items")
+@mock.patch("bridge.callbacks.language.Language.build_version_language_data")
+def test_write_snapshot(mock_build, mock_get_tree_items):
+    df_version = pd.DataFrame.from_dict({"Form": ["presentation"]})
+    tree_items = {"title": "v1.2.1", "key": "ARC", "children": []}
+    mock_build.return_value = (df_version, "abc124", "my ulist", "my multilist")
+    mock_get_tree_items.return_value = tree_items
+    mock_snapshot_store = mock.Mock()
+
+    language = Language("v1.2.1", "French")
+    language.grouped_presets = {"section_1": ["A preset"]}
+    language.write_snapshot(mock_snapshot_store)
+
+    mock_get_tree_items.assert_called_once_with(df_version, "v1.2.1", False)
+    mock_snapshot_store.set.assert_called_once_with(
+        "v1.2.1",
+        "French",
+        df_version,
+        "abc124",
+        {"section_1": ["A preset"]},
+        "my ulist",
+        "my multilist",
+        tree_items,
+    )
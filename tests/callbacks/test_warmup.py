@@ -0,0 +1,99 @@
+from threading import Event
+from unittest import mock
+
+from bridge.arc.arc_api import ArcApiClientError
+from bridge.arc.arc_rate_limit import is_background_request
+from bridge.callbacks.warmup import ArcWarmup, get_warmup_plan
+
+
+def test_get_warmup_plan():
+    version_language_lists = {
+        "v1.1.0": ["English", "French"],
+        "v1.10.0": ["Spanish", "Arabic", "English", "Portuguese"],
+        "v1.2.0": ["English"],
+    }
+    plan = get_warmup_plan(version_language_lists, ["English", "Portuguese"])
+    assert plan == [
+        ("v1.10.0", "English"),
+        ("v1.10.0", "Portuguese"),
+        ("v1.10.0", "Arabic"),
+        ("v1.10.0", "Spanish"),
+        ("v1.2.0", "English"),
+        ("v1.1.0", "English"),
+        ("v1.1.0", "French"),
+    ]
+
+
+@mock.patch("bridge.callbacks.warmup.logger")
+@mock.patch("bridge.callbacks.warmup.ArcWarmup.warm_up")
+@mock.patch("bridge.callbacks.warmup.ArcWarmup.get_plan")
+def test_run(mock_get_plan, mock_warm_up, _mock_logger):
+    mock_get_plan.return_value = [
+        ("v1.2.0", "English"),
+        ("v1.2.0", "French"),
+        ("v1.1.0", "English"),
+    ]
+    mock_warm_up.side_effect = [None, ArcApiClientError("Not found"), None]
+
+    warmup = ArcWarmup(max_workers=1)
+    warmup.run()
+
+    progress = warmup.get_progress()
+    assert progress["status"] == "complete"
+    assert progress["total"] == 3
+    assert progress["completed"] == 2
+    assert progress["failed"] == 1
+    assert mock_warm_up.call_args_list == [
+        mock.call("v1.2.0", "English"),
+        mock.call("v1.2.0", "French"),
+        mock.call("v1.1.0", "English"),
+    ]
+
+
+@mock.patch("bridge.callbacks.warmup.logger")
+@mock.patch("bridge.callbacks.warmup.ArcWarmup.get_plan")
+def test_run_no_plan(mock_get_plan, _mock_logger):
+    mock_get_plan.side_effect = ArcApiClientError("Failed to fetch data")
+    warmup = ArcWarmup(max_workers=1)
+    warmup.run()
+    assert warmup.get_progress()["status"] == "failed"
+
+
+@mock.patch("bridge.callbacks.warmup.ArcWarmup.warm_up")
+@mock.patch("bridge.callbacks.warmup.ArcWarmup.get_plan")
+def test_run_waits_for_ready(mock_get_plan, mock_warm_up):
+    mock_get_plan.return_value = [("v1.2.0", "English")]
+    ready = Event()
+    warmup = ArcWarmup(max_workers=1, ready=ready)
+    warmup.start()
+
+    # The plan isn't built until the initial ARC data is ready
+    warmup._thread.join(0.05)
+    assert warmup._thread.is_alive()
+    mock_get_plan.assert_not_called()
+
+    ready.set()
+    warmup._thread.join(5)
+    assert warmup.get_progress()["status"] == "complete"
+    mock_warm_up.assert_called_once_with("v1.2.0", "English")
+
+
+@mock.patch("bridge.callbacks.warmup.ArcWarmup.run")
+def test_start_once(mock_run):
+    warmup = ArcWarmup(max_workers=1)
+    warmup.start()
+    warmup.start()
+    warmup._thread.join()
+    mock_run.assert_called_once()
+
+
+@mock.patch("bridge.callbacks.warmup.Language")
+def test_warm_up(mock_language):
+    background_request_flags = []
+    mock_language.return_value.get_version_language_related_data.side_effect = (
+        lambda: background_request_flags.append(is_background_request())
+    )
+    ArcWarmup.warm_up("v1.2.0", "French")
+    mock_language.assert_called_once_with("v1.2.0", "French")
+    # The warm-up requests are deferred if the GitHub rate limit is low
+    assert background_request_flags == [True]
@@ -0,0 +1,88 @@
+from bridge.arc import arc_translations
+from bridge.generate_pdf.form import Form
+from bridge.generate_pdf.form_classes import Section
+from bridge.utils.skip_logic import (
+    SkipLogicCondition,
+    parse_skip_logic,
+)
+
+SKIP_LOGIC = "[inclu_testreason(88)]='1' and [demog_age] >= 18.5 OR ([demog_sex]<>'2')"
+
+
+def test_parse_skip_logic():
+    skip_logic = parse_skip_logic(SKIP_LOGIC)
+    assert skip_logic.conditions == (
+        SkipLogicCondition("inclu_testreason", "88", "=", "1"),
+        SkipLogicCondition("demog_age", None, ">=", 18.5),
+        SkipLogicCondition("demog_sex", None, "<>", "2"),
+    )
+    assert skip_logic.comparisons == (
+        SkipLogicCondition("inclu_testreason", None, "=", "88"),
+        SkipLogicCondition("demog_age", None, ">=", 18.5),
+        SkipLogicCondition("demog_sex", None, "<>", "2"),
+    )
+    assert skip_logic.logical_operators == ("and", "or")
+    assert skip_logic.references == (
+        "inclu_testreason(88)",
+        "demog_age",
+        "demog_sex",
+    )
+    assert skip_logic.variables == ("inclu_testreason", "demog_age", "demog_sex")
+
+
+def test_parse_skip_logic_values():
+    skip_logic = parse_skip_logic(
+        "[a]=88 and [b]=\"and or\" or [c] = -1.0 and [d]=yes and [e(2)]='0'"
+    )
+    assert [comparison.value for comparison in skip_logic.comparisons] == [
+        88,
+        "and or",
+        -1.0,
+        "yes",
+        "2",
+    ]
+    assert skip_logic.comparisons[-1].operator == "<>"
+    assert skip_logic.logical_operators == ("and", "or", "and", "and")
+
+
+def test_parse_skip_logic_reference_without_value():
+    skip_logic = parse_skip_logic("[demog_age] and [demog_sex]='1'")
+    assert skip_logic.conditions == (
+        SkipLogicCondition("demog_age", None, None, None),
+        SkipLogicCondition("demog_sex", None, "=", "1"),
+    )
+    assert skip_logic.comparisons == (SkipLogicCondition("demog_sex", None, "=", "1"),)
+    assert skip_logic.logical_operators == ()
+    assert skip_logic.variables == ("demog_age", "demog_sex")
+
+
+def test_parse_skip_logic_empty():
+    skip_logic = parse_skip_logic("")
+    assert skip_logic.conditions == ()
+    assert skip_logic.comparisons == ()
+    assert skip_logic.references == ()
+    assert skip_logic.variables == ()
+
+
+def test_parse_skip_logic_memoized():
+    parse_skip_logic.cache_clear()
+    first = parse_skip_logic("[demog_sex]='1'")
+    second = parse_skip_logic("[demog_sex]='1'")
+    assert first is second
+    assert parse_skip_logic.cache_info().hits == 1
+
+
+def test_parse_skip_logic_consumers_agree():
+    variables, values, operators, logical_operators = (
+        arc_translations._extract_logic_components(SKIP_LOGIC)
+    )
+    dependencies = Form._parse_branching_logic(SKIP_LOGIC)
+
+    assert variables == ["inclu_testreason", "demog_age", "demog_sex"]
+    assert values == ["88", 18.5, "2"]
+    assert operators == ["=", ">=", "<>"]
+    assert logical_operators == ["and", "or"]
+    assert [dependency.field_name for dependency in dependencies] == variables
+    assert [dependency.value for dependency in dependencies] == ["88", "18.5", "2"]
+    assert [dependency.operator for dependency in dependencies] == operators
+    assert Section._extract_dependencies(SKIP_LOGIC) == set(variables)